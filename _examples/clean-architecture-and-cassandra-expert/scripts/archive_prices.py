@@ -0,0 +1,53 @@
+"""Archive ticker_prices rows before they expire.
+
+Copies every ticker day holding a row whose TTL runs out within --ahead-days
+to Parquet (``<out>/ticker=<T>/date=<D>/archive-<today>.parquet``, only rows
+not archived before) and recomputes that day's rollups first. Rows are
+picked by their remaining TTL, so history imported late is caught too.
+Schedule it daily; missing fewer than --ahead-days runs in a row loses nothing.
+
+Requires the ``pipelines`` extra: ``uv sync --extra pipelines``.
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.infrastructure.cassandra.repositories.cassandra_candle_repository import (
+    CassandraCandleRepository,
+)
+from src.infrastructure.cassandra.repositories.cassandra_ticker_price_repository import (
+    CassandraTickerPriceRepository,
+)
+from src.infrastructure.cassandra.session import create_session
+from src.infrastructure.pipelines.price_archive import archive_expiring
+
+CONTACT_POINTS = os.getenv("CASSANDRA_CONTACT_POINTS", "127.0.0.1").split(",")
+KEYSPACE = os.getenv("CASSANDRA_KEYSPACE", "ticker_data")
+
+
+def run_archive(args: argparse.Namespace) -> None:
+    session = create_session(CONTACT_POINTS, KEYSPACE)
+    print(f"Archiving rows expiring within {args.ahead_days} day(s)")
+    copied = archive_expiring(
+        CassandraTickerPriceRepository(session),
+        CassandraCandleRepository(session),
+        args.out,
+        ahead_days=args.ahead_days,
+    )
+    session.cluster.shutdown()
+    print(f"Done: {copied:,} rows archived")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("out", type=Path, help="archive directory")
+    parser.add_argument("--ahead-days", type=int, default=7, help="safety margin before expiry")
+    try:
+        run_archive(parser.parse_args())
+    except Exception as exc:
+        print(f"Archive failed: {exc}", file=sys.stderr)
+        sys.exit(1)
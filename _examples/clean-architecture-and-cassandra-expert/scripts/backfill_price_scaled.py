@@ -0,0 +1,99 @@
+"""Scaled-price backfill.
+
+Fills ticker_prices.price_scaled for rows written before dual-writes began,
+scanning the token ring in parallel ranges. Safe to re-run: each row is
+simply rewritten with the same value. Each new cell gets a TTL counted
+from its row's ts, so it expires with the row and not a year after the
+backfill. Rows too precise for their currency's scale cannot be scaled:
+raise that currency's scale in price_scales and re-run. Once a run reports
+no failed ranges and no unscaled rows, TICKER_PRICE_READ_MODE=scaled can be
+switched on.
+"""
+
+import argparse
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.config import Settings
+from src.infrastructure.cassandra.repositories.cassandra_ticker_price_repository import (
+    CassandraTickerPriceRepository,
+    table_default_ttl,
+)
+from src.infrastructure.cassandra.session import create_session
+from src.infrastructure.cassandra.token_ranges import TokenRange, split_token_ring
+
+CONTACT_POINTS = os.getenv("CASSANDRA_CONTACT_POINTS", "127.0.0.1").split(",")
+KEYSPACE = os.getenv("CASSANDRA_KEYSPACE", "ticker_data")
+
+
+def backfill_range(
+    repo: CassandraTickerPriceRepository, token_range: TokenRange, page_size: int, retries: int
+) -> tuple[int, int]:
+    """Returns (rows seen, rows scaled); unscalable rows keep a null price_scaled."""
+    attempt = 0
+    while True:
+        seen = scaled = 0
+        try:
+            for page in repo.scan_token_range(token_range.start, token_range.end, page_size):
+                seen += len(page)
+                scaled += repo.backfill_price_scaled(page)
+            return seen, scaled
+        except Exception:
+            attempt += 1
+            if attempt > retries:
+                raise
+
+
+def run_backfill(args: argparse.Namespace) -> None:
+    session = create_session(CONTACT_POINTS, KEYSPACE)
+    repo = CassandraTickerPriceRepository(
+        session,
+        source_ttls={
+            source: days * 86400 for source, days in Settings().retention_source_ttl_days.items()
+        },
+        default_ttl=table_default_ttl(session),
+        ttl_from_ts=True,
+    )
+    ranges = split_token_ring(args.splits)
+    seen = scaled = 0
+    failed: list[TokenRange] = []
+    with ThreadPoolExecutor(args.workers) as pool:
+        futures = {
+            pool.submit(backfill_range, repo, r, args.page_size, args.retries): r for r in ranges
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            try:
+                range_seen, range_scaled = future.result()
+            except Exception as exc:
+                print(f"  range {futures[future].index} failed: {exc}", file=sys.stderr)
+                failed.append(futures[future])
+                continue
+            seen += range_seen
+            scaled += range_scaled
+            print(f"  {done}/{len(ranges)} ranges, {seen:,} rows, {scaled:,} scaled")
+    session.cluster.shutdown()
+    print(f"Done: {scaled:,} of {seen:,} rows have price_scaled")
+    if failed:
+        raise RuntimeError(f"{len(failed)} token range(s) failed; re-run to retry them")
+    if scaled < seen:
+        raise RuntimeError(
+            f"{seen - scaled:,} rows do not fit their currency's scale; raise it in "
+            "price_scales and re-run before switching to scaled reads"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=8, help="token ranges in flight")
+    parser.add_argument("--splits", type=int, default=256, help="token ranges to scan")
+    parser.add_argument("--page-size", type=int, default=5000, help="rows per Cassandra page")
+    parser.add_argument("--retries", type=int, default=3, help="retries per failed range")
+    try:
+        run_backfill(parser.parse_args())
+    except Exception as exc:
+        print(f"Backfill failed: {exc}", file=sys.stderr)
+        sys.exit(1)
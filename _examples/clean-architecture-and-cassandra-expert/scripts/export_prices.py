@@ -0,0 +1,57 @@
+"""Full ticker_prices export to Parquet.
+
+Splits the Cassandra token ring into ranges and scans them in parallel
+worker processes, writing Hive-partitioned files
+(``<out>/ticker=<T>/date=<YYYY-MM-DD>/part-*.parquet``) that pandas,
+DuckDB or Spark can read directly. Failed ranges are retried; any that
+still fail are listed so the export can be re-run for just those ranges.
+
+Requires the ``pipelines`` extra: ``uv sync --extra pipelines``.
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.infrastructure.pipelines.price_export import export_all
+
+CONTACT_POINTS = os.getenv("CASSANDRA_CONTACT_POINTS", "127.0.0.1").split(",")
+KEYSPACE = os.getenv("CASSANDRA_KEYSPACE", "ticker_data")
+
+
+def run_export(args: argparse.Namespace) -> None:
+    print(f"Exporting ticker_prices to {args.out} ({args.splits} token ranges)")
+    written, failed = export_all(
+        args.out,
+        contact_points=CONTACT_POINTS,
+        keyspace=KEYSPACE,
+        workers=args.workers,
+        splits=args.splits,
+        page_size=args.page_size,
+        max_buffer_rows=args.max_buffer_rows,
+        retries=args.retries,
+    )
+    print(f"Done: {written:,} rows written")
+    if failed:
+        ranges = ", ".join(f"#{r.index} ({r.start}, {r.end}]" for r in failed)
+        raise RuntimeError(f"{len(failed)} token range(s) failed: {ranges}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("out", type=Path, help="output directory")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4)
+    parser.add_argument("--splits", type=int, default=256, help="token ranges to scan")
+    parser.add_argument("--page-size", type=int, default=5000, help="rows per Cassandra page")
+    parser.add_argument(
+        "--max-buffer-rows", type=int, default=100_000, help="rows buffered before a flush"
+    )
+    parser.add_argument("--retries", type=int, default=3, help="retries per failed range")
+    try:
+        run_export(parser.parse_args())
+    except Exception as exc:
+        print(f"Export failed: {exc}", file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,65 @@
+"""Historical price importer.
+
+Streams vendor CSV or Parquet files (columns: ticker, timestamp, price and
+optionally currency, source) into ticker_prices with a pool of writer
+processes. Progress is checkpointed next to each file, so re-running the
+same command after an interruption resumes instead of starting over. The
+rollups of every day a file wrote to are rebuilt once it is in, so pause
+live inserts for those tickers while importing.
+
+Requires the ``pipelines`` extra: ``uv sync --extra pipelines``.
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.config import Settings
+from src.infrastructure.pipelines.price_import import Checkpoint, import_file, rebuild_rollups
+
+CONTACT_POINTS = os.getenv("CASSANDRA_CONTACT_POINTS", "127.0.0.1").split(",")
+KEYSPACE = os.getenv("CASSANDRA_KEYSPACE", "ticker_data")
+
+
+def run_import(args: argparse.Namespace) -> None:
+    source_ttls = {
+        source: days * 86400 for source, days in Settings().retention_source_ttl_days.items()
+    }
+    for path in args.files:
+        checkpoint = Checkpoint.load(path.with_name(path.name + ".checkpoint.json"), path)
+        resume = f" (resuming after {checkpoint.rows_done:,} rows)" if checkpoint.rows_done else ""
+        print(f"Importing {path.name}{resume}")
+        written = import_file(
+            path,
+            checkpoint,
+            contact_points=CONTACT_POINTS,
+            keyspace=KEYSPACE,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            concurrency=args.concurrency,
+            default_source=args.source,
+            source_ttls=source_ttls,
+        )
+        print(
+            f"Done: {written:,} rows written from {path.name}, "
+            f"{checkpoint.rows_rejected:,} invalid row(s) skipped in total"
+        )
+        print(f"Rebuilding rollups for {len(checkpoint.spans)} ticker(s)")
+        rebuild_rollups(checkpoint.spans, contact_points=CONTACT_POINTS, keyspace=KEYSPACE)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="+", type=Path, help="CSV or Parquet files")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4)
+    parser.add_argument("--chunk-size", type=int, default=10_000, help="rows per work unit")
+    parser.add_argument("--concurrency", type=int, default=64, help="in-flight writes per worker")
+    parser.add_argument("--source", default="import", help="source value when the file has none")
+    try:
+        run_import(parser.parse_args())
+    except Exception as exc:
+        print(f"Import failed: {exc}", file=sys.stderr)
+        sys.exit(1)
@@ -67,10 +67,11 @@ def _get_applied(session) -> set[str]:
 
 
 def _split_statements(cql_text: str) -> list[str]:
+    lines = [line for line in cql_text.splitlines() if not line.strip().startswith("--")]
     statements = []
-    for raw in cql_text.split(";"):
+    for raw in "\n".join(lines).split(";"):
         stripped = raw.strip()
-        if stripped and not stripped.startswith("--"):
+        if stripped:
             statements.append(stripped)
     return statements
 
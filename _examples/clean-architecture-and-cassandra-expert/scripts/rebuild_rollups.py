@@ -0,0 +1,48 @@
+"""Rollup rebuild command.
+
+Regenerates the ticker_prices_1m/1h/1d rollup tables from raw ticker_prices
+rows. Pass ticker symbols to rebuild only those; with no arguments every
+ticker partition is rebuilt, one day at a time. Do not run it while the
+API is flushing rollups for the same tickers.
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.application.use_cases.rebuild_rollups import RebuildRollups
+from src.infrastructure.cassandra.repositories.cassandra_candle_repository import (
+    CassandraCandleRepository,
+)
+from src.infrastructure.cassandra.repositories.cassandra_ticker_price_repository import (
+    CassandraTickerPriceRepository,
+)
+from src.infrastructure.cassandra.session import create_session
+
+CONTACT_POINTS = os.getenv("CASSANDRA_CONTACT_POINTS", "127.0.0.1").split(",")
+KEYSPACE = os.getenv("CASSANDRA_KEYSPACE", "ticker_data")
+
+
+def rebuild(tickers: list[str]) -> None:
+    session = create_session(CONTACT_POINTS, KEYSPACE)
+    prices = CassandraTickerPriceRepository(session)
+    use_case = RebuildRollups(prices, CassandraCandleRepository(session))
+
+    for ticker in tickers or prices.list_tickers():
+        print(f"Rebuilding {ticker.upper()} ... ", end="", flush=True)
+        print(f"{use_case.execute(ticker.upper())} tick(s)")
+
+    session.cluster.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("tickers", nargs="*", help="ticker symbols (default: all)")
+    try:
+        rebuild(parser.parse_args().tickers)
+    except Exception as exc:
+        print(f"Rollup rebuild failed: {exc}", file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,47 @@
+"""Latest-price snapshot rebuild.
+
+Fills latest_prices from the newest ticker_prices row of every ticker (or
+only the given ones). Needed once for data written before the snapshot
+existed; safe to re-run, since a stored newer price always wins.
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.infrastructure.cassandra.repositories.cassandra_latest_price_repository import (
+    CassandraLatestPriceRepository,
+)
+from src.infrastructure.cassandra.repositories.cassandra_ticker_price_repository import (
+    CassandraTickerPriceRepository,
+)
+from src.infrastructure.cassandra.session import create_session
+
+CONTACT_POINTS = os.getenv("CASSANDRA_CONTACT_POINTS", "127.0.0.1").split(",")
+KEYSPACE = os.getenv("CASSANDRA_KEYSPACE", "ticker_data")
+
+
+def rebuild(tickers: list[str]) -> None:
+    session = create_session(CONTACT_POINTS, KEYSPACE)
+    prices = CassandraTickerPriceRepository(session)
+    snapshot = CassandraLatestPriceRepository(session)
+
+    latest = [prices.get_latest(t.upper()) for t in tickers or prices.list_tickers()]
+    found = [p for p in latest if p is not None]
+    snapshot.upsert_many(found)
+    print(f"Snapshot updated for {len(found)} ticker(s)")
+
+    session.cluster.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("tickers", nargs="*", help="ticker symbols (default: all)")
+    try:
+        rebuild(parser.parse_args().tickers)
+    except Exception as exc:
+        print(f"Snapshot rebuild failed: {exc}", file=sys.stderr)
+        sys.exit(1)
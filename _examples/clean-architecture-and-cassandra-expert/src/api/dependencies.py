@@ -1,13 +1,54 @@
+from datetime import timedelta
 from functools import lru_cache
+from pathlib import Path
 
 from cassandra.cluster import Session
 
+from src.application.services.as_of_memo import AsOfMemo
+from src.application.services.indicators import IndicatorEngine
+from src.application.services.latest_price_cache import LatestPriceCache
+from src.application.services.price_hub import PriceHub
+from src.application.services.rollup_aggregator import RollupAggregator
+from src.application.use_cases.get_candles import GetCandles
+from src.application.use_cases.get_latest_price import GetLatestPrice
+from src.application.use_cases.get_market_snapshot import GetMarketSnapshot
+from src.application.use_cases.get_price_matrix import GetPriceMatrix
+from src.application.use_cases.get_prices_as_of import GetPricesAsOf
 from src.application.use_cases.get_ticker_prices import GetTickerPrices
+from src.application.use_cases.get_ticker_prices_batch import GetTickerPricesBatch
 from src.application.use_cases.insert_ticker_price import InsertTickerPrice
+from src.config import Settings
+from src.domain.entities.price_columns import PriceScales
+from src.domain.repositories.ticker_price_repository import TickerPriceRepository
+from src.infrastructure.cassandra.repositories.cassandra_candle_repository import (
+    CassandraCandleRepository,
+)
+from src.infrastructure.cassandra.repositories.cassandra_latest_price_repository import (
+    CassandraLatestPriceRepository,
+)
 from src.infrastructure.cassandra.repositories.cassandra_ticker_price_repository import (
     CassandraTickerPriceRepository,
+    load_price_scales,
 )
 from src.infrastructure.cassandra.session import create_session
+from src.infrastructure.decorators.bloom import BloomFilteredTickerPriceRepository, shard_owner
+from src.infrastructure.decorators.delegating import DelegatingTickerPriceRepository
+from src.infrastructure.decorators.notifying import NotifyingTickerPriceRepository
+from src.infrastructure.decorators.segment_cache import (
+    SegmentCachedTickerPriceRepository,
+    SegmentStore,
+)
+from src.infrastructure.decorators.single_flight import SingleFlightTickerPriceRepository
+from src.infrastructure.decorators.snapshot import SnapshotTickerPriceRepository
+from src.infrastructure.decorators.write_behind import WriteBehindTickerPriceRepository
+from src.infrastructure.metrics import MetricsRegistry
+from src.infrastructure.spool.log import SpoolLog
+from src.infrastructure.spool.spooled_repository import SpooledTickerPriceRepository
+
+
+@lru_cache
+def get_settings() -> Settings:
+    return Settings()
 
 
 @lru_cache
@@ -15,13 +56,203 @@ def get_cassandra_session() -> Session:
     return create_session()
 
 
-def get_ticker_price_repo() -> CassandraTickerPriceRepository:
-    return CassandraTickerPriceRepository(get_cassandra_session())
+@lru_cache
+def get_metrics_registry() -> MetricsRegistry:
+    return MetricsRegistry()
+
+
+@lru_cache
+def get_price_scales() -> PriceScales:
+    return load_price_scales(get_cassandra_session())
+
+
+@lru_cache
+def get_ticker_price_repo() -> TickerPriceRepository:
+    """Cassandra repository wrapped in the in-process decorators enabled by settings.
+
+    The latest-price snapshot is updated right above Cassandra, so only for
+    rows that were actually written; the as-of memo is invalidated at the
+    same level, once a row is readable rather than when it was accepted.
+    Single-flight goes next, so it coalesces actual Cassandra reads
+    (segment-cache tails included) and forgets a ticker's in-flight reads
+    once its rows are written. The segment cache sits below the write
+    buffers (spool or write-behind; the spool wins if both are enabled) so
+    segments are only invalidated once buffered rows have actually reached
+    Cassandra. The Bloom filter goes on top so it records inserts the moment
+    they are accepted.
+    """
+    settings = get_settings()
+    metrics = get_metrics_registry()
+    repo: TickerPriceRepository = CassandraTickerPriceRepository(
+        get_cassandra_session(),
+        read_mode=settings.price_read_mode,
+        scales=get_price_scales(),
+        source_ttls={
+            source: days * 86400 for source, days in settings.retention_source_ttl_days.items()
+        },
+    )
+    repo = SnapshotTickerPriceRepository(repo, get_latest_price_repo())
+    repo = NotifyingTickerPriceRepository(repo, [get_as_of_memo()])
+    if settings.single_flight_enabled:
+        repo = SingleFlightTickerPriceRepository(repo, metrics)
+    if settings.segment_cache_max_bytes > 0:
+        store = SegmentStore(settings.segment_cache_max_bytes)
+        metrics.gauge("ticker_segment_cache_bytes", "Packed segment bytes", lambda: store.bytes)
+        metrics.gauge("ticker_segment_cache_hits", "Segments served", lambda: store.hits)
+        metrics.gauge("ticker_segment_cache_misses", "Segments loaded", lambda: store.misses)
+        repo = SegmentCachedTickerPriceRepository(
+            repo,
+            store,
+            live_window=timedelta(seconds=settings.segment_cache_live_window_seconds),
+        )
+    if settings.spool_enabled:
+        repo = SpooledTickerPriceRepository(
+            repo,
+            SpoolLog(Path(settings.spool_dir), segment_bytes=settings.spool_segment_bytes),
+            metrics,
+            rows_per_second=settings.spool_drain_rows_per_second,
+        )
+        repo.start()
+    elif settings.write_behind_enabled:
+        repo = WriteBehindTickerPriceRepository(
+            repo,
+            metrics,
+            max_queue=settings.write_behind_max_queue,
+            flush_rows=settings.write_behind_flush_rows,
+            flush_interval=settings.write_behind_flush_interval_seconds,
+            put_timeout=settings.write_behind_put_timeout_seconds,
+        )
+        repo.start()
+    if settings.bloom_enabled:
+        if settings.bloom_owner_shard is None:
+            raise RuntimeError(
+                "TICKER_BLOOM_ENABLED needs TICKER_BLOOM_OWNER_SHARD (and _SHARDS) naming "
+                "the tickers this process alone writes"
+            )
+        repo = BloomFilteredTickerPriceRepository(
+            repo,
+            metrics,
+            owns=shard_owner(settings.bloom_owner_shard, settings.bloom_owner_shards),
+            days=settings.bloom_days,
+            fp_rate=settings.bloom_fp_rate,
+        )
+        repo.start()
+    return repo
+
+
+@lru_cache
+def get_latest_price_repo() -> CassandraLatestPriceRepository:
+    return CassandraLatestPriceRepository(get_cassandra_session())
+
+
+def get_candle_repo() -> CassandraCandleRepository:
+    return CassandraCandleRepository(get_cassandra_session())
+
+
+@lru_cache
+def get_rollup_aggregator() -> RollupAggregator:
+    aggregator = RollupAggregator(
+        get_candle_repo(), flush_interval=get_settings().rollup_flush_interval_seconds
+    )
+    aggregator.start()
+    return aggregator
+
+
+@lru_cache
+def get_latest_price_cache() -> LatestPriceCache:
+    return LatestPriceCache(max_age=get_settings().latest_price_max_age_seconds)
+
+
+@lru_cache
+def get_as_of_memo() -> AsOfMemo:
+    return AsOfMemo(max_entries=get_settings().as_of_memo_max_entries)
+
+
+@lru_cache
+def get_indicator_engine() -> IndicatorEngine:
+    engine = IndicatorEngine(window=get_settings().indicator_window_ticks)
+    get_metrics_registry().gauge(
+        "ticker_indicator_tickers", "Tickers with rolling indicator windows",
+        lambda: engine.ticker_count,
+    )
+    engine.start(get_ticker_price_repo())
+    return engine
+
+
+@lru_cache
+def get_price_hub() -> PriceHub:
+    hub = PriceHub(queue_size=get_settings().live_queue_size)
+    metrics = get_metrics_registry()
+    metrics.gauge(
+        "ticker_live_subscribers", "Open live stream subscriptions", lambda: hub.subscriber_count
+    )
+    metrics.gauge("ticker_live_dropped_total", "Slow live subscribers dropped", lambda: hub.dropped)
+    return hub
 
 
 def get_insert_use_case() -> InsertTickerPrice:
-    return InsertTickerPrice(get_ticker_price_repo())
+    return InsertTickerPrice(
+        get_ticker_price_repo(),
+        listeners=[
+            get_rollup_aggregator(),
+            get_latest_price_cache(),
+            get_indicator_engine(),
+            get_price_hub(),
+        ],
+        scales=get_price_scales(),
+    )
 
 
 def get_query_use_case() -> GetTickerPrices:
     return GetTickerPrices(get_ticker_price_repo())
+
+
+def get_batch_query_use_case() -> GetTickerPricesBatch:
+    return GetTickerPricesBatch(
+        get_ticker_price_repo(), max_concurrency=get_settings().batch_max_concurrency
+    )
+
+
+def get_as_of_use_case() -> GetPricesAsOf:
+    settings = get_settings()
+    return GetPricesAsOf(
+        get_ticker_price_repo(),
+        get_as_of_memo(),
+        max_concurrency=settings.batch_max_concurrency,
+        settle_seconds=settings.as_of_settle_seconds,
+    )
+
+
+def get_matrix_use_case() -> GetPriceMatrix:
+    return GetPriceMatrix(
+        get_ticker_price_repo(), max_concurrency=get_settings().batch_max_concurrency
+    )
+
+
+def get_latest_price_use_case() -> GetLatestPrice:
+    return GetLatestPrice(get_ticker_price_repo(), get_latest_price_cache())
+
+
+def get_snapshot_use_case() -> GetMarketSnapshot:
+    return GetMarketSnapshot(get_latest_price_repo())
+
+
+def get_candles_use_case() -> GetCandles:
+    return GetCandles(get_ticker_price_repo(), get_candle_repo(), get_rollup_aggregator())
+
+
+def start_background_services() -> None:
+    """Start work that should not wait for the first request (indicator seeding)."""
+    get_indicator_engine()
+
+
+def shutdown_background_services() -> None:
+    """Drain in-process buffers that were started during the app's lifetime."""
+    if get_ticker_price_repo.cache_info().currsize:
+        repo = get_ticker_price_repo()
+        while isinstance(repo, DelegatingTickerPriceRepository):
+            if isinstance(repo, WriteBehindTickerPriceRepository | SpooledTickerPriceRepository):
+                repo.stop()
+            repo = repo.inner
+    if get_rollup_aggregator.cache_info().currsize:
+        get_rollup_aggregator().stop()
@@ -1,6 +1,17 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
-from src.api.routes import ticker_prices
+from src.api.dependencies import shutdown_background_services, start_background_services
+from src.api.routes import metrics, ticker_prices
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    start_background_services()
+    yield
+    shutdown_background_services()
 
 
 def create_app() -> FastAPI:
@@ -8,8 +19,10 @@ def create_app() -> FastAPI:
         title="Ticker Price API",
         description="Insert and query historical stock ticker prices (Cassandra-backed)",
         version="0.1.0",
+        lifespan=lifespan,
     )
     app.include_router(ticker_prices.router)
+    app.include_router(metrics.router)
     return app
 
 
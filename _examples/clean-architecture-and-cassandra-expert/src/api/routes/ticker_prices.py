@@ -1,22 +1,177 @@
+import base64
+import binascii
+import hashlib
+import io
+from collections.abc import AsyncIterator, Awaitable, Iterator
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+import anyio
+import numpy as np
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect, status
+from fastapi.responses import Response, StreamingResponse
 
-from src.api.dependencies import get_insert_use_case, get_query_use_case
+from src.api.dependencies import (
+    get_as_of_use_case,
+    get_batch_query_use_case,
+    get_candles_use_case,
+    get_indicator_engine,
+    get_insert_use_case,
+    get_latest_price_use_case,
+    get_matrix_use_case,
+    get_price_hub,
+    get_query_use_case,
+    get_settings,
+    get_snapshot_use_case,
+)
 from src.api.schemas.ticker_price import (
+    CandleListResponse,
+    CandleResponse,
+    IndicatorResponse,
+    MarketSnapshotResponse,
+    TickerPriceAsOfQuery,
+    TickerPriceAsOfResponse,
+    TickerPriceBatchQuery,
+    TickerPriceBatchResponse,
     TickerPriceCreate,
     TickerPriceListResponse,
+    TickerPriceMatrixQuery,
+    TickerPriceMatrixResponse,
     TickerPriceResponse,
 )
+from src.application.services.downsampling import TooManyRowsError
+from src.application.services.indicators import IndicatorEngine
+from src.application.services.price_hub import PriceHub, Subscription
+from src.application.services.price_matrix import PriceMatrix
+from src.application.use_cases.get_candles import GetCandles
+from src.application.use_cases.get_latest_price import (
+    GetLatestPrice,
+    TickerPriceNotFoundError,
+)
+from src.application.use_cases.get_market_snapshot import GetMarketSnapshot
+from src.application.use_cases.get_price_matrix import GetPriceMatrix
+from src.application.use_cases.get_prices_as_of import GetPricesAsOf
 from src.application.use_cases.get_ticker_prices import GetTickerPrices
+from src.application.use_cases.get_ticker_prices_batch import GetTickerPricesBatch
 from src.application.use_cases.insert_ticker_price import (
     DuplicateTickerPriceError,
     InsertTickerPrice,
 )
+from src.config import Settings
+from src.domain.entities.candle import as_utc, parse_interval
+from src.domain.entities.price_columns import UnscalablePriceError
 from src.domain.entities.ticker_price import TickerPrice
+from src.domain.repositories.ticker_price_repository import (
+    InvalidPagingStateError,
+    RepositoryBusyError,
+)
 
 router = APIRouter(prefix="/api/v1/ticker-prices", tags=["ticker-prices"])
 
+MAX_BATCH_TICKERS = 500
+MAX_PAGE_SIZE = 10_000
+MAX_CHART_POINTS = 10_000
+_CURSOR_TAG_BYTES = 8
+
+
+def _to_response(price: TickerPrice) -> TickerPriceResponse:
+    return TickerPriceResponse(
+        ticker=price.ticker,
+        price=price.price,
+        timestamp=price.ts,
+        currency=price.currency,
+        source=price.source,
+    )
+
+
+def _to_list_response(ticker: str, prices: list[TickerPrice]) -> TickerPriceListResponse:
+    return TickerPriceListResponse(
+        ticker=ticker,
+        count=len(prices),
+        prices=[_to_response(p) for p in prices],
+    )
+
+
+def _cursor_tag(ticker: str, start: datetime | None, end: datetime | None) -> bytes:
+    """Binds a cursor to the query it continues."""
+    bounds = "|".join("" if ts is None else as_utc(ts).isoformat() for ts in (start, end))
+    query = f"{ticker}|{bounds}".encode()
+    return hashlib.blake2b(query, digest_size=_CURSOR_TAG_BYTES).digest()
+
+
+def _encode_cursor(paging_state: bytes | None, tag: bytes) -> str | None:
+    return base64.urlsafe_b64encode(tag + paging_state).decode() if paging_state else None
+
+
+def _decode_cursor(cursor: str, tag: bytes) -> bytes:
+    """The paging state in ``cursor``; 400 unless it was issued for the same query."""
+    try:
+        raw = base64.b64decode(cursor.encode(), altchars=b"-_", validate=True)
+    except (binascii.Error, ValueError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Malformed cursor"
+        ) from exc
+    if len(raw) <= len(tag) or raw[: len(tag)] != tag:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor does not belong to this ticker and range",
+        )
+    return raw[len(tag) :]
+
+
+def _ndjson(pages: Iterator[list[TickerPrice]]) -> Iterator[str]:
+    for page in pages:
+        if page:
+            yield "".join(_to_response(p).model_dump_json() + "\n" for p in page)
+
+
+async def _sse(subscription: Subscription, heartbeat: float) -> AsyncIterator[str]:
+    try:
+        while True:
+            try:
+                price = await subscription.next(timeout=heartbeat)
+            except TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            if price is None:
+                yield "event: dropped\ndata: subscriber too slow, reconnect\n\n"
+                return
+            yield f"event: price\ndata: {_to_response(price).model_dump_json()}\n\n"
+    finally:
+        subscription.close()
+
+
+def _nan_to_none(matrix: np.ndarray) -> list[list[float | None]]:
+    return [[None if np.isnan(v) else v for v in row] for row in matrix.tolist()]
+
+
+def _matrix_parts(matrix: PriceMatrix, include: list[str]) -> dict[str, np.ndarray]:
+    parts = {}
+    if "prices" in include:
+        parts["prices"] = matrix.prices
+    if "correlation" in include:
+        parts["correlation"] = matrix.correlation()
+    if "covariance" in include:
+        parts["covariance"] = matrix.covariance()
+    return parts
+
+
+def _to_batch_response(
+    use_case: GetTickerPricesBatch,
+    tickers: list[str],
+    start: datetime | None,
+    end: datetime | None,
+) -> TickerPriceBatchResponse:
+    if len(tickers) > MAX_BATCH_TICKERS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_BATCH_TICKERS} tickers per request",
+        )
+    grouped = use_case.execute([t.strip().upper() for t in tickers], start=start, end=end)
+    return TickerPriceBatchResponse(
+        count=len(grouped),
+        results=[_to_list_response(ticker, prices) for ticker, prices in grouped.items()],
+    )
+
 
 @router.post("", status_code=status.HTTP_201_CREATED, response_model=TickerPriceResponse)
 def create_ticker_price(
@@ -34,31 +189,242 @@ def create_ticker_price(
         created = use_case.execute(entity)
     except DuplicateTickerPriceError as exc:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
-    return TickerPriceResponse(
-        ticker=created.ticker,
-        price=created.price,
-        timestamp=created.ts,
-        currency=created.currency,
-        source=created.source,
+    except UnscalablePriceError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    except RepositoryBusyError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(exc),
+            headers={"Retry-After": "1"},
+        ) from exc
+    return _to_response(created)
+
+
+@router.get("", response_model=TickerPriceBatchResponse)
+def get_ticker_prices_batch(
+    tickers: str = Query(..., min_length=1, examples=["AAPL,MSFT,GOOG"]),
+    start: datetime | None = Query(default=None),
+    end: datetime | None = Query(default=None),
+    use_case: GetTickerPricesBatch = Depends(get_batch_query_use_case),
+) -> TickerPriceBatchResponse:
+    symbols = [t for t in tickers.split(",") if t.strip()]
+    return _to_batch_response(use_case, symbols, start, end)
+
+
+@router.post(":batch", response_model=TickerPriceBatchResponse)
+def query_ticker_prices_batch(
+    body: TickerPriceBatchQuery,
+    use_case: GetTickerPricesBatch = Depends(get_batch_query_use_case),
+) -> TickerPriceBatchResponse:
+    return _to_batch_response(use_case, body.tickers, body.start, body.end)
+
+
+@router.post(":asof", response_model=TickerPriceAsOfResponse)
+def query_ticker_prices_as_of(
+    body: TickerPriceAsOfQuery,
+    use_case: GetPricesAsOf = Depends(get_as_of_use_case),
+) -> TickerPriceAsOfResponse:
+    found = use_case.execute([t.strip().upper() for t in body.tickers], body.at)
+    prices = [_to_response(p) for p in found.values() if p is not None]
+    return TickerPriceAsOfResponse(
+        at=body.at,
+        count=len(prices),
+        prices=prices,
+        missing=[ticker for ticker, p in found.items() if p is None],
+    )
+
+
+@router.post(":matrix", response_model=TickerPriceMatrixResponse)
+def query_ticker_price_matrix(
+    body: TickerPriceMatrixQuery,
+    use_case: GetPriceMatrix = Depends(get_matrix_use_case),
+) -> TickerPriceMatrixResponse | Response:
+    tickers = [t.strip().upper() for t in body.tickers]
+    try:
+        matrix = use_case.execute(tickers, body.start, body.end, parse_interval(body.interval))
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    parts = _matrix_parts(matrix, body.include)
+    if body.format == "npz":
+        buffer = io.BytesIO()
+        np.savez_compressed(
+            buffer,
+            tickers=np.array(matrix.tickers),
+            timestamps_us=matrix.grid,
+            **parts,
+        )
+        return Response(buffer.getvalue(), media_type="application/x-npz")
+    return TickerPriceMatrixResponse(
+        tickers=list(matrix.tickers),
+        interval=body.interval,
+        timestamps=matrix.timestamps() if "prices" in parts else None,
+        **{name: _nan_to_none(values) for name, values in parts.items()},
     )
 
 
+# Must stay above "/{ticker}", which would otherwise capture "snapshot".
+@router.get("/snapshot", response_model=MarketSnapshotResponse)
+def get_market_snapshot(
+    use_case: GetMarketSnapshot = Depends(get_snapshot_use_case),
+) -> MarketSnapshotResponse:
+    prices = use_case.execute()
+    return MarketSnapshotResponse(count=len(prices), prices=[_to_response(p) for p in prices])
+
+
 @router.get("/{ticker}", response_model=TickerPriceListResponse)
 def get_ticker_prices(
     ticker: str,
     start: datetime | None = Query(default=None),
     end: datetime | None = Query(default=None),
+    limit: int | None = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(default=None),
+    stream: bool = Query(default=False),
+    points: int | None = Query(default=None, ge=3, le=MAX_CHART_POINTS),
     use_case: GetTickerPrices = Depends(get_query_use_case),
-) -> TickerPriceListResponse:
-    prices = use_case.execute(ticker.upper(), start=start, end=end)
-    return TickerPriceListResponse(
+    settings: Settings = Depends(get_settings),
+) -> TickerPriceListResponse | StreamingResponse:
+    ticker = ticker.upper()
+    if points is not None:
+        try:
+            prices = use_case.downsample(
+                ticker,
+                points,
+                start=start,
+                end=end,
+                page_size=settings.stream_page_size,
+                max_rows=settings.downsample_max_rows,
+            )
+        except TooManyRowsError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+        return _to_list_response(ticker, prices)
+    if stream:
+        pages = use_case.stream(ticker, start=start, end=end, page_size=settings.stream_page_size)
+        return StreamingResponse(_ndjson(pages), media_type="application/x-ndjson")
+    if limit is None and cursor is None:
+        return _to_list_response(ticker, use_case.execute(ticker, start=start, end=end))
+
+    tag = _cursor_tag(ticker, start, end)
+    try:
+        page = use_case.execute_page(
+            ticker,
+            start=start,
+            end=end,
+            limit=limit or settings.stream_page_size,
+            paging_state=_decode_cursor(cursor, tag) if cursor else None,
+        )
+    except InvalidPagingStateError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Cursor rejected"
+        ) from exc
+    response = _to_list_response(ticker, page.prices)
+    response.next_cursor = _encode_cursor(page.paging_state, tag)
+    return response
+
+
+@router.get("/{ticker}/candles", response_model=CandleListResponse)
+def get_candles(
+    ticker: str,
+    interval: str = Query(default="1d", pattern=r"^[1-9]\d*[smhdw]$", examples=["4h"]),
+    start: datetime | None = Query(default=None),
+    end: datetime | None = Query(default=None),
+    use_case: GetCandles = Depends(get_candles_use_case),
+) -> CandleListResponse:
+    candles = use_case.execute(ticker.upper(), parse_interval(interval), start=start, end=end)
+    return CandleListResponse(
         ticker=ticker.upper(),
-        count=len(prices),
-        prices=[
-            TickerPriceResponse(
-                ticker=p.ticker, price=p.price, timestamp=p.ts,
-                currency=p.currency, source=p.source,
+        interval=interval,
+        count=len(candles),
+        candles=[
+            CandleResponse(
+                bucket=c.bucket, open=c.open, high=c.high, low=c.low,
+                close=c.close, count=c.count,
             )
-            for p in prices
+            for c in candles
         ],
     )
+
+
+@router.get("/{ticker}/latest", response_model=TickerPriceResponse)
+def get_latest_price(
+    ticker: str,
+    use_case: GetLatestPrice = Depends(get_latest_price_use_case),
+) -> TickerPriceResponse:
+    try:
+        latest = use_case.execute(ticker.upper())
+    except TickerPriceNotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    return _to_response(latest)
+
+
+@router.get("/{ticker}/indicators", response_model=IndicatorResponse)
+def get_indicators(
+    ticker: str,
+    engine: IndicatorEngine = Depends(get_indicator_engine),
+) -> IndicatorResponse:
+    snapshot = engine.get(ticker.upper())
+    if snapshot is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No indicators for ticker: {ticker.upper()}",
+        )
+    return IndicatorResponse(
+        ticker=snapshot.ticker,
+        window=snapshot.window,
+        count=snapshot.count,
+        last_price=snapshot.last_price,
+        last_timestamp=snapshot.last_ts,
+        sma=snapshot.sma,
+        time_weighted_mean=snapshot.time_weighted_mean,
+        volatility=snapshot.volatility,
+    )
+
+
+@router.get("/{ticker}/stream")
+async def stream_live_prices(
+    ticker: str,
+    hub: PriceHub = Depends(get_price_hub),
+    settings: Settings = Depends(get_settings),
+) -> StreamingResponse:
+    subscription = hub.subscribe(ticker.upper())
+    return StreamingResponse(
+        _sse(subscription, settings.live_heartbeat_seconds),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/{ticker}/ws")
+async def websocket_live_prices(
+    websocket: WebSocket,
+    ticker: str,
+    hub: PriceHub = Depends(get_price_hub),
+) -> None:
+    await websocket.accept()
+    subscription = hub.subscribe(ticker.upper())
+    try:
+        # Clients send nothing, so only reading notices a disconnect on a quiet ticker;
+        # whichever side ends first cancels the other.
+        async with anyio.create_task_group() as tasks:
+            tasks.start_soon(_until_done, tasks.cancel_scope, _send_prices(websocket, subscription))
+            tasks.start_soon(_until_done, tasks.cancel_scope, _await_disconnect(websocket))
+    finally:
+        subscription.close()
+
+
+async def _until_done(scope: anyio.CancelScope, work: Awaitable[None]) -> None:
+    await work
+    scope.cancel()
+
+
+async def _send_prices(websocket: WebSocket, subscription: Subscription) -> None:
+    try:
+        while (price := await subscription.next()) is not None:
+            await websocket.send_text(_to_response(price).model_dump_json())
+        await websocket.close(code=1013, reason="subscriber too slow, reconnect")
+    except WebSocketDisconnect:
+        pass
+
+
+async def _await_disconnect(websocket: WebSocket) -> None:
+    while (await websocket.receive())["type"] != "websocket.disconnect":
+        pass
@@ -1,5 +1,6 @@
 from datetime import datetime
 from decimal import Decimal
+from typing import Literal
 
 from pydantic import BaseModel, Field
 
@@ -24,3 +25,80 @@ class TickerPriceListResponse(BaseModel):
     ticker: str
     count: int
     prices: list[TickerPriceResponse]
+    next_cursor: str | None = None
+
+
+class TickerPriceBatchQuery(BaseModel):
+    tickers: list[str] = Field(..., min_length=1, max_length=500, examples=[["AAPL", "MSFT"]])
+    start: datetime | None = None
+    end: datetime | None = None
+
+
+class TickerPriceBatchResponse(BaseModel):
+    count: int
+    results: list[TickerPriceListResponse]
+
+
+class MarketSnapshotResponse(BaseModel):
+    count: int
+    prices: list[TickerPriceResponse]
+
+
+class TickerPriceAsOfQuery(BaseModel):
+    tickers: list[str] = Field(..., min_length=1, max_length=500, examples=[["AAPL", "MSFT"]])
+    at: datetime = Field(..., examples=["2025-01-15T16:00:00Z"])
+
+
+class TickerPriceAsOfResponse(BaseModel):
+    at: datetime
+    count: int
+    prices: list[TickerPriceResponse]
+    missing: list[str]
+
+
+MatrixPart = Literal["prices", "correlation", "covariance"]
+
+
+class TickerPriceMatrixQuery(BaseModel):
+    tickers: list[str] = Field(..., min_length=1, max_length=200, examples=[["AAPL", "MSFT"]])
+    start: datetime
+    end: datetime
+    interval: str = Field(default="1h", pattern=r"^[1-9]\d*[smhdw]$", examples=["5m"])
+    include: list[MatrixPart] = Field(default=["prices", "correlation", "covariance"])
+    format: Literal["json", "npz"] = "json"
+
+
+class TickerPriceMatrixResponse(BaseModel):
+    tickers: list[str]
+    interval: str
+    timestamps: list[datetime] | None = None
+    prices: list[list[float | None]] | None = None
+    correlation: list[list[float | None]] | None = None
+    covariance: list[list[float | None]] | None = None
+
+
+class IndicatorResponse(BaseModel):
+    ticker: str
+    window: int
+    count: int
+    last_price: float
+    last_timestamp: datetime
+    sma: float
+    time_weighted_mean: float
+    volatility: float | None
+
+
+class CandleResponse(BaseModel):
+    bucket: datetime
+    open: Decimal
+    high: Decimal
+    low: Decimal
+    close: Decimal
+    count: int
+
+
+class CandleListResponse(BaseModel):
+    ticker: str
+    interval: str
+    count: int
+    candles: list[CandleResponse]
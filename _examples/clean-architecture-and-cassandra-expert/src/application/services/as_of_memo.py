@@ -0,0 +1,73 @@
+import threading
+from collections import OrderedDict, defaultdict
+from datetime import datetime
+
+from src.domain.entities.candle import as_utc
+from src.domain.entities.ticker_price import TickerPrice
+
+
+class AsOfMemo:
+    """Bounded LRU of ``(ticker, at) -> last price at or before at``.
+
+    Only settled (historical) answers should be stored. A late insert for an
+    older timestamp invalidates every memoised answer it could change, i.e.
+    those for the same ticker with ``at >= ts``; inserts made by other
+    processes are not seen, so backfills elsewhere need a restart to show up.
+
+    ``on_inserted`` must be called once the row is readable, not when it is
+    accepted into a write buffer. It also bumps the ticker's generation:
+    callers read ``generation`` before querying and hand it to ``put``, which
+    drops answers from queries that an insert may have overtaken.
+    """
+
+    def __init__(self, max_entries: int = 100_000) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, datetime], TickerPrice | None] = OrderedDict()
+        self._by_ticker: dict[str, set[datetime]] = defaultdict(set)
+        self._generations: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, ticker: str, at: datetime) -> tuple[bool, TickerPrice | None]:
+        """``(hit, price)``; a hit may carry None, meaning no price precedes ``at``."""
+        key = (ticker, as_utc(at))
+        with self._lock:
+            if key not in self._entries:
+                return False, None
+            self._entries.move_to_end(key)
+            return True, self._entries[key]
+
+    def generation(self, ticker: str) -> int:
+        with self._lock:
+            return self._generations.get(ticker, 0)
+
+    def put(self, ticker: str, at: datetime, price: TickerPrice | None, generation: int) -> None:
+        if self._max_entries <= 0:
+            return
+        key = (ticker, as_utc(at))
+        with self._lock:
+            if self._generations.get(ticker, 0) != generation:
+                return
+            self._entries[key] = price
+            self._entries.move_to_end(key)
+            self._by_ticker[ticker].add(key[1])
+            while len(self._entries) > self._max_entries:
+                (old_ticker, old_at), _ = self._entries.popitem(last=False)
+                self._forget(old_ticker, old_at)
+
+    def on_inserted(self, entity: TickerPrice) -> None:
+        ts = as_utc(entity.ts)
+        with self._lock:
+            self._generations[entity.ticker] = self._generations.get(entity.ticker, 0) + 1
+            stale = [at for at in self._by_ticker.get(entity.ticker, ()) if at >= ts]
+            for at in stale:
+                del self._entries[(entity.ticker, at)]
+                self._forget(entity.ticker, at)
+
+    def _forget(self, ticker: str, at: datetime) -> None:
+        ats = self._by_ticker[ticker]
+        ats.discard(at)
+        if not ats:
+            del self._by_ticker[ticker]
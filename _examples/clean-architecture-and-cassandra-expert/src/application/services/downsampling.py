@@ -0,0 +1,134 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import numpy as np
+
+from src.domain.entities.price_columns import PriceColumns
+from src.domain.entities.ticker_price import TickerPrice
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+class TooManyRowsError(ValueError):
+    """A range holding more rows than the caller allowed to buffer."""
+
+
+@dataclass(frozen=True)
+class PriceSeries:
+    """Columnar, oldest-first view of a ticker's prices.
+
+    ``prices`` are floats for numeric work only; each row's exact value is
+    kept as ``mantissas * 10**exponents`` and restored by :meth:`take`. Costs
+    ~27 bytes per tick instead of a ``TickerPrice`` object, so wide ranges
+    can be accumulated page by page before being downsampled.
+    """
+
+    ticker: str
+    micros: np.ndarray
+    prices: np.ndarray
+    mantissas: np.ndarray
+    exponents: np.ndarray
+    labels: np.ndarray
+    label_values: tuple[tuple[str, str], ...]
+
+    @classmethod
+    def from_pages(cls, ticker: str, pages: Iterable[list[TickerPrice]]) -> "PriceSeries":
+        return cls.from_columns(
+            ticker, (PriceColumns.from_prices(ticker, page) for page in pages)
+        )
+
+    @classmethod
+    def from_columns(
+        cls, ticker: str, pages: Iterable[PriceColumns], max_rows: int | None = None
+    ) -> "PriceSeries":
+        """Concatenate packed pages (newest first, as read) into one oldest-first series.
+
+        Raises ``TooManyRowsError`` as soon as more than ``max_rows`` rows have been read,
+        so an oversized range stops fetching instead of filling memory.
+        """
+        kept: list[PriceColumns] = []
+        rows = 0
+        for page in pages:
+            rows += len(page)
+            if max_rows is not None and rows > max_rows:
+                raise TooManyRowsError(
+                    f"range holds more than {max_rows} prices; narrow it to downsample"
+                )
+            if len(page):
+                kept.append(page)
+        label_index: dict[tuple[str, str], int] = {}
+        labels = []
+        for page in kept:
+            remap = [label_index.setdefault(v, len(label_index)) for v in page.label_values]
+            labels.append(np.asarray(remap, dtype=np.int16)[page.labels])
+
+        def column(arrays: list[np.ndarray], dtype: type) -> np.ndarray:
+            # Pages arrive newest-first (clustering order); charts want oldest-first.
+            return np.concatenate(arrays)[::-1] if arrays else np.empty(0, dtype=dtype)
+
+        return cls(
+            ticker=ticker,
+            micros=column([p.micros for p in kept], np.int64),
+            prices=column([p.floats() for p in kept], np.float64),
+            mantissas=column([p.mantissas for p in kept], np.int64),
+            exponents=column([p.exponents for p in kept], np.int8),
+            labels=column(labels, np.int16),
+            label_values=tuple(label_index),
+        )
+
+    def __len__(self) -> int:
+        return len(self.micros)
+
+    def take(self, indices: np.ndarray) -> list[TickerPrice]:
+        """Materialise the selected rows, newest first like every other read path."""
+        picked = []
+        for i in indices[::-1]:
+            currency, source = self.label_values[self.labels[i]]
+            picked.append(
+                TickerPrice(
+                    ticker=self.ticker,
+                    ts=_EPOCH + timedelta(microseconds=int(self.micros[i])),
+                    price=Decimal(int(self.mantissas[i])).scaleb(int(self.exponents[i])),
+                    currency=currency,
+                    source=source,
+                )
+            )
+        return picked
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets: indices of ``threshold`` visually salient points.
+
+    ``x`` must be ascending. The first and last points are always kept; every
+    bucket in between contributes the point forming the largest triangle with
+    the previously selected point and the average of the next bucket.
+    """
+    n = len(x)
+    if threshold >= n or n <= 2:
+        return np.arange(n)
+    if threshold < 3:
+        return np.array([0, n - 1])
+
+    x = x.astype(np.float64)
+    y = y.astype(np.float64)
+    # Bucket b spans [edges[b], edges[b + 1]); the final "bucket" is just the last point.
+    every = (n - 2) / (threshold - 2)
+    edges = np.append(np.floor(np.arange(threshold - 1) * every).astype(np.int64) + 1, n)
+    counts = np.diff(edges)
+    avg_x = np.add.reduceat(x, edges[:-1]) / counts
+    avg_y = np.add.reduceat(y, edges[:-1]) / counts
+
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for b in range(threshold - 2):
+        lo, hi = edges[b], edges[b + 1]
+        area = np.abs(
+            (x[a] - avg_x[b + 1]) * (y[lo:hi] - y[a])
+            - (x[a] - x[lo:hi]) * (avg_y[b + 1] - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        selected[b + 1] = a
+    return selected
@@ -0,0 +1,170 @@
+import logging
+import math
+import threading
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from src.domain.entities.candle import as_utc
+from src.domain.entities.ticker_price import TickerPrice
+from src.domain.repositories.ticker_price_repository import TickerPriceRepository
+
+logger = logging.getLogger(__name__)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass(frozen=True)
+class IndicatorSnapshot:
+    ticker: str
+    window: int
+    count: int
+    last_price: float
+    last_ts: datetime
+    sma: float
+    time_weighted_mean: float
+    volatility: float | None
+
+
+class RollingWindow:
+    """The last ``size`` ticks of one ticker, with O(1) running sums per update.
+
+    Keeps the simple mean of prices, the time-weighted mean (each price
+    weighted by how long it stood before the next tick) and the sample
+    standard deviation of log returns. Ticks must arrive in timestamp order.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._ts: deque[float] = deque()
+        self._prices: deque[float] = deque()
+        self._price_sum = 0.0
+        # Over the len - 1 gaps between consecutive ticks in the window.
+        self._weighted_sum = 0.0
+        self._return_sum = 0.0
+        self._return_sq_sum = 0.0
+
+    def __len__(self) -> int:
+        return len(self._prices)
+
+    @property
+    def last_ts(self) -> float:
+        return self._ts[-1] if self._ts else -math.inf
+
+    def ticks(self) -> list[tuple[float, float]]:
+        return list(zip(self._ts, self._prices, strict=True))
+
+    def push(self, ts: float, price: float) -> bool:
+        """Append a tick; returns False (ignored) if it is not newer than the last one."""
+        if ts <= self.last_ts:
+            return False
+        if self._prices:
+            prev_ts, prev_price = self._ts[-1], self._prices[-1]
+            self._weighted_sum += prev_price * (ts - prev_ts)
+            log_return = math.log(price / prev_price)
+            self._return_sum += log_return
+            self._return_sq_sum += log_return * log_return
+        self._ts.append(ts)
+        self._prices.append(price)
+        self._price_sum += price
+        if len(self._prices) > self.size:
+            self._evict()
+        return True
+
+    def snapshot(self, ticker: str) -> IndicatorSnapshot:
+        n = len(self._prices)
+        span = self._ts[-1] - self._ts[0]
+        sma = self._price_sum / n
+        returns = n - 1
+        volatility = None
+        if returns >= 2:
+            mean = self._return_sum / returns
+            variance = (self._return_sq_sum - returns * mean * mean) / (returns - 1)
+            volatility = math.sqrt(max(variance, 0.0))
+        return IndicatorSnapshot(
+            ticker=ticker,
+            window=self.size,
+            count=n,
+            last_price=self._prices[-1],
+            last_ts=_EPOCH + timedelta(seconds=self._ts[-1]),
+            sma=sma,
+            time_weighted_mean=self._weighted_sum / span if span > 0 else self._prices[-1],
+            volatility=volatility,
+        )
+
+    def _evict(self) -> None:
+        old_ts, old_price = self._ts.popleft(), self._prices.popleft()
+        self._price_sum -= old_price
+        next_ts, next_price = self._ts[0], self._prices[0]
+        self._weighted_sum -= old_price * (next_ts - old_ts)
+        log_return = math.log(next_price / old_price)
+        self._return_sum -= log_return
+        self._return_sq_sum -= log_return * log_return
+
+
+class IndicatorEngine:
+    """Rolling-window indicators for every ticker, kept up to date by the insert path.
+
+    Windows are tick-count based. They are seeded in the background from the
+    newest ``window`` rows of each ticker; late (older than newest) inserts
+    are not applied, and inserts made by other processes are not seen.
+    """
+
+    def __init__(self, window: int = 100) -> None:
+        self._window = window
+        self._windows: dict[str, RollingWindow] = {}
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def ticker_count(self) -> int:
+        return len(self._windows)
+
+    def on_inserted(self, entity: TickerPrice) -> None:
+        with self._lock:
+            window = self._windows.get(entity.ticker)
+            if window is None:
+                window = self._windows[entity.ticker] = RollingWindow(self._window)
+            window.push(_seconds(entity.ts), float(entity.price))
+
+    def get(self, ticker: str) -> IndicatorSnapshot | None:
+        with self._lock:
+            window = self._windows.get(ticker)
+            return None if window is None or not len(window) else window.snapshot(ticker)
+
+    def seed(self, ticker: str, newest_first: list[TickerPrice]) -> None:
+        """Rebuild ``ticker`` from stored rows, keeping any newer live ticks."""
+        seeded = RollingWindow(self._window)
+        for price in reversed(newest_first):
+            seeded.push(_seconds(price.ts), float(price.price))
+        with self._lock:
+            live = self._windows.get(ticker)
+            if live is not None:
+                for ts, price in live.ticks():
+                    seeded.push(ts, price)
+            self._windows[ticker] = seeded
+
+    def seed_all(self, repo: TickerPriceRepository) -> int:
+        tickers = repo.list_tickers()
+        for ticker in tickers:
+            self.seed(ticker, repo.get_page(ticker, limit=self._window).prices)
+        logger.info("Indicator windows seeded for %d tickers", len(tickers))
+        return len(tickers)
+
+    def start(self, repo: TickerPriceRepository) -> None:
+        """Seed in the background; tickers answer from live inserts until then."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._seed_safely, args=(repo,), name="indicator-seed", daemon=True
+            )
+            self._thread.start()
+
+    def _seed_safely(self, repo: TickerPriceRepository) -> None:
+        try:
+            self.seed_all(repo)
+        except Exception:
+            logger.exception("Indicator seeding failed; windows fill from new inserts only")
+
+
+def _seconds(ts: datetime) -> float:
+    return (as_utc(ts) - _EPOCH).total_seconds()
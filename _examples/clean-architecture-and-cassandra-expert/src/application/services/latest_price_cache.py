@@ -0,0 +1,40 @@
+import threading
+import time
+from collections.abc import Callable
+
+from src.domain.entities.candle import as_utc
+from src.domain.entities.ticker_price import TickerPrice
+
+
+class LatestPriceCache:
+    """Per-ticker newest price, kept fresh write-through by the insert path.
+
+    Entries older than ``max_age`` seconds are treated as misses so prices
+    written by other processes become visible within that bound.
+    """
+
+    def __init__(
+        self,
+        max_age: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_age = max_age
+        self._clock = clock
+        self._entries: dict[str, tuple[TickerPrice, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, ticker: str) -> TickerPrice | None:
+        entry = self._entries.get(ticker)
+        if entry is None or self._clock() - entry[1] > self._max_age:
+            return None
+        return entry[0]
+
+    def put(self, entity: TickerPrice) -> None:
+        """Cache ``entity`` unless a fresher entry holds a newer price."""
+        with self._lock:
+            current = self.get(entity.ticker)
+            if current is None or as_utc(entity.ts) >= as_utc(current.ts):
+                self._entries[entity.ticker] = (entity, self._clock())
+
+    def on_inserted(self, entity: TickerPrice) -> None:
+        self.put(entity)
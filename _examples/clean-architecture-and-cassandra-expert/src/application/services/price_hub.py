@@ -0,0 +1,98 @@
+import asyncio
+import threading
+from collections import defaultdict
+from collections.abc import Iterable
+
+from src.domain.entities.ticker_price import TickerPrice
+
+
+class Subscription:
+    """One live consumer of a ticker's prices, bound to the event loop it was created on.
+
+    Prices are buffered in a bounded queue. A consumer that lets it fill up is
+    dropped rather than slowing the publisher or growing memory; it then
+    receives ``None`` and should reconnect (and backfill via the history API).
+    """
+
+    def __init__(self, hub: "PriceHub", ticker: str, maxsize: int) -> None:
+        self.ticker = ticker
+        self.loop = asyncio.get_running_loop()
+        self.dropped = False
+        self._hub = hub
+        self._queue: asyncio.Queue[TickerPrice | None] = asyncio.Queue(maxsize)
+
+    async def next(self, timeout: float | None = None) -> TickerPrice | None:
+        """Next price, or None once dropped. Raises ``TimeoutError`` if none arrives in time."""
+        return await asyncio.wait_for(self._queue.get(), timeout)
+
+    def close(self) -> None:
+        self._hub.unsubscribe(self)
+
+    def offer(self, entity: TickerPrice) -> None:
+        # Runs on ``self.loop``, scheduled by the hub.
+        if self.dropped:
+            return
+        try:
+            self._queue.put_nowait(entity)
+        except asyncio.QueueFull:
+            self.dropped = True
+            self.close()
+            self._hub.dropped += 1
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait(None)
+
+
+class PriceHub:
+    """In-process fan-out of inserted prices to live subscribers.
+
+    ``on_inserted`` is called from whichever thread ran the insert; delivery
+    is handed to each subscriber's event loop with one ``call_soon_threadsafe``
+    per loop, so publishing never blocks on consumers. Only inserts handled by
+    this process are seen.
+    """
+
+    def __init__(self, queue_size: int = 256) -> None:
+        self._queue_size = queue_size
+        self._subscribers: dict[str, set[Subscription]] = defaultdict(set)
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(subs) for subs in self._subscribers.values())
+
+    def subscribe(self, ticker: str) -> Subscription:
+        """Must be called from the event loop that will consume the subscription."""
+        subscription = Subscription(self, ticker, self._queue_size)
+        with self._lock:
+            self._subscribers[ticker].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subs = self._subscribers.get(subscription.ticker)
+            if subs is not None:
+                subs.discard(subscription)
+                if not subs:
+                    del self._subscribers[subscription.ticker]
+
+    def on_inserted(self, entity: TickerPrice) -> None:
+        with self._lock:
+            subs = list(self._subscribers.get(entity.ticker, ()))
+        by_loop: dict[asyncio.AbstractEventLoop, list[Subscription]] = defaultdict(list)
+        for subscription in subs:
+            by_loop[subscription.loop].append(subscription)
+        for loop, group in by_loop.items():
+            try:
+                loop.call_soon_threadsafe(_deliver, group, entity)
+            except RuntimeError:
+                # Loop already closed (shutdown); its subscribers are gone with it.
+                for subscription in group:
+                    self.unsubscribe(subscription)
+
+
+def _deliver(subscriptions: Iterable[Subscription], entity: TickerPrice) -> None:
+    for subscription in subscriptions:
+        subscription.offer(entity)
@@ -0,0 +1,82 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from src.application.services.downsampling import PriceSeries
+from src.domain.entities.candle import as_utc
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def grid_size(start: datetime, end: datetime, step_seconds: int) -> int:
+    """Number of points ``time_grid`` would return, without allocating them."""
+    span = (as_utc(end) - as_utc(start)) // timedelta(microseconds=1)
+    return max(span // (step_seconds * 1_000_000) + 1, 0)
+
+
+def time_grid(start: datetime, end: datetime, step_seconds: int) -> np.ndarray:
+    """Epoch microseconds from ``start`` to ``end`` inclusive, every ``step_seconds``."""
+    first = (as_utc(start) - _EPOCH) // timedelta(microseconds=1)
+    last = (as_utc(end) - _EPOCH) // timedelta(microseconds=1)
+    return np.arange(first, last + 1, step_seconds * 1_000_000, dtype=np.int64)
+
+
+@dataclass(frozen=True)
+class PriceMatrix:
+    """Prices of several tickers sampled on one shared, ascending time grid.
+
+    ``prices[i, j]`` is ticker ``j``'s last known price at ``grid[i]``
+    (forward-filled), or NaN before its first observation.
+    """
+
+    tickers: tuple[str, ...]
+    grid: np.ndarray
+    prices: np.ndarray
+
+    @classmethod
+    def align(
+        cls,
+        series: Sequence[PriceSeries],
+        grid: np.ndarray,
+        seeds: Sequence[float] | None = None,
+    ) -> "PriceMatrix":
+        """Forward-fill each oldest-first series onto ``grid``.
+
+        ``seeds`` are the prices in force before each series starts (NaN if
+        unknown), so the leading grid points are filled too.
+        """
+        prices = np.full((len(grid), len(series)), np.nan)
+        for j, s in enumerate(series):
+            # Index of the last observation at or before each grid point.
+            last = np.searchsorted(s.micros, grid, side="right") - 1
+            seed = np.nan if seeds is None else seeds[j]
+            if len(s):
+                prices[:, j] = np.where(last >= 0, s.prices[np.maximum(last, 0)], seed)
+            else:
+                prices[:, j] = seed
+        return cls(tickers=tuple(s.ticker for s in series), grid=grid, prices=prices)
+
+    def timestamps(self) -> list[datetime]:
+        return [_EPOCH + timedelta(microseconds=int(us)) for us in self.grid]
+
+    def returns(self) -> np.ndarray:
+        """Simple per-step returns, keeping only steps where every ticker has a price."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            steps = self.prices[1:] / self.prices[:-1] - 1
+        return steps[np.isfinite(steps).all(axis=1)]
+
+    def covariance(self) -> np.ndarray:
+        """Sample covariance of :meth:`returns`; NaN when fewer than two steps are complete."""
+        returns = self.returns()
+        if len(returns) < 2:
+            return np.full((len(self.tickers), len(self.tickers)), np.nan)
+        return np.atleast_2d(np.cov(returns, rowvar=False))
+
+    def correlation(self) -> np.ndarray:
+        """Pearson correlation of :meth:`returns`; NaN for tickers whose price never moved."""
+        covariance = self.covariance()
+        scale = np.sqrt(np.diag(covariance))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.clip(covariance / np.outer(scale, scale), -1.0, 1.0)
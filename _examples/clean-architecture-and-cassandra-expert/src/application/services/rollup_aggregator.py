@@ -0,0 +1,106 @@
+import logging
+import threading
+from collections.abc import Iterable
+from datetime import datetime
+
+from src.domain.entities.candle import Candle, Resolution
+from src.domain.entities.ticker_price import TickerPrice
+from src.domain.repositories.candle_repository import CandleRepository
+
+logger = logging.getLogger(__name__)
+
+_Buckets = dict[Resolution, dict[str, dict[datetime, Candle]]]
+
+
+def _empty() -> _Buckets:
+    return {res: {} for res in Resolution}
+
+
+class RollupAggregator:
+    """Folds inserted prices into per-bucket candles and merges them into the
+    rollup tables every ``flush_interval`` seconds.
+
+    Buckets still waiting for a flush are exposed through :meth:`pending` so
+    readers can overlay them on what is already persisted.
+
+    Flushes go through ``CandleRepository.merge``, a compare-and-set, so
+    several aggregators (workers or processes) can feed the same rows. A
+    flush must not run while ``RebuildRollups`` rewrites the same tickers:
+    the rebuild already counts the raw ticks behind these buckets, so
+    merging them afterwards would count them twice.
+    """
+
+    def __init__(self, repo: CandleRepository, flush_interval: float = 5.0) -> None:
+        self._repo = repo
+        self._flush_interval = flush_interval
+        self._pending = _empty()
+        self._in_flight = _empty()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def on_inserted(self, entity: TickerPrice) -> None:
+        self.add_many([entity])
+
+    def add_many(self, entities: Iterable[TickerPrice]) -> None:
+        with self._lock:
+            for entity in entities:
+                for res in Resolution:
+                    _fold(self._pending, res, Candle.from_price(entity, res.seconds))
+
+    def pending(self, ticker: str, resolution: Resolution) -> list[Candle]:
+        with self._lock:
+            candles = list(self._pending[resolution].get(ticker, {}).values())
+            candles.extend(self._in_flight[resolution].get(ticker, {}).values())
+        return candles
+
+    def flush(self) -> int:
+        """Merge every pending bucket into its rollup row; returns rows written."""
+        with self._flush_lock:
+            with self._lock:
+                self._in_flight, self._pending = self._pending, _empty()
+            written = 0
+            try:
+                for res, by_ticker in self._in_flight.items():
+                    for by_bucket in by_ticker.values():
+                        for bucket, candle in list(by_bucket.items()):
+                            self._repo.merge(res, candle)
+                            with self._lock:
+                                del by_bucket[bucket]
+                            written += 1
+            finally:
+                with self._lock:
+                    # Anything not written goes back into the queue for the next flush.
+                    for res, by_ticker in self._in_flight.items():
+                        for by_bucket in by_ticker.values():
+                            for candle in by_bucket.values():
+                                _fold(self._pending, res, candle)
+                    self._in_flight = _empty()
+            return written
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="rollup-flusher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._flush_interval):
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Rollup flush failed; buckets kept for retry")
+
+
+def _fold(buckets: _Buckets, resolution: Resolution, candle: Candle) -> None:
+    by_bucket = buckets[resolution].setdefault(candle.ticker, {})
+    existing = by_bucket.get(candle.bucket)
+    by_bucket[candle.bucket] = candle if existing is None else existing.merge(candle)
@@ -0,0 +1,49 @@
+from datetime import datetime
+
+from src.application.services.rollup_aggregator import RollupAggregator
+from src.domain.entities.candle import Candle, Resolution, aggregate, as_utc, bucket_start
+from src.domain.repositories.candle_repository import CandleRepository
+from src.domain.repositories.ticker_price_repository import TickerPriceRepository
+
+
+def coarsest_resolution(interval_seconds: int) -> Resolution | None:
+    """Pick the widest rollup whose buckets tile ``interval_seconds`` exactly."""
+    fitting = [res for res in Resolution if interval_seconds % res.seconds == 0]
+    return max(fitting, key=lambda res: res.seconds, default=None)
+
+
+class GetCandles:
+    def __init__(
+        self,
+        prices: TickerPriceRepository,
+        candles: CandleRepository,
+        aggregator: RollupAggregator | None = None,
+    ) -> None:
+        self._prices = prices
+        self._candles = candles
+        self._aggregator = aggregator
+
+    def execute(
+        self,
+        ticker: str,
+        interval_seconds: int,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> list[Candle]:
+        resolution = coarsest_resolution(interval_seconds)
+        if resolution is None:
+            ticks = self._prices.get_by_ticker(ticker, start=start, end=end)
+            return aggregate(
+                (Candle.from_price(p, interval_seconds) for p in ticks), interval_seconds
+            )
+
+        # Widen the lower bound so the first requested candle is complete.
+        lower = bucket_start(start, interval_seconds) if start else None
+        rows = self._candles.get_range(ticker, resolution, start=lower, end=end)
+        if self._aggregator is not None:
+            rows.extend(
+                c for c in self._aggregator.pending(ticker, resolution)
+                if (lower is None or as_utc(c.bucket) >= lower)
+                and (end is None or as_utc(c.bucket) <= as_utc(end))
+            )
+        return aggregate(rows, interval_seconds)
@@ -0,0 +1,25 @@
+from src.application.services.latest_price_cache import LatestPriceCache
+from src.domain.entities.ticker_price import TickerPrice
+from src.domain.repositories.ticker_price_repository import TickerPriceRepository
+
+
+class TickerPriceNotFoundError(Exception):
+    def __init__(self, ticker: str) -> None:
+        super().__init__(f"No prices recorded for ticker: {ticker}")
+        self.ticker = ticker
+
+
+class GetLatestPrice:
+    def __init__(self, repo: TickerPriceRepository, cache: LatestPriceCache) -> None:
+        self._repo = repo
+        self._cache = cache
+
+    def execute(self, ticker: str) -> TickerPrice:
+        cached = self._cache.get(ticker)
+        if cached is not None:
+            return cached
+        latest = self._repo.get_latest(ticker)
+        if latest is None:
+            raise TickerPriceNotFoundError(ticker)
+        self._cache.put(latest)
+        return latest
@@ -0,0 +1,11 @@
+from src.domain.entities.ticker_price import TickerPrice
+from src.domain.repositories.latest_price_repository import LatestPriceRepository
+
+
+class GetMarketSnapshot:
+    def __init__(self, repo: LatestPriceRepository) -> None:
+        self._repo = repo
+
+    def execute(self) -> list[TickerPrice]:
+        """Newest price of every ticker, ordered by ticker."""
+        return self._repo.get_all()
@@ -0,0 +1,63 @@
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import numpy as np
+
+from src.application.services.downsampling import PriceSeries
+from src.application.services.price_matrix import PriceMatrix, grid_size, time_grid
+from src.domain.entities.candle import as_utc
+from src.domain.repositories.ticker_price_repository import TickerPriceRepository
+
+
+class GetPriceMatrix:
+    """Align a basket of tickers on a common grid for returns and correlation work."""
+
+    def __init__(
+        self,
+        repo: TickerPriceRepository,
+        max_concurrency: int = 32,
+        max_cells: int = 2_000_000,
+        page_size: int = 5000,
+    ) -> None:
+        self._repo = repo
+        self._max_concurrency = max_concurrency
+        self._max_cells = max_cells
+        self._page_size = page_size
+
+    def execute(
+        self,
+        tickers: Sequence[str],
+        start: datetime,
+        end: datetime,
+        step_seconds: int,
+    ) -> PriceMatrix:
+        """Raises ``ValueError`` for a blank ticker, an empty/inverted range or an
+        oversized matrix; the size is checked before anything is allocated.
+        """
+        unique = list(dict.fromkeys(tickers))
+        if not all(t.strip() for t in unique):
+            raise ValueError("tickers must not be blank")
+        start, end = as_utc(start), as_utc(end)
+        if end <= start:
+            raise ValueError("end must be after start")
+        points = grid_size(start, end, step_seconds)
+        if points * len(unique) > self._max_cells:
+            raise ValueError(
+                f"{points} grid points x {len(unique)} tickers exceeds {self._max_cells} cells; "
+                "use a coarser interval or a shorter range"
+            )
+        grid = time_grid(start, end, step_seconds)
+        # The price in force at ``start`` fills the grid up to each ticker's first tick.
+        seeds = self._repo.get_as_of(unique, start, concurrency=self._max_concurrency)
+        with ThreadPoolExecutor(max_workers=min(self._max_concurrency, len(unique))) as pool:
+            series = list(pool.map(lambda t: self._load(t, start, end), unique))
+        return PriceMatrix.align(
+            series,
+            grid,
+            seeds=[np.nan if seeds.get(t) is None else float(seeds[t].price) for t in unique],
+        )
+
+    def _load(self, ticker: str, start: datetime, end: datetime) -> PriceSeries:
+        pages = self._repo.iter_columns(ticker, start=start, end=end, page_size=self._page_size)
+        return PriceSeries.from_columns(ticker, pages)
@@ -0,0 +1,52 @@
+from collections.abc import Callable, Sequence
+from datetime import datetime, timedelta, timezone
+
+from src.application.services.as_of_memo import AsOfMemo
+from src.domain.entities.candle import as_utc
+from src.domain.entities.ticker_price import TickerPrice
+from src.domain.repositories.ticker_price_repository import TickerPriceRepository
+
+
+class GetPricesAsOf:
+    """Last price at or before ``at`` for each ticker, e.g. to value a portfolio.
+
+    Answers for timestamps older than ``settle_seconds`` are memoised: new
+    ticks only arrive near "now", so an old point-in-time answer can only
+    change through a backfill, which the memo hears about once the row is
+    in the database. An answer is only stored if no such insert arrived
+    while it was being read.
+    """
+
+    def __init__(
+        self,
+        repo: TickerPriceRepository,
+        memo: AsOfMemo,
+        max_concurrency: int = 32,
+        settle_seconds: float = 300.0,
+        now: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ) -> None:
+        self._repo = repo
+        self._memo = memo
+        self._max_concurrency = max_concurrency
+        self._settle = timedelta(seconds=settle_seconds)
+        self._now = now
+
+    def execute(self, tickers: Sequence[str], at: datetime) -> dict[str, TickerPrice | None]:
+        """One entry per distinct ticker in request order; None where nothing precedes ``at``."""
+        unique = list(dict.fromkeys(tickers))
+        settled = as_utc(at) <= self._now() - self._settle
+        found: dict[str, TickerPrice | None] = {}
+        if settled:
+            for ticker in unique:
+                hit, price = self._memo.lookup(ticker, at)
+                if hit:
+                    found[ticker] = price
+        pending = [t for t in unique if t not in found]
+        if pending:
+            generations = {t: self._memo.generation(t) for t in pending}
+            fetched = self._repo.get_as_of(pending, at, concurrency=self._max_concurrency)
+            for ticker in pending:
+                found[ticker] = fetched.get(ticker)
+                if settled:
+                    self._memo.put(ticker, at, found[ticker], generations[ticker])
+        return {ticker: found[ticker] for ticker in unique}
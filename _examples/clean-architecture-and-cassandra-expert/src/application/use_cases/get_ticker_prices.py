@@ -1,6 +1,8 @@
+from collections.abc import Iterator
 from datetime import datetime
 
-from src.domain.entities.ticker_price import TickerPrice
+from src.application.services.downsampling import PriceSeries, lttb
+from src.domain.entities.ticker_price import TickerPrice, TickerPricePage
 from src.domain.repositories.ticker_price_repository import TickerPriceRepository
 
 
@@ -15,3 +17,45 @@ class GetTickerPrices:
         end: datetime | None = None,
     ) -> list[TickerPrice]:
         return self._repo.get_by_ticker(ticker, start=start, end=end)
+
+    def execute_page(
+        self,
+        ticker: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        limit: int = 1000,
+        paging_state: bytes | None = None,
+    ) -> TickerPricePage:
+        return self._repo.get_page(
+            ticker, start=start, end=end, limit=limit, paging_state=paging_state
+        )
+
+    def stream(
+        self,
+        ticker: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        page_size: int = 1000,
+    ) -> Iterator[list[TickerPrice]]:
+        return self._repo.iter_pages(ticker, start=start, end=end, page_size=page_size)
+
+    def downsample(
+        self,
+        ticker: str,
+        points: int,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        page_size: int = 1000,
+        max_rows: int | None = None,
+    ) -> list[TickerPrice]:
+        """Reduce the range to at most ``points`` prices using LTTB.
+
+        LTTB needs the whole range in memory, so ranges holding more than
+        ``max_rows`` prices raise ``TooManyRowsError`` instead.
+        """
+        series = PriceSeries.from_columns(
+            ticker,
+            self._repo.iter_columns(ticker, start=start, end=end, page_size=page_size),
+            max_rows=max_rows,
+        )
+        return series.take(lttb(series.micros, series.prices, points))
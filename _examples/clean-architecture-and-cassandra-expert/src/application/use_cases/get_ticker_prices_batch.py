@@ -0,0 +1,25 @@
+from collections.abc import Sequence
+from datetime import datetime
+
+from src.domain.entities.ticker_price import TickerPrice
+from src.domain.repositories.ticker_price_repository import TickerPriceRepository
+
+
+class GetTickerPricesBatch:
+    def __init__(self, repo: TickerPriceRepository, max_concurrency: int = 32) -> None:
+        self._repo = repo
+        self._max_concurrency = max_concurrency
+
+    def execute(
+        self,
+        tickers: Sequence[str],
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> dict[str, list[TickerPrice]]:
+        """Fetch every ticker's range concurrently; keys keep first-seen request order."""
+        unique = list(dict.fromkeys(tickers))
+        if not unique:
+            return {}
+        return self._repo.get_by_tickers(
+            unique, start=start, end=end, concurrency=self._max_concurrency
+        )
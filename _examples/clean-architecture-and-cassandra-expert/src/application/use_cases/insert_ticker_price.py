@@ -1,3 +1,7 @@
+from collections.abc import Sequence
+from typing import Protocol
+
+from src.domain.entities.price_columns import PriceScales
 from src.domain.entities.ticker_price import TickerPrice
 from src.domain.repositories.ticker_price_repository import TickerPriceRepository
 
@@ -9,12 +13,32 @@ class DuplicateTickerPriceError(Exception):
         self.ts = ts
 
 
+class TickerPriceListener(Protocol):
+    """In-process consumer notified after a price has been persisted."""
+
+    def on_inserted(self, entity: TickerPrice) -> None: ...
+
+
 class InsertTickerPrice:
-    def __init__(self, repo: TickerPriceRepository) -> None:
+    def __init__(
+        self,
+        repo: TickerPriceRepository,
+        listeners: Sequence[TickerPriceListener] = (),
+        scales: PriceScales | None = None,
+    ) -> None:
         self._repo = repo
+        self._listeners = listeners
+        self._scales = scales
 
     def execute(self, entity: TickerPrice) -> TickerPrice:
+        """Raises ``UnscalablePriceError`` before anything is written, even if
+        the write itself is buffered.
+        """
+        if self._scales is not None:
+            self._scales.require(entity.price, entity.currency)
         if self._repo.exists(entity.ticker, entity.ts):
             raise DuplicateTickerPriceError(entity.ticker, str(entity.ts))
         self._repo.insert(entity)
+        for listener in self._listeners:
+            listener.on_inserted(entity)
         return entity
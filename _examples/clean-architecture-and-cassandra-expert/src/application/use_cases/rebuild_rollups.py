@@ -0,0 +1,65 @@
+from collections.abc import Sequence
+from datetime import datetime, time, timedelta, timezone
+
+from src.domain.entities.candle import Candle, Resolution, aggregate, as_utc
+from src.domain.entities.ticker_price import TickerPrice
+from src.domain.repositories.candle_repository import CandleRepository
+from src.domain.repositories.ticker_price_repository import TickerPriceRepository
+
+
+class RebuildRollups:
+    """Recompute rollup rows from raw ticks, overwriting what is stored.
+
+    Must not run while a ``RollupAggregator`` flushes into the same tickers,
+    or ticks folded by both are counted twice.
+    """
+
+    def __init__(
+        self,
+        prices: TickerPriceRepository,
+        candles: CandleRepository,
+        page_size: int = 5000,
+    ) -> None:
+        self._prices = prices
+        self._candles = candles
+        self._page_size = page_size
+
+    def execute(
+        self, ticker: str, start: datetime | None = None, end: datetime | None = None
+    ) -> int:
+        """Recompute the rollup rows of every UTC day of ``ticker`` touching [start, end].
+
+        Days are read page by page and written one at a time, so only one
+        day of ticks is held in memory. Returns ticks read.
+        """
+        if start is not None:
+            start = datetime.combine(as_utc(start).date(), time(), tzinfo=timezone.utc)
+        if end is not None:
+            end = datetime.combine(as_utc(end).date(), time(), tzinfo=timezone.utc)
+            end += timedelta(days=1) - timedelta(milliseconds=1)
+        folded = 0
+        day: list[TickerPrice] = []
+        for page in self._prices.iter_pages(
+            ticker, start=start, end=end, page_size=self._page_size
+        ):
+            for price in page:
+                if day and as_utc(price.ts).date() != as_utc(day[-1].ts).date():
+                    folded += self.write(day)
+                    day = []
+                day.append(price)
+        return folded + (self.write(day) if day else 0)
+
+    def write(self, ticks: Sequence[TickerPrice]) -> int:
+        """Upsert the rollup rows covering ``ticks``; returns how many were folded.
+
+        ``ticks`` must hold every tick of each UTC day they touch, otherwise
+        hour and day rows are overwritten from partial data.
+        """
+        finest = aggregate(
+            (Candle.from_price(p, Resolution.MINUTE.seconds) for p in ticks),
+            Resolution.MINUTE.seconds,
+        )
+        for res in Resolution:
+            for candle in aggregate(finest, res.seconds):
+                self._candles.upsert(res, candle)
+        return len(ticks)
@@ -0,0 +1,43 @@
+from typing import Literal
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    """Runtime tuning knobs, read from ``TICKER_*`` environment variables."""
+
+    model_config = SettingsConfigDict(env_prefix="TICKER_")
+
+    rollup_flush_interval_seconds: float = 5.0
+    latest_price_max_age_seconds: float = 1.0
+    batch_max_concurrency: int = 32
+    as_of_memo_max_entries: int = 100_000
+    as_of_settle_seconds: float = 300.0
+    price_read_mode: Literal["decimal", "scaled"] = "decimal"
+    # Per-source overrides of the ticker_prices default TTL, e.g. '{"backfill": 30}'.
+    retention_source_ttl_days: dict[str, int] = {}
+    stream_page_size: int = 1000
+    # ?points=N buffers the range as ~27-byte rows; larger ranges get a 400.
+    downsample_max_rows: int = 2_000_000
+    live_queue_size: int = 256
+    live_heartbeat_seconds: float = 15.0
+    indicator_window_ticks: int = 100
+    segment_cache_max_bytes: int = 64 * 1024 * 1024
+    segment_cache_live_window_seconds: float = 300.0
+    write_behind_enabled: bool = False
+    write_behind_max_queue: int = 10_000
+    write_behind_flush_rows: int = 500
+    write_behind_flush_interval_seconds: float = 0.05
+    write_behind_put_timeout_seconds: float = 1.0
+    spool_enabled: bool = False
+    spool_dir: str = "./spool"
+    spool_segment_bytes: int = 64 * 1024 * 1024
+    spool_drain_rows_per_second: float = 5000.0
+    bloom_enabled: bool = False
+    bloom_days: int = 2
+    bloom_fp_rate: float = 0.01
+    # Required with bloom_enabled: this process must be the only writer of the tickers
+    # with crc32(ticker) % bloom_owner_shards == bloom_owner_shard (0 of 1: all of them).
+    bloom_owner_shard: int | None = None
+    bloom_owner_shards: int = 1
+    single_flight_enabled: bool = True
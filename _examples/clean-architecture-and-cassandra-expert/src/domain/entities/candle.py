@@ -0,0 +1,100 @@
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from enum import StrEnum
+
+from src.domain.entities.ticker_price import TickerPrice
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+class Resolution(StrEnum):
+    """Granularities that have a pre-computed rollup table."""
+
+    MINUTE = "1m"
+    HOUR = "1h"
+    DAY = "1d"
+
+    @property
+    def seconds(self) -> int:
+        return {"1m": 60, "1h": 3600, "1d": 86400}[self.value]
+
+
+def as_utc(ts: datetime) -> datetime:
+    """Cassandra hands back naive UTC datetimes; the API hands us aware ones."""
+    return ts.replace(tzinfo=timezone.utc) if ts.tzinfo is None else ts.astimezone(timezone.utc)
+
+
+def bucket_start(ts: datetime, seconds: int) -> datetime:
+    """Floor ``ts`` to the start of its ``seconds``-wide bucket (epoch aligned, UTC)."""
+    offset = (as_utc(ts) - _EPOCH) // timedelta(seconds=1)
+    return _EPOCH + timedelta(seconds=offset - offset % seconds)
+
+
+@dataclass(frozen=True)
+class Candle:
+    ticker: str
+    bucket: datetime
+    open: Decimal
+    high: Decimal
+    low: Decimal
+    close: Decimal
+    open_ts: datetime
+    close_ts: datetime
+    count: int = 1
+
+    @classmethod
+    def from_price(cls, price: TickerPrice, seconds: int) -> "Candle":
+        ts = as_utc(price.ts)
+        return cls(
+            ticker=price.ticker,
+            bucket=bucket_start(ts, seconds),
+            open=price.price,
+            high=price.price,
+            low=price.price,
+            close=price.price,
+            open_ts=ts,
+            close_ts=ts,
+        )
+
+    def merge(self, other: "Candle") -> "Candle":
+        """Combine two partial candles of the same bucket into one."""
+        first = self if as_utc(self.open_ts) <= as_utc(other.open_ts) else other
+        latest = self if as_utc(self.close_ts) >= as_utc(other.close_ts) else other
+        return Candle(
+            ticker=self.ticker,
+            bucket=self.bucket,
+            open=first.open,
+            high=max(self.high, other.high),
+            low=min(self.low, other.low),
+            close=latest.close,
+            open_ts=as_utc(first.open_ts),
+            close_ts=as_utc(latest.close_ts),
+            count=self.count + other.count,
+        )
+
+    def rebucket(self, seconds: int) -> "Candle":
+        """Return this candle re-labelled with the start of its coarser bucket."""
+        return replace(self, bucket=bucket_start(self.bucket, seconds))
+
+
+def aggregate(candles: Iterable[Candle], seconds: int) -> list[Candle]:
+    """Fold candles (or single-tick candles) into ``seconds``-wide buckets, newest first."""
+    merged: dict[datetime, Candle] = {}
+    for candle in candles:
+        coarse = candle.rebucket(seconds)
+        existing = merged.get(coarse.bucket)
+        merged[coarse.bucket] = coarse if existing is None else existing.merge(coarse)
+    return sorted(merged.values(), key=lambda c: c.bucket, reverse=True)
+
+
+_UNIT_SECONDS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+
+def parse_interval(spec: str) -> int:
+    """Turn an interval such as ``"5m"`` or ``"1d"`` into seconds."""
+    count, unit = spec[:-1], spec[-1:]
+    if not count.isdigit() or unit not in _UNIT_SECONDS or int(count) == 0:
+        raise ValueError(f"Invalid candle interval: {spec!r}")
+    return int(count) * _UNIT_SECONDS[unit]
@@ -0,0 +1,154 @@
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import numpy as np
+
+from src.domain.entities.ticker_price import TickerPrice
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+# Used for currencies missing from price_scales.
+DEFAULT_SCALE = 6
+
+
+class UnscalablePriceError(ValueError):
+    """A price with more decimal places than its currency's scale, or too large at that scale."""
+
+
+@dataclass(frozen=True)
+class PriceColumns:
+    """A run of one ticker's prices as parallel arrays, newest first.
+
+    Each price is exactly ``mantissa * 10**exponent``, so numeric work can run
+    on the arrays and ``Decimal`` objects are only built for rows that leave
+    the process. ``labels`` index into ``label_values`` (currency, source).
+    """
+
+    ticker: str
+    micros: np.ndarray
+    mantissas: np.ndarray
+    exponents: np.ndarray
+    labels: np.ndarray
+    label_values: tuple[tuple[str, str], ...]
+
+    @classmethod
+    def build(
+        cls, ticker: str, rows: Iterable[tuple[datetime, int, int, str, str]]
+    ) -> "PriceColumns":
+        """Pack ``(ts, mantissa, exponent, currency, source)`` tuples.
+
+        Raises ``ValueError`` if a mantissa or exponent does not fit the packed types.
+        """
+        micros: list[int] = []
+        mantissas: list[int] = []
+        exponents: list[int] = []
+        labels: list[int] = []
+        label_index: dict[tuple[str, str], int] = {}
+        for ts, mantissa, exponent, currency, source in rows:
+            if not _INT64_MIN <= mantissa <= _INT64_MAX or not -128 <= exponent <= 127:
+                raise ValueError(f"Price {mantissa}e{exponent} does not fit a packed column")
+            micros.append((_as_utc(ts) - _EPOCH) // timedelta(microseconds=1))
+            mantissas.append(mantissa)
+            exponents.append(exponent)
+            labels.append(label_index.setdefault((currency, source), len(label_index)))
+        return cls(
+            ticker=ticker,
+            micros=np.array(micros, dtype=np.int64),
+            mantissas=np.array(mantissas, dtype=np.int64),
+            exponents=np.array(exponents, dtype=np.int8),
+            labels=np.array(labels, dtype=np.int16),
+            label_values=tuple(label_index),
+        )
+
+    @classmethod
+    def from_prices(cls, ticker: str, prices: Sequence[TickerPrice]) -> "PriceColumns":
+        return cls.build(
+            ticker, ((p.ts, *decompose(p.price), p.currency, p.source) for p in prices)
+        )
+
+    def __len__(self) -> int:
+        return len(self.micros)
+
+    @property
+    def nbytes(self) -> int:
+        arrays = (self.micros, self.mantissas, self.exponents, self.labels)
+        return sum(a.nbytes for a in arrays)
+
+    def slice(self, start: int, stop: int) -> "PriceColumns":
+        return PriceColumns(
+            ticker=self.ticker,
+            micros=self.micros[start:stop],
+            mantissas=self.mantissas[start:stop],
+            exponents=self.exponents[start:stop],
+            labels=self.labels[start:stop],
+            label_values=self.label_values,
+        )
+
+    def floats(self) -> np.ndarray:
+        return self.mantissas * np.power(10.0, self.exponents)
+
+    def to_prices(self) -> list[TickerPrice]:
+        """Materialise rows with naive UTC timestamps, as the driver returns them."""
+        epoch = _EPOCH.replace(tzinfo=None)
+        prices = []
+        for micros, mantissa, exponent, label in zip(
+            self.micros.tolist(), self.mantissas.tolist(), self.exponents.tolist(),
+            self.labels.tolist(), strict=True,
+        ):
+            currency, source = self.label_values[label]
+            prices.append(
+                TickerPrice(
+                    ticker=self.ticker,
+                    ts=epoch + timedelta(microseconds=micros),
+                    price=Decimal(mantissa).scaleb(exponent),
+                    currency=currency,
+                    source=source,
+                )
+            )
+        return prices
+
+
+def decompose(price: Decimal) -> tuple[int, int]:
+    """``(mantissa, exponent)`` with ``price == mantissa * 10**exponent``, scale preserved."""
+    exponent = price.as_tuple().exponent
+    if not isinstance(exponent, int):
+        raise ValueError(f"Price {price} is not a finite number")
+    return int(price.scaleb(-exponent)), exponent
+
+
+@dataclass(frozen=True)
+class PriceScales:
+    """Fixed decimal places per currency for scaled-integer prices."""
+
+    scales: Mapping[str, int]
+
+    def of(self, currency: str) -> int:
+        return self.scales.get(currency, DEFAULT_SCALE)
+
+    def scale(self, price: Decimal, currency: str) -> int | None:
+        """``price`` in units of ``10**-scale``, or None if that would lose digits or overflow."""
+        mantissa, exponent = decompose(price)
+        shift = exponent + self.of(currency)
+        if shift < 0:
+            trimmed, remainder = divmod(mantissa, 10**-shift)
+            if remainder:
+                return None
+            mantissa, shift = trimmed, 0
+        scaled = mantissa * 10**shift
+        return scaled if _INT64_MIN <= scaled <= _INT64_MAX else None
+
+    def require(self, price: Decimal, currency: str) -> int:
+        """Like :meth:`scale`, but raises ``UnscalablePriceError`` instead of returning None."""
+        scaled = self.scale(price, currency)
+        if scaled is None:
+            raise UnscalablePriceError(
+                f"Price {price} does not fit {currency}'s scale of {self.of(currency)} "
+                "decimal places"
+            )
+        return scaled
+
+
+def _as_utc(ts: datetime) -> datetime:
+    return ts.replace(tzinfo=timezone.utc) if ts.tzinfo is None else ts.astimezone(timezone.utc)
@@ -10,3 +10,9 @@ class TickerPrice:
     price: Decimal
     currency: str = "USD"
     source: str = "manual"
+
+
+@dataclass(frozen=True)
+class TickerPricePage:
+    prices: list[TickerPrice]
+    paging_state: bytes | None = None
@@ -0,0 +1,20 @@
+from datetime import datetime
+from typing import Protocol
+
+from src.domain.entities.candle import Candle, Resolution
+
+
+class CandleRepository(Protocol):
+    def upsert(self, resolution: Resolution, candle: Candle) -> None: ...
+
+    def merge(self, resolution: Resolution, candle: Candle) -> None: ...
+
+    def get(self, ticker: str, resolution: Resolution, bucket: datetime) -> Candle | None: ...
+
+    def get_range(
+        self,
+        ticker: str,
+        resolution: Resolution,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> list[Candle]: ...
@@ -0,0 +1,10 @@
+from collections.abc import Sequence
+from typing import Protocol
+
+from src.domain.entities.ticker_price import TickerPrice
+
+
+class LatestPriceRepository(Protocol):
+    def upsert_many(self, entities: Sequence[TickerPrice]) -> None: ...
+
+    def get_all(self) -> list[TickerPrice]: ...
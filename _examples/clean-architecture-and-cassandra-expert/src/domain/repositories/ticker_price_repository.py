@@ -1,12 +1,26 @@
+from collections.abc import Iterator, Sequence
 from datetime import datetime
 from typing import Protocol
 
-from src.domain.entities.ticker_price import TickerPrice
+from src.domain.entities.price_columns import PriceColumns
+from src.domain.entities.ticker_price import TickerPrice, TickerPricePage
+
+
+class RepositoryBusyError(Exception):
+    """The repository cannot accept more writes right now; the caller should retry."""
+
+
+class InvalidPagingStateError(ValueError):
+    """A ``paging_state`` the database rejected, e.g. one from another query."""
 
 
 class TickerPriceRepository(Protocol):
     def insert(self, entity: TickerPrice) -> None: ...
 
+    def insert_many(self, entities: Sequence[TickerPrice], concurrency: int = 64) -> None: ...
+
+    def insert_batch(self, entities: Sequence[TickerPrice], concurrency: int = 16) -> None: ...
+
     def get_by_ticker(
         self,
         ticker: str,
@@ -14,4 +28,55 @@ class TickerPriceRepository(Protocol):
         end: datetime | None = None,
     ) -> list[TickerPrice]: ...
 
+    def get_page(
+        self,
+        ticker: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        limit: int = 1000,
+        paging_state: bytes | None = None,
+    ) -> TickerPricePage: ...
+
+    def iter_pages(
+        self,
+        ticker: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        page_size: int = 1000,
+    ) -> Iterator[list[TickerPrice]]: ...
+
+    def iter_columns(
+        self,
+        ticker: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        page_size: int = 1000,
+    ) -> Iterator[PriceColumns]: ...
+
+    def get_by_tickers(
+        self,
+        tickers: Sequence[str],
+        start: datetime | None = None,
+        end: datetime | None = None,
+        concurrency: int = 32,
+    ) -> dict[str, list[TickerPrice]]: ...
+
+    def get_as_of(
+        self,
+        tickers: Sequence[str],
+        at: datetime,
+        concurrency: int = 32,
+    ) -> dict[str, TickerPrice | None]: ...
+
+    def get_latest(self, ticker: str) -> TickerPrice | None: ...
+
     def exists(self, ticker: str, ts: datetime) -> bool: ...
+
+    def list_tickers(self) -> list[str]: ...
+
+    def scan_token_range(
+        self,
+        start_token: int,
+        end_token: int,
+        page_size: int = 5000,
+    ) -> Iterator[list[TickerPrice]]: ...
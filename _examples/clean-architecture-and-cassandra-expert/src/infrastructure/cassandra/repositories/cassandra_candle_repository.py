@@ -0,0 +1,127 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from cassandra import ConsistencyLevel
+from cassandra.cluster import Session
+
+from src.domain.entities.candle import Candle, Resolution
+
+_COLUMNS = "ticker, bucket, open, high, low, close, open_ts, close_ts, tick_count"
+_MIN_TS = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MAX_TS = datetime(9999, 12, 31, tzinfo=timezone.utc)
+
+
+class CassandraCandleRepository:
+    """Rollup rows in ``ticker_prices_<resolution>``.
+
+    ``upsert`` overwrites a row; ``merge`` folds a partial candle into it with
+    a lightweight transaction, so concurrent mergers never lose each other's
+    ticks. Plain upserts bypass that protocol: do not rebuild rows that are
+    being merged into at the same time.
+    """
+
+    def __init__(self, session: Session, max_merge_attempts: int = 16) -> None:
+        self._session = session
+        self._max_merge_attempts = max_merge_attempts
+        self._upsert_stmts = {
+            res: session.prepare(
+                f"INSERT INTO ticker_prices_{res.value} ({_COLUMNS}) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+            )
+            for res in Resolution
+        }
+        self._get_stmts = {
+            res: session.prepare(
+                f"SELECT {_COLUMNS} FROM ticker_prices_{res.value} "
+                "WHERE ticker = ? AND bucket = ?"
+            )
+            for res in Resolution
+        }
+        self._create_stmts = {
+            res: session.prepare(
+                f"INSERT INTO ticker_prices_{res.value} ({_COLUMNS}) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) IF NOT EXISTS"
+            )
+            for res in Resolution
+        }
+        self._swap_stmts = {
+            res: session.prepare(
+                f"UPDATE ticker_prices_{res.value} SET open = ?, high = ?, low = ?, close = ?, "
+                "open_ts = ?, close_ts = ?, tick_count = ? WHERE ticker = ? AND bucket = ? "
+                "IF tick_count = ? AND open_ts = ? AND close_ts = ?"
+            )
+            for res in Resolution
+        }
+        self._range_stmts = {
+            res: session.prepare(
+                f"SELECT {_COLUMNS} FROM ticker_prices_{res.value} "
+                "WHERE ticker = ? AND bucket >= ? AND bucket <= ?"
+            )
+            for res in Resolution
+        }
+
+    def upsert(self, resolution: Resolution, candle: Candle) -> None:
+        self._session.execute(self._upsert_stmts[resolution], _values(candle))
+
+    def merge(self, resolution: Resolution, candle: Candle) -> None:
+        """Fold ``candle`` into its stored row with compare-and-set, retrying on conflict."""
+        for _ in range(self._max_merge_attempts):
+            stored = self._get_serial(candle.ticker, resolution, candle.bucket)
+            if stored is None:
+                result = self._session.execute(
+                    self._create_stmts[resolution], _values(candle)
+                )
+            else:
+                merged = stored.merge(candle)
+                result = self._session.execute(
+                    self._swap_stmts[resolution],
+                    (*_values(merged)[2:], merged.ticker, merged.bucket,
+                     stored.count, stored.open_ts, stored.close_ts),
+                )
+            if result.was_applied:
+                return
+        raise RuntimeError(
+            f"{resolution.value} rollup {candle.ticker}@{candle.bucket} is too contended to merge"
+        )
+
+    def get(self, ticker: str, resolution: Resolution, bucket: datetime) -> Candle | None:
+        row = self._session.execute(self._get_stmts[resolution], (ticker, bucket)).one()
+        return None if row is None else _to_candle(row)
+
+    def _get_serial(self, ticker: str, resolution: Resolution, bucket: datetime) -> Candle | None:
+        # SERIAL also sees lightweight transactions that are still being committed.
+        bound = self._get_stmts[resolution].bind((ticker, bucket))
+        bound.consistency_level = ConsistencyLevel.SERIAL
+        row = self._session.execute(bound).one()
+        return None if row is None else _to_candle(row)
+
+    def get_range(
+        self,
+        ticker: str,
+        resolution: Resolution,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> list[Candle]:
+        rows = self._session.execute(
+            self._range_stmts[resolution], (ticker, start or _MIN_TS, end or _MAX_TS)
+        )
+        return [_to_candle(row) for row in rows]
+
+
+def _values(candle: Candle) -> tuple:
+    return (candle.ticker, candle.bucket, candle.open, candle.high, candle.low,
+            candle.close, candle.open_ts, candle.close_ts, candle.count)
+
+
+def _to_candle(row) -> Candle:
+    return Candle(
+        ticker=row.ticker,
+        bucket=row.bucket,
+        open=Decimal(str(row.open)),
+        high=Decimal(str(row.high)),
+        low=Decimal(str(row.low)),
+        close=Decimal(str(row.close)),
+        open_ts=row.open_ts,
+        close_ts=row.close_ts,
+        count=row.tick_count,
+    )
@@ -0,0 +1,65 @@
+import zlib
+from collections.abc import Sequence
+from datetime import datetime, timedelta, timezone
+
+from cassandra.cluster import Session
+from cassandra.concurrent import execute_concurrent_with_args
+
+from src.domain.entities.candle import as_utc
+from src.domain.entities.ticker_price import TickerPrice
+
+# Must match migration 010 and never change: rows are addressed by it.
+SHARDS = 16
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def shard_of(ticker: str) -> int:
+    return zlib.crc32(ticker.encode()) % SHARDS
+
+
+class CassandraLatestPriceRepository:
+    """Newest price per ticker in ``latest_prices``, one partition per shard.
+
+    Writes carry the price timestamp as their cell timestamp, so Cassandra's
+    last-write-wins keeps the newest price without a read-before-write.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+        self._upsert_stmt = session.prepare(
+            "INSERT INTO latest_prices (shard, ticker, ts, price, currency, source) "
+            "VALUES (?, ?, ?, ?, ?, ?) USING TIMESTAMP ?"
+        )
+        self._shard_stmt = session.prepare(
+            "SELECT ticker, ts, price, currency, source FROM latest_prices WHERE shard = ?"
+        )
+
+    def upsert_many(self, entities: Sequence[TickerPrice], concurrency: int = 32) -> None:
+        execute_concurrent_with_args(
+            self._session,
+            self._upsert_stmt,
+            [
+                (shard_of(e.ticker), e.ticker, e.ts, e.price, e.currency, e.source,
+                 (as_utc(e.ts) - _EPOCH) // timedelta(microseconds=1))
+                for e in entities
+            ],
+            concurrency=concurrency,
+        )
+
+    def get_all(self) -> list[TickerPrice]:
+        """Read every shard concurrently: ``SHARDS`` queries whatever the ticker count."""
+        results = execute_concurrent_with_args(
+            self._session, self._shard_stmt, [(shard,) for shard in range(SHARDS)]
+        )
+        return sorted(
+            (
+                TickerPrice(
+                    ticker=row.ticker, ts=row.ts, price=row.price,
+                    currency=row.currency, source=row.source,
+                )
+                for result in results
+                for row in result.result_or_exc
+            ),
+            key=lambda p: p.ticker,
+        )
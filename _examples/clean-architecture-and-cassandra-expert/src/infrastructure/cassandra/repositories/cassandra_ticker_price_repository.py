@@ -1,32 +1,132 @@
-from datetime import datetime
+from collections import defaultdict
+from collections.abc import Iterator, Mapping, Sequence
+from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
+from typing import Literal
 
+from cassandra import InvalidRequest
 from cassandra.cluster import Session
+from cassandra.concurrent import execute_concurrent, execute_concurrent_with_args
+from cassandra.protocol import ProtocolException
+from cassandra.query import BatchStatement, BatchType, BoundStatement, PreparedStatement
 
-from src.domain.entities.ticker_price import TickerPrice
+from src.domain.entities.candle import as_utc
+from src.domain.entities.price_columns import PriceColumns, PriceScales, decompose
+from src.domain.entities.ticker_price import TickerPrice, TickerPricePage
+from src.domain.repositories.ticker_price_repository import InvalidPagingStateError
+
+_MIN_TS = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MAX_TS = datetime(9999, 12, 31, tzinfo=timezone.utc)
+# Keeps each batch near Cassandra's default 5 KiB batch_size_warn_threshold.
+_MAX_BATCH_ROWS = 50
+# Rows loaded with a TTL counted from their ts never get less than this, so
+# history already past retention survives long enough to be archived.
+MIN_HISTORY_TTL = 30 * 86400
+
+PriceReadMode = Literal["decimal", "scaled"]
 
 
 class CassandraTickerPriceRepository:
-    def __init__(self, session: Session) -> None:
+    """Prices in ``ticker_prices``, dual-written as ``price`` and ``price_scaled``.
+
+    ``price_scaled`` holds ``price * 10**scale`` as a bigint, with the scale
+    fixed per currency in ``price_scales``. Writes raise
+    ``UnscalablePriceError`` for prices that do not fit their currency's
+    scale, so every row written here has both columns. In ``scaled`` read
+    mode queries fetch only the bigint: columnar reads pack it as is and
+    ``Decimal`` is only built for rows returned as entities. Rows written
+    before dual-writes need ``scripts/backfill_price_scaled.py`` first.
+
+    Rows expire after the table's default TTL unless their ``source`` has an
+    entry in ``source_ttls`` (seconds), which is then written ``USING TTL``.
+    Both count from the write. Bulk loads of history set ``ttl_from_ts`` and
+    pass the table's ``default_ttl`` (see ``table_default_ttl``) so every row
+    expires that long after its own ``ts`` instead, as live rows do.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        read_mode: PriceReadMode = "decimal",
+        source_ttls: Mapping[str, int] | None = None,
+        *,
+        default_ttl: int | None = None,
+        ttl_from_ts: bool = False,
+        scales: PriceScales | None = None,
+    ) -> None:
         self._session = session
+        self._source_ttls = dict(source_ttls or {})
+        self._default_ttl = default_ttl
+        self._ttl_from_ts = ttl_from_ts
+        self._scales = scales or load_price_scales(session)
+        self._read_scaled = read_mode == "scaled"
+        price_columns = "price_scaled" if self._read_scaled else "price"
+        columns = f"ticker, ts, {price_columns}, currency, source"
         self._insert_stmt = session.prepare(
-            "INSERT INTO ticker_prices (ticker, ts, price, currency, source) "
-            "VALUES (?, ?, ?, ?, ?)"
+            "INSERT INTO ticker_prices (ticker, ts, price, price_scaled, currency, source) "
+            "VALUES (?, ?, ?, ?, ?, ?)"
+        )
+        self._insert_ttl_stmt = session.prepare(
+            "INSERT INTO ticker_prices (ticker, ts, price, price_scaled, currency, source) "
+            "VALUES (?, ?, ?, ?, ?, ?) USING TTL ?"
         )
         self._select_stmt = session.prepare(
-            "SELECT ticker, ts, price, currency, source FROM ticker_prices "
-            "WHERE ticker = ?"
+            f"SELECT {columns} FROM ticker_prices WHERE ticker = ?"
+        )
+        self._range_stmt = session.prepare(
+            f"SELECT {columns} FROM ticker_prices WHERE ticker = ? AND ts >= ? AND ts <= ?"
+        )
+        self._latest_stmt = session.prepare(
+            f"SELECT {columns} FROM ticker_prices WHERE ticker = ? LIMIT 1"
+        )
+        self._as_of_stmt = session.prepare(
+            f"SELECT {columns} FROM ticker_prices WHERE ticker = ? AND ts <= ? LIMIT 1"
+        )
+        self._backfill_stmt = session.prepare(
+            "UPDATE ticker_prices SET price_scaled = ? WHERE ticker = ? AND ts = ?"
+        )
+        self._backfill_ttl_stmt = session.prepare(
+            "UPDATE ticker_prices USING TTL ? SET price_scaled = ? WHERE ticker = ? AND ts = ?"
         )
         self._exists_stmt = session.prepare(
             "SELECT ticker FROM ticker_prices WHERE ticker = ? AND ts = ?"
         )
+        self._tickers_stmt = session.prepare("SELECT DISTINCT ticker FROM ticker_prices")
+        self._token_range_stmt = session.prepare(
+            "SELECT ticker, ts, price, currency, source FROM ticker_prices "
+            "WHERE token(ticker) > ? AND token(ticker) <= ?"
+        )
+        self._ttl_scan_stmt = session.prepare(
+            "SELECT ticker, ts, TTL(price) AS ttl FROM ticker_prices"
+        )
 
     def insert(self, entity: TickerPrice) -> None:
-        self._session.execute(
-            self._insert_stmt,
-            (entity.ticker, entity.ts, entity.price, entity.currency, entity.source),
+        self._session.execute(*self._insert_for(entity))
+
+    def insert_many(self, entities: Sequence[TickerPrice], concurrency: int = 64) -> None:
+        """Write rows concurrently; prepared statements route each one to a replica."""
+        execute_concurrent(
+            self._session, [self._insert_for(e) for e in entities], concurrency=concurrency
         )
 
+    def insert_batch(self, entities: Sequence[TickerPrice], concurrency: int = 16) -> None:
+        """Write rows as UNLOGGED batches that each target a single partition.
+
+        A single-partition batch is applied as one mutation by one replica set,
+        unlike multi-partition batches which fan out through a coordinator.
+        """
+        by_ticker: dict[str, list[TickerPrice]] = defaultdict(list)
+        for entity in entities:
+            by_ticker[entity.ticker].append(entity)
+        batches = []
+        for rows in by_ticker.values():
+            for offset in range(0, len(rows), _MAX_BATCH_ROWS):
+                batch = BatchStatement(batch_type=BatchType.UNLOGGED)
+                for e in rows[offset : offset + _MAX_BATCH_ROWS]:
+                    batch.add(*self._insert_for(e))
+                batches.append((batch, None))
+        execute_concurrent(self._session, batches, concurrency=concurrency)
+
     def get_by_ticker(
         self,
         ticker: str,
@@ -34,33 +134,242 @@ class CassandraTickerPriceRepository:
         end: datetime | None = None,
     ) -> list[TickerPrice]:
         if start or end:
-            clauses = ["ticker = ?"]
-            params: list[str | datetime] = [ticker]
-            if start:
-                clauses.append("ts >= ?")
-                params.append(start)
-            if end:
-                clauses.append("ts <= ?")
-                params.append(end)
-            query = (
-                "SELECT ticker, ts, price, currency, source FROM ticker_prices "
-                f"WHERE {' AND '.join(clauses)}"
+            rows = self._session.execute(
+                self._range_stmt, (ticker, start or _MIN_TS, end or _MAX_TS)
             )
-            rows = self._session.execute(query, params)
         else:
             rows = self._session.execute(self._select_stmt, (ticker,))
 
-        return [
-            TickerPrice(
-                ticker=row.ticker,
-                ts=row.ts,
-                price=Decimal(str(row.price)),
-                currency=row.currency,
-                source=row.source,
+        return [self._to_entity(row) for row in rows]
+
+    def get_page(
+        self,
+        ticker: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        limit: int = 1000,
+        paging_state: bytes | None = None,
+    ) -> TickerPricePage:
+        try:
+            result = self._session.execute(
+                self._bind_range(ticker, start, end, limit), paging_state=paging_state
             )
-            for row in rows
-        ]
+        except (InvalidRequest, ProtocolException) as exc:
+            if paging_state is None:
+                raise
+            raise InvalidPagingStateError(str(exc)) from exc
+        return TickerPricePage(
+            prices=[self._to_entity(row) for row in result.current_rows],
+            paging_state=result.paging_state,
+        )
+
+    def iter_pages(
+        self,
+        ticker: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        page_size: int = 1000,
+    ) -> Iterator[list[TickerPrice]]:
+        """Yield one driver page at a time; only a single page is held in memory."""
+        result = self._session.execute(self._bind_range(ticker, start, end, page_size))
+        while True:
+            yield [self._to_entity(row) for row in result.current_rows]
+            if not result.has_more_pages:
+                return
+            result.fetch_next_page()
+
+    def iter_columns(
+        self,
+        ticker: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        page_size: int = 1000,
+    ) -> Iterator[PriceColumns]:
+        """Like ``iter_pages`` but packed into arrays without building ``Decimal`` rows."""
+        result = self._session.execute(self._bind_range(ticker, start, end, page_size))
+        while True:
+            rows = result.current_rows
+            yield PriceColumns.build(ticker, (self._to_column_row(r) for r in rows))
+            if not result.has_more_pages:
+                return
+            result.fetch_next_page()
+
+    def get_by_tickers(
+        self,
+        tickers: Sequence[str],
+        start: datetime | None = None,
+        end: datetime | None = None,
+        concurrency: int = 32,
+    ) -> dict[str, list[TickerPrice]]:
+        """Read several partitions at once, keeping up to ``concurrency`` queries in flight."""
+        results = execute_concurrent_with_args(
+            self._session,
+            self._range_stmt,
+            [(ticker, start or _MIN_TS, end or _MAX_TS) for ticker in tickers],
+            concurrency=concurrency,
+        )
+        return {
+            ticker: [self._to_entity(row) for row in result.result_or_exc]
+            for ticker, result in zip(tickers, results, strict=True)
+        }
+
+    def get_as_of(
+        self,
+        tickers: Sequence[str],
+        at: datetime,
+        concurrency: int = 32,
+    ) -> dict[str, TickerPrice | None]:
+        """Newest row at or before ``at`` per ticker: one single-row partition read each."""
+        results = execute_concurrent_with_args(
+            self._session,
+            self._as_of_stmt,
+            [(ticker, at) for ticker in tickers],
+            concurrency=concurrency,
+        )
+        found: dict[str, TickerPrice | None] = {}
+        for ticker, result in zip(tickers, results, strict=True):
+            row = result.result_or_exc.one()
+            found[ticker] = None if row is None else self._to_entity(row)
+        return found
+
+    def get_latest(self, ticker: str) -> TickerPrice | None:
+        row = self._session.execute(self._latest_stmt, (ticker,)).one()
+        return None if row is None else self._to_entity(row)
 
     def exists(self, ticker: str, ts: datetime) -> bool:
         result = self._session.execute(self._exists_stmt, (ticker, ts))
         return result.one() is not None
+
+    def list_tickers(self) -> list[str]:
+        return [row.ticker for row in self._session.execute(self._tickers_stmt)]
+
+    def scan_token_range(
+        self,
+        start_token: int,
+        end_token: int,
+        page_size: int = 5000,
+    ) -> Iterator[list[TickerPrice]]:
+        """Yield pages of every row whose partition token lies in (start_token, end_token]."""
+        bound = self._token_range_stmt.bind((start_token, end_token))
+        bound.fetch_size = page_size
+        result = self._session.execute(bound)
+        while True:
+            yield [self._to_entity(row) for row in result.current_rows]
+            if not result.has_more_pages:
+                return
+            result.fetch_next_page()
+
+    def expiring_days(self, within: timedelta, page_size: int = 5000) -> set[tuple[str, date]]:
+        """Every (ticker, UTC day) holding a row whose TTL runs out within ``within``.
+
+        Reads the key and remaining TTL of every row in the table, so it is
+        meant for a daily archive run, not for request handling.
+        """
+        horizon = within.total_seconds()
+        bound = self._ttl_scan_stmt.bind(())
+        bound.fetch_size = page_size
+        result = self._session.execute(bound)
+        days: set[tuple[str, date]] = set()
+        while True:
+            days.update(
+                (row.ticker, as_utc(row.ts).date())
+                for row in result.current_rows
+                if row.ttl is not None and row.ttl <= horizon
+            )
+            if not result.has_more_pages:
+                return days
+            result.fetch_next_page()
+
+    def backfill_price_scaled(self, entities: Sequence[TickerPrice], concurrency: int = 64) -> int:
+        """Set ``price_scaled`` on existing rows; returns how many could be scaled.
+
+        The update gets the same TTL an insert of the row would, so build the
+        repository with ``ttl_from_ts`` to keep the new cell expiring with its row.
+        """
+        statements = []
+        for e in entities:
+            scaled = self.scale_price(e.price, e.currency)
+            if scaled is None:
+                continue
+            ttl = self._ttl_for(e)
+            if ttl is None:
+                statements.append((self._backfill_stmt, (scaled, e.ticker, e.ts)))
+            else:
+                statements.append((self._backfill_ttl_stmt, (ttl, scaled, e.ticker, e.ts)))
+        execute_concurrent(self._session, statements, concurrency=concurrency)
+        return len(statements)
+
+    def scale_price(self, price: Decimal, currency: str) -> int | None:
+        """``price`` in units of ``10**-scale``, or None if that would lose digits or overflow."""
+        return self._scales.scale(price, currency)
+
+    def _insert_for(self, e: TickerPrice) -> tuple[PreparedStatement, tuple]:
+        scaled = self._scales.require(e.price, e.currency)
+        values = (e.ticker, e.ts, e.price, scaled, e.currency, e.source)
+        ttl = self._ttl_for(e)
+        if ttl is None:
+            # No USING TTL at all: an explicit TTL of 0 would disable the table default.
+            return self._insert_stmt, values
+        return self._insert_ttl_stmt, (*values, ttl)
+
+    def _ttl_for(self, e: TickerPrice) -> int | None:
+        if not self._ttl_from_ts:
+            return self._source_ttls.get(e.source)
+        ttl = self._source_ttls.get(e.source, self._default_ttl)
+        if ttl is None:
+            return None
+        age = int((datetime.now(timezone.utc) - as_utc(e.ts)).total_seconds())
+        return min(ttl, max(ttl - age, MIN_HISTORY_TTL))
+
+    def _to_entity(self, row) -> TickerPrice:
+        if self._read_scaled:
+            mantissa, exponent = self._scaled_parts(row)
+            price = Decimal(mantissa).scaleb(exponent)
+        else:
+            # The driver already decodes ``decimal`` into ``Decimal``; no str() round trip.
+            price = row.price
+        return TickerPrice(
+            ticker=row.ticker, ts=row.ts, price=price, currency=row.currency, source=row.source
+        )
+
+    def _to_column_row(self, row) -> tuple[datetime, int, int, str, str]:
+        if self._read_scaled:
+            mantissa, exponent = self._scaled_parts(row)
+        else:
+            mantissa, exponent = decompose(row.price)
+        return row.ts, mantissa, exponent, row.currency, row.source
+
+    def _scaled_parts(self, row) -> tuple[int, int]:
+        if row.price_scaled is None:
+            raise ValueError(
+                f"{row.ticker} @ {row.ts} has no price_scaled; run "
+                "scripts/backfill_price_scaled.py before reading in scaled mode"
+            )
+        return row.price_scaled, -self._scales.of(row.currency)
+
+    def _bind_range(
+        self,
+        ticker: str,
+        start: datetime | None,
+        end: datetime | None,
+        fetch_size: int,
+    ) -> BoundStatement:
+        bound = self._range_stmt.bind((ticker, start or _MIN_TS, end or _MAX_TS))
+        bound.fetch_size = fetch_size
+        return bound
+
+
+def load_price_scales(session: Session) -> PriceScales:
+    """The per-currency scales in ``price_scales``."""
+    rows = session.execute("SELECT currency, scale FROM price_scales")
+    return PriceScales({row.currency: row.scale for row in rows})
+
+
+def table_default_ttl(session: Session) -> int | None:
+    """``ticker_prices``' default_time_to_live in seconds, or None if it has none."""
+    row = session.execute(
+        "SELECT default_time_to_live FROM system_schema.tables "
+        "WHERE keyspace_name = %s AND table_name = 'ticker_prices'",
+        (session.keyspace,),
+    ).one()
+    return row.default_time_to_live if row and row.default_time_to_live else None
@@ -1,5 +1,5 @@
 from cassandra.cluster import Cluster, Session
-from cassandra.policies import RoundRobinPolicy
+from cassandra.policies import RoundRobinPolicy, TokenAwarePolicy
 
 
 def create_session(
@@ -8,7 +8,7 @@ def create_session(
 ) -> Session:
     cluster = Cluster(
         contact_points=contact_points or ["127.0.0.1"],
-        load_balancing_policy=RoundRobinPolicy(),
+        load_balancing_policy=TokenAwarePolicy(RoundRobinPolicy()),
     )
     session = cluster.connect()
     session.set_keyspace(keyspace)
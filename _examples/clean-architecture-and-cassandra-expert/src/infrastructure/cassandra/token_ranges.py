@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+# Murmur3Partitioner never assigns MIN_TOKEN to a key, so (MIN_TOKEN, MAX_TOKEN]
+# covers every partition exactly once.
+MIN_TOKEN = -(2**63)
+MAX_TOKEN = 2**63 - 1
+
+
+@dataclass(frozen=True)
+class TokenRange:
+    index: int
+    start: int
+    end: int
+
+
+def split_token_ring(splits: int) -> list[TokenRange]:
+    """Cut (MIN_TOKEN, MAX_TOKEN] into ``splits`` contiguous, non-overlapping ranges."""
+    width = (MAX_TOKEN - MIN_TOKEN) // splits
+    bounds = [MIN_TOKEN + i * width for i in range(splits)] + [MAX_TOKEN]
+    return [TokenRange(i, bounds[i], bounds[i + 1]) for i in range(splits)]
@@ -0,0 +1,269 @@
+"""Bloom-filter pre-check that lets most inserts skip the ``exists`` read.
+
+Keys are kept in one scalable Bloom filter per (ticker, UTC day). Filters
+cover a sliding window of ``days`` days: a ticker's window is loaded from
+Cassandra in the background the first time it is checked, and updated by
+every insert that goes through this repository. For a warmed ticker and a
+day inside the window a negative answer is definitive, so ``exists`` only
+reaches the database for "possibly present" keys, for days outside the
+window and for tickers that are still warming.
+
+A negative is only sound if no other process writes the ticker, so the
+filter only answers for tickers this process owns (``owns``, e.g. one shard
+of ``shard_owner``); every other ticker goes to the database. A definitive
+"new" also records the key at once, so a concurrent check of the same key
+is sent to the database instead of being told "new" too.
+"""
+
+import hashlib
+import logging
+import math
+import queue
+import threading
+import zlib
+from collections.abc import Callable, Sequence
+from datetime import date, datetime, time, timedelta, timezone
+
+import numpy as np
+
+from src.domain.entities.candle import as_utc
+from src.domain.entities.ticker_price import TickerPrice
+from src.domain.repositories.ticker_price_repository import TickerPriceRepository
+from src.infrastructure.decorators.delegating import DelegatingTickerPriceRepository
+from src.infrastructure.metrics import MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over bytes keys, sized for ``capacity`` at ``fp_rate``."""
+
+    def __init__(self, capacity: int, fp_rate: float) -> None:
+        self.capacity = capacity
+        self.bits = max(8, math.ceil(-capacity * math.log(fp_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.bits / capacity * math.log(2)))
+        self.count = 0
+        self._array = np.zeros((self.bits + 7) // 8, dtype=np.uint8)
+        self._steps = np.arange(self.hashes, dtype=np.uint64)
+
+    @property
+    def nbytes(self) -> int:
+        return self._array.nbytes
+
+    @property
+    def estimated_fp_rate(self) -> float:
+        return (1 - math.exp(-self.hashes * self.count / self.bits)) ** self.hashes
+
+    def add(self, key: bytes) -> None:
+        positions = self._positions(key)
+        np.bitwise_or.at(self._array, positions >> 3, (1 << (positions & 7)).astype(np.uint8))
+        self.count += 1
+
+    def might_contain(self, key: bytes) -> bool:
+        positions = self._positions(key)
+        return bool(np.all(self._array[positions >> 3] & (1 << (positions & 7))))
+
+    def _positions(self, key: bytes) -> np.ndarray:
+        # Kirsch-Mitzenmacher: k indices from two independent 64-bit hashes.
+        digest = hashlib.blake2b(key, digest_size=16).digest()
+        h1 = np.uint64(int.from_bytes(digest[:8], "little"))
+        h2 = np.uint64(int.from_bytes(digest[8:], "little") | 1)
+        with np.errstate(over="ignore"):
+            return (h1 + self._steps * h2) % np.uint64(self.bits)
+
+
+class ScalableBloomFilter:
+    """Chain of Bloom filters that grows as keys arrive, keeping the FP rate bounded.
+
+    Each new stage doubles capacity and halves its FP rate, so the compound
+    rate stays below ``2 * fp_rate`` however many keys are added.
+    """
+
+    def __init__(self, initial_capacity: int, fp_rate: float) -> None:
+        self._stages = [BloomFilter(initial_capacity, fp_rate / 2)]
+
+    @property
+    def count(self) -> int:
+        return sum(s.count for s in self._stages)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(s.nbytes for s in self._stages)
+
+    @property
+    def estimated_fp_rate(self) -> float:
+        miss = 1.0
+        for stage in self._stages:
+            miss *= 1 - stage.estimated_fp_rate
+        return 1 - miss
+
+    def add(self, key: bytes) -> None:
+        stage = self._stages[-1]
+        if stage.count >= stage.capacity:
+            fp_rate = (1 - math.exp(-stage.hashes * stage.capacity / stage.bits)) ** stage.hashes
+            stage = BloomFilter(stage.capacity * 2, fp_rate / 2)
+            self._stages.append(stage)
+        stage.add(key)
+
+    def might_contain(self, key: bytes) -> bool:
+        return any(stage.might_contain(key) for stage in self._stages)
+
+
+def shard_owner(shard: int, shards: int) -> Callable[[str], bool]:
+    """Ownership test for the tickers with ``crc32(ticker) % shards == shard``."""
+    if not 0 <= shard < shards:
+        raise ValueError(f"shard {shard} is not in [0, {shards})")
+    return lambda ticker: zlib.crc32(ticker.encode()) % shards == shard
+
+
+class BloomFilteredTickerPriceRepository(DelegatingTickerPriceRepository):
+    def __init__(
+        self,
+        inner: TickerPriceRepository,
+        metrics: MetricsRegistry,
+        owns: Callable[[str], bool],
+        days: int = 2,
+        fp_rate: float = 0.01,
+        initial_capacity: int = 4096,
+        today: Callable[[], date] = lambda: datetime.now(timezone.utc).date(),
+    ) -> None:
+        super().__init__(inner)
+        self._owns = owns
+        self._days = days
+        self._fp_rate = fp_rate
+        self._initial_capacity = initial_capacity
+        self._today = today
+        self._filters: dict[tuple[str, date], ScalableBloomFilter] = {}
+        # Per warmed ticker, the first day it covers; earlier days go to the database.
+        self._covered_from: dict[str, date] = {}
+        self._window_start: date | None = None
+        self._queued: set[str] = set()
+        self._warm_queue: queue.Queue[str] = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+        self._skipped = metrics.counter(
+            "ticker_bloom_skipped_exists_total", "exists() answered by the filter alone"
+        )
+        self._checked = metrics.counter(
+            "ticker_bloom_checked_exists_total", "exists() that needed a database read"
+        )
+        self._false_positives = metrics.counter(
+            "ticker_bloom_false_positives_total", "Database reads where the key was absent"
+        )
+        metrics.gauge("ticker_bloom_memory_bytes", "Filter bit-array bytes", self.memory_bytes)
+        metrics.gauge(
+            "ticker_bloom_estimated_fp_rate", "Key-weighted estimated FP rate", self.fp_rate
+        )
+
+    def insert(self, entity: TickerPrice) -> None:
+        self._remember([entity])
+        self._inner.insert(entity)
+
+    def insert_many(self, entities: Sequence[TickerPrice], concurrency: int = 64) -> None:
+        self._remember(entities)
+        self._inner.insert_many(entities, concurrency=concurrency)
+
+    def insert_batch(self, entities: Sequence[TickerPrice], concurrency: int = 16) -> None:
+        self._remember(entities)
+        self._inner.insert_batch(entities, concurrency=concurrency)
+
+    def exists(self, ticker: str, ts: datetime) -> bool:
+        day = as_utc(ts).date()
+        owned = self._owns(ticker)
+        with self._lock:
+            oldest = self._expire()
+            covered_from = self._covered_from.get(ticker)
+            covered = owned and covered_from is not None and day >= max(covered_from, oldest)
+            key = _key(ticker, ts)
+            bloom = self._filters.get((ticker, day))
+            definitely_new = covered and (bloom is None or not bloom.might_contain(key))
+            if definitely_new:
+                # Claimed under the same lock: a racing check of this key sees "possibly".
+                self._filter(ticker, day).add(key)
+            elif owned and covered_from is None and ticker not in self._queued:
+                self._queued.add(ticker)
+                self._warm_queue.put(ticker)
+        if definitely_new:
+            self._skipped.inc()
+            return False
+        self._checked.inc()
+        found = self._inner.exists(ticker, ts)
+        if covered and not found:
+            self._false_positives.inc()
+        return found
+
+    def warm(self, ticker: str) -> int:
+        """Load ``ticker``'s window from Cassandra, then start trusting its negatives."""
+        start_day = self._today() - timedelta(days=self._days - 1)
+        start = datetime.combine(start_day, time(), tzinfo=timezone.utc)
+        loaded = 0
+        for page in self._inner.iter_pages(ticker, start=start, page_size=5000):
+            self._remember(page)
+            loaded += len(page)
+        with self._lock:
+            self._covered_from[ticker] = start_day
+            self._queued.discard(ticker)
+        logger.info("Bloom filter of %s warmed with %d prices since %s", ticker, loaded, start_day)
+        return loaded
+
+    def start(self) -> None:
+        """Warm tickers in the background as they are first checked."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="bloom-warm", daemon=True)
+            self._thread.start()
+
+    def memory_bytes(self) -> int:
+        with self._lock:
+            return sum(f.nbytes for f in self._filters.values())
+
+    def fp_rate(self) -> float:
+        with self._lock:
+            total = sum(f.count for f in self._filters.values())
+            weighted = sum(f.estimated_fp_rate * f.count for f in self._filters.values())
+        return weighted / total if total else 0.0
+
+    def _remember(self, entities: Sequence[TickerPrice]) -> None:
+        oldest = self._today() - timedelta(days=self._days - 1)
+        with self._lock:
+            for entity in entities:
+                day = as_utc(entity.ts).date()
+                if day < oldest or not self._owns(entity.ticker):
+                    continue  # exists() reads Cassandra for these anyway
+                self._filter(entity.ticker, day).add(_key(entity.ticker, entity.ts))
+
+    def _filter(self, ticker: str, day: date) -> ScalableBloomFilter:
+        bloom = self._filters.get((ticker, day))
+        if bloom is None:
+            bloom = self._filters[(ticker, day)] = ScalableBloomFilter(
+                self._initial_capacity, self._fp_rate
+            )
+        return bloom
+
+    def _expire(self) -> date:
+        """Drop filters of days that left the window; returns its first day."""
+        oldest = self._today() - timedelta(days=self._days - 1)
+        if self._window_start != oldest:
+            self._window_start = oldest
+            for key in [k for k in self._filters if k[1] < oldest]:
+                del self._filters[key]
+        return oldest
+
+    def _run(self) -> None:
+        while True:
+            ticker = self._warm_queue.get()
+            try:
+                self.warm(ticker)
+            except Exception:
+                logger.exception("Bloom warm-up of %s failed; retried on its next check", ticker)
+                with self._lock:
+                    self._queued.discard(ticker)
+
+
+def _key(ticker: str, ts: datetime) -> bytes:
+    # Cassandra stores millisecond timestamps, so two inserts that differ only
+    # below a millisecond are the same row.
+    millis = (as_utc(ts) - _EPOCH) // timedelta(milliseconds=1)
+    return f"{ticker}|{millis}".encode()
@@ -0,0 +1,98 @@
+from collections.abc import Iterator, Sequence
+from datetime import datetime
+
+from src.domain.entities.price_columns import PriceColumns
+from src.domain.entities.ticker_price import TickerPrice, TickerPricePage
+from src.domain.repositories.ticker_price_repository import TickerPriceRepository
+
+
+class DelegatingTickerPriceRepository:
+    """Pass-through ``TickerPriceRepository``; decorators override what they change."""
+
+    def __init__(self, inner: TickerPriceRepository) -> None:
+        self._inner = inner
+
+    @property
+    def inner(self) -> TickerPriceRepository:
+        return self._inner
+
+    def insert(self, entity: TickerPrice) -> None:
+        self._inner.insert(entity)
+
+    def insert_many(self, entities: Sequence[TickerPrice], concurrency: int = 64) -> None:
+        self._inner.insert_many(entities, concurrency=concurrency)
+
+    def insert_batch(self, entities: Sequence[TickerPrice], concurrency: int = 16) -> None:
+        self._inner.insert_batch(entities, concurrency=concurrency)
+
+    def get_by_ticker(
+        self,
+        ticker: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> list[TickerPrice]:
+        return self._inner.get_by_ticker(ticker, start=start, end=end)
+
+    def get_page(
+        self,
+        ticker: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        limit: int = 1000,
+        paging_state: bytes | None = None,
+    ) -> TickerPricePage:
+        return self._inner.get_page(
+            ticker, start=start, end=end, limit=limit, paging_state=paging_state
+        )
+
+    def iter_pages(
+        self,
+        ticker: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        page_size: int = 1000,
+    ) -> Iterator[list[TickerPrice]]:
+        return self._inner.iter_pages(ticker, start=start, end=end, page_size=page_size)
+
+    def iter_columns(
+        self,
+        ticker: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        page_size: int = 1000,
+    ) -> Iterator[PriceColumns]:
+        return self._inner.iter_columns(ticker, start=start, end=end, page_size=page_size)
+
+    def get_by_tickers(
+        self,
+        tickers: Sequence[str],
+        start: datetime | None = None,
+        end: datetime | None = None,
+        concurrency: int = 32,
+    ) -> dict[str, list[TickerPrice]]:
+        return self._inner.get_by_tickers(tickers, start=start, end=end, concurrency=concurrency)
+
+    def get_as_of(
+        self,
+        tickers: Sequence[str],
+        at: datetime,
+        concurrency: int = 32,
+    ) -> dict[str, TickerPrice | None]:
+        return self._inner.get_as_of(tickers, at, concurrency=concurrency)
+
+    def get_latest(self, ticker: str) -> TickerPrice | None:
+        return self._inner.get_latest(ticker)
+
+    def exists(self, ticker: str, ts: datetime) -> bool:
+        return self._inner.exists(ticker, ts)
+
+    def list_tickers(self) -> list[str]:
+        return self._inner.list_tickers()
+
+    def scan_token_range(
+        self,
+        start_token: int,
+        end_token: int,
+        page_size: int = 5000,
+    ) -> Iterator[list[TickerPrice]]:
+        return self._inner.scan_token_range(start_token, end_token, page_size=page_size)
@@ -0,0 +1,38 @@
+from collections.abc import Sequence
+
+from src.application.use_cases.insert_ticker_price import TickerPriceListener
+from src.domain.entities.ticker_price import TickerPrice
+from src.domain.repositories.ticker_price_repository import TickerPriceRepository
+from src.infrastructure.decorators.delegating import DelegatingTickerPriceRepository
+
+
+class NotifyingTickerPriceRepository(DelegatingTickerPriceRepository):
+    """Tells ``listeners`` about every row once its write to ``inner`` returned.
+
+    Placed below the write buffers this is when the row is readable from
+    Cassandra, not when it was accepted, which is what caches of database
+    answers need to invalidate on.
+    """
+
+    def __init__(
+        self, inner: TickerPriceRepository, listeners: Sequence[TickerPriceListener]
+    ) -> None:
+        super().__init__(inner)
+        self._listeners = listeners
+
+    def insert(self, entity: TickerPrice) -> None:
+        self._inner.insert(entity)
+        self._notify([entity])
+
+    def insert_many(self, entities: Sequence[TickerPrice], concurrency: int = 64) -> None:
+        self._inner.insert_many(entities, concurrency=concurrency)
+        self._notify(entities)
+
+    def insert_batch(self, entities: Sequence[TickerPrice], concurrency: int = 16) -> None:
+        self._inner.insert_batch(entities, concurrency=concurrency)
+        self._notify(entities)
+
+    def _notify(self, entities: Sequence[TickerPrice]) -> None:
+        for entity in entities:
+            for listener in self._listeners:
+                listener.on_inserted(entity)
@@ -0,0 +1,41 @@
+import threading
+from collections import Counter
+from collections.abc import Iterable
+from datetime import datetime
+
+from src.domain.entities.candle import as_utc
+from src.domain.entities.ticker_price import TickerPrice
+
+
+class PendingKeys:
+    """Multiset of (ticker, ts) keys acknowledged to callers but not yet in Cassandra.
+
+    Buffering decorators consult it in ``exists`` so duplicate detection still
+    sees rows that have only been accepted locally.
+    """
+
+    def __init__(self) -> None:
+        self._keys: Counter[tuple[str, datetime]] = Counter()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._keys.total()
+
+    def __contains__(self, key: tuple[str, datetime]) -> bool:
+        ticker, ts = key
+        with self._lock:
+            return self._keys[(ticker, as_utc(ts))] > 0
+
+    def add_many(self, entities: Iterable[TickerPrice]) -> None:
+        with self._lock:
+            for entity in entities:
+                self._keys[(entity.ticker, as_utc(entity.ts))] += 1
+
+    def discard_many(self, entities: Iterable[TickerPrice]) -> None:
+        with self._lock:
+            for entity in entities:
+                key = (entity.ticker, as_utc(entity.ts))
+                if self._keys[key] <= 1:
+                    self._keys.pop(key, None)
+                else:
+                    self._keys[key] -= 1
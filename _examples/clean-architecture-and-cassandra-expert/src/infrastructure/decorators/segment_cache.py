@@ -0,0 +1,285 @@
+"""In-memory cache of closed history segments in front of a price repository.
+
+Ticks older than the live window are treated as immutable, so each closed
+UTC day of a ticker is read from Cassandra once, packed into numpy arrays and
+kept under a byte budget with LRU eviction. A bounded range read is answered
+from those segments plus a query for the still-open tail only.
+
+Writes that go through this repository invalidate the segment they touch.
+Rows written by other processes into an already closed day (late backfills)
+stay invisible here until the segment is evicted or the process restarts.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+
+import numpy as np
+
+from src.domain.entities.candle import as_utc
+from src.domain.entities.price_columns import PriceColumns
+from src.domain.entities.ticker_price import TickerPrice
+from src.domain.repositories.ticker_price_repository import TickerPriceRepository
+from src.infrastructure.decorators.delegating import DelegatingTickerPriceRepository
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_DAY = timedelta(days=1)
+_SEGMENT_OVERHEAD_BYTES = 512
+
+SegmentKey = tuple[str, date]
+
+
+@dataclass(frozen=True)
+class Segment:
+    """One closed UTC day of a ticker as packed ``PriceColumns`` (~19 bytes per tick).
+
+    Prices are stored as an int64 mantissa plus an int8 exponent so each
+    ``Decimal`` round-trips with its original scale.
+    """
+
+    columns: PriceColumns
+
+    @classmethod
+    def encode(cls, ticker: str, prices: Sequence[TickerPrice]) -> "Segment | None":
+        """Pack newest-first ``prices``; None if a price does not fit the packed form."""
+        try:
+            return cls(PriceColumns.from_prices(ticker, prices))
+        except ValueError:
+            return None
+
+    @property
+    def nbytes(self) -> int:
+        return self.columns.nbytes + _SEGMENT_OVERHEAD_BYTES
+
+    def select(self, start: datetime, end: datetime | None) -> PriceColumns:
+        """Rows with ``start <= ts <= end``, newest first like the database."""
+        ascending = self.columns.micros[::-1]
+        count = len(ascending)
+        lo = int(np.searchsorted(ascending, _to_micros(start), side="left"))
+        hi = count
+        if end is not None:
+            hi = int(np.searchsorted(ascending, _to_micros(end), side="right"))
+        return self.columns.slice(count - hi, count - lo)
+
+    def decode(self, start: datetime, end: datetime | None) -> list[TickerPrice]:
+        return self.select(start, end).to_prices()
+
+
+class SegmentStore:
+    """Thread-safe LRU of segments bounded by their packed size in bytes."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._segments: OrderedDict[SegmentKey, Segment] = OrderedDict()
+        # Bumped on invalidation so a load that raced with a write is not cached.
+        self._versions: dict[SegmentKey, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._segments)
+
+    def get(self, key: SegmentKey) -> Segment | None:
+        with self._lock:
+            segment = self._segments.get(key)
+            if segment is None:
+                self.misses += 1
+                return None
+            self._segments.move_to_end(key)
+            self.hits += 1
+            return segment
+
+    def version(self, key: SegmentKey) -> int:
+        return self._versions.get(key, 0)
+
+    def put(self, key: SegmentKey, segment: Segment, version: int) -> None:
+        if segment.nbytes > self.max_bytes:
+            return
+        with self._lock:
+            if self._versions.get(key, 0) != version:
+                return
+            self._drop(key)
+            self._segments[key] = segment
+            self.bytes += segment.nbytes
+            while self.bytes > self.max_bytes:
+                self._drop(next(iter(self._segments)))
+
+    def discard(self, key: SegmentKey) -> None:
+        with self._lock:
+            self._versions[key] = self._versions.get(key, 0) + 1
+            self._drop(key)
+
+    def _drop(self, key: SegmentKey) -> None:
+        segment = self._segments.pop(key, None)
+        if segment is not None:
+            self.bytes -= segment.nbytes
+
+
+class SegmentCachedTickerPriceRepository(DelegatingTickerPriceRepository):
+    """Serves closed days from a ``SegmentStore`` and the live tail from ``inner``.
+
+    Only reads with a ``start`` bound are cached: without one the set of days
+    is unknown and the read goes straight to the database.
+    """
+
+    def __init__(
+        self,
+        inner: TickerPriceRepository,
+        store: SegmentStore,
+        live_window: timedelta = timedelta(minutes=5),
+        now: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+        load_page_size: int = 5000,
+    ) -> None:
+        super().__init__(inner)
+        self._store = store
+        self._live_window = live_window
+        self._now = now
+        self._load_page_size = load_page_size
+
+    def insert(self, entity: TickerPrice) -> None:
+        self._inner.insert(entity)
+        self._store.discard(_key(entity))
+
+    def insert_many(self, entities: Sequence[TickerPrice], concurrency: int = 64) -> None:
+        self._inner.insert_many(entities, concurrency=concurrency)
+        for key in {_key(e) for e in entities}:
+            self._store.discard(key)
+
+    def insert_batch(self, entities: Sequence[TickerPrice], concurrency: int = 16) -> None:
+        self._inner.insert_batch(entities, concurrency=concurrency)
+        for key in {_key(e) for e in entities}:
+            self._store.discard(key)
+
+    def get_by_ticker(
+        self,
+        ticker: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> list[TickerPrice]:
+        if start is None:
+            return self._inner.get_by_ticker(ticker, start=start, end=end)
+        start, end = as_utc(start), end and as_utc(end)
+        tail_start, days = self._plan(start, end)
+        prices = [] if tail_start is None else self._inner.get_by_ticker(ticker, tail_start, end)
+        for cached in self._segments(ticker, days):
+            prices.extend(_slice(cached, start, end))
+        return prices
+
+    def iter_pages(
+        self,
+        ticker: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        page_size: int = 1000,
+    ) -> Iterator[list[TickerPrice]]:
+        if start is None:
+            yield from self._inner.iter_pages(ticker, start=start, end=end, page_size=page_size)
+            return
+        start, end = as_utc(start), end and as_utc(end)
+        tail_start, days = self._plan(start, end)
+        if tail_start is not None:
+            yield from self._inner.iter_pages(ticker, tail_start, end, page_size=page_size)
+        for cached in self._segments(ticker, days):
+            rows = _slice(cached, start, end)
+            for offset in range(0, len(rows), page_size):
+                yield rows[offset : offset + page_size]
+
+    def iter_columns(
+        self,
+        ticker: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        page_size: int = 1000,
+    ) -> Iterator[PriceColumns]:
+        if start is None:
+            yield from self._inner.iter_columns(ticker, start=start, end=end, page_size=page_size)
+            return
+        start, end = as_utc(start), end and as_utc(end)
+        tail_start, days = self._plan(start, end)
+        if tail_start is not None:
+            yield from self._inner.iter_columns(ticker, tail_start, end, page_size=page_size)
+        for cached in self._segments(ticker, days):
+            if isinstance(cached, Segment):
+                yield cached.select(start, end)
+            else:
+                yield PriceColumns.from_prices(ticker, _slice(cached, start, end))
+
+    def _plan(self, start: datetime, end: datetime | None) -> tuple[datetime | None, list[date]]:
+        """Split [start, end] into an open tail (if any) and closed days, newest first."""
+        cutoff = datetime.combine(
+            (self._now() - self._live_window).date(), time(), tzinfo=timezone.utc
+        )
+        tail_start = max(start, cutoff) if end is None or end >= cutoff else None
+        last = (cutoff - _DAY if end is None or end >= cutoff else end).date()
+        days = [last - timedelta(days=i) for i in range((last - start.date()).days + 1)]
+        return tail_start, days
+
+    def _segments(
+        self, ticker: str, days: list[date]
+    ) -> Iterator[Segment | list[TickerPrice]]:
+        """Yield each day's segment newest first, loading runs of misses in one query."""
+        missing: list[date] = []
+        for day in days:
+            segment = self._store.get((ticker, day))
+            if segment is not None:
+                yield from self._load(ticker, missing)
+                missing = []
+                yield segment
+            else:
+                missing.append(day)
+        yield from self._load(ticker, missing)
+
+    def _load(self, ticker: str, days: list[date]) -> Iterator[Segment | list[TickerPrice]]:
+        """Read contiguous ``days`` (newest first) in one query, caching each one's segment.
+
+        Rows arrive newest first, so a day is complete and yielded as soon as
+        the pages move past it: only one day is ever buffered.
+        """
+        if not days:
+            return
+        versions = {day: self._store.version((ticker, day)) for day in days}
+        start = datetime.combine(days[-1], time(), tzinfo=timezone.utc)
+        end = datetime.combine(days[0], time(), tzinfo=timezone.utc) + _DAY
+        pages = self._inner.iter_pages(
+            ticker, start, end - timedelta(milliseconds=1), page_size=self._load_page_size
+        )
+        pending = iter(days)
+        day, rows = next(pending), []
+        for page in pages:
+            for price in page:
+                while as_utc(price.ts).date() < day:
+                    yield self._cache(ticker, day, rows, versions[day])
+                    day, rows = next(pending), []
+                rows.append(price)
+        yield self._cache(ticker, day, rows, versions[day])
+        for day in pending:
+            yield self._cache(ticker, day, [], versions[day])
+
+    def _cache(
+        self, ticker: str, day: date, prices: list[TickerPrice], version: int
+    ) -> Segment | list[TickerPrice]:
+        segment = Segment.encode(ticker, prices)
+        if segment is None:
+            return prices
+        self._store.put((ticker, day), segment, version)
+        return segment
+
+
+def _key(entity: TickerPrice) -> SegmentKey:
+    return entity.ticker, as_utc(entity.ts).date()
+
+
+def _to_micros(ts: datetime) -> int:
+    return (as_utc(ts) - _EPOCH) // timedelta(microseconds=1)
+
+
+def _slice(
+    cached: Segment | list[TickerPrice], start: datetime, end: datetime | None
+) -> list[TickerPrice]:
+    if isinstance(cached, Segment):
+        return cached.decode(start, end)
+    return [p for p in cached if start <= as_utc(p.ts) and (end is None or as_utc(p.ts) <= end)]
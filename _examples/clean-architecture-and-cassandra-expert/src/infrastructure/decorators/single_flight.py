@@ -0,0 +1,136 @@
+"""Request coalescing: concurrent identical reads share one Cassandra query.
+
+While a ``get_by_ticker`` for a given (ticker, start, end) is in flight, any
+other thread asking for exactly the same thing waits for that query instead of
+issuing its own, and gets a copy of its result. Nothing is cached: once the
+query returns, the next caller queries again.
+
+Inserts forget the in-flight reads of their ticker, so a read started after
+an insert was acknowledged never joins one that may predate it.
+"""
+
+import threading
+from collections.abc import Callable, Hashable, Sequence
+from datetime import datetime
+from typing import Any
+
+from src.domain.entities.ticker_price import TickerPrice
+from src.domain.repositories.ticker_price_repository import TickerPriceRepository
+from src.infrastructure.decorators.delegating import DelegatingTickerPriceRepository
+from src.infrastructure.metrics import MetricsRegistry
+
+
+class _Call:
+    __slots__ = ("done", "error", "result")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Runs at most one ``fn`` per key at a time; concurrent callers share its outcome."""
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self._waiting = 0
+
+    @property
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+    @property
+    def waiting(self) -> int:
+        """Callers currently blocked on another caller's ``fn``."""
+        with self._lock:
+            return self._waiting
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> tuple[Any, bool]:
+        """``(result, shared)``; ``shared`` is True when another caller's ``fn`` ran.
+
+        Exceptions raised by ``fn`` propagate to every caller sharing it.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self._waiting += 1
+        if not leader:
+            call.done.wait()
+            with self._lock:
+                self._waiting -= 1
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def forget(self, matches: Callable[[Hashable], bool]) -> None:
+        """Stop new callers from joining in-flight calls whose key ``matches``."""
+        with self._lock:
+            for key in [k for k in self._calls if matches(k)]:
+                del self._calls[key]
+
+
+class SingleFlightTickerPriceRepository(DelegatingTickerPriceRepository):
+    def __init__(self, inner: TickerPriceRepository, metrics: MetricsRegistry) -> None:
+        super().__init__(inner)
+        self._flights = SingleFlight()
+        self._queries = metrics.counter(
+            "ticker_single_flight_queries_total", "get_by_ticker calls that queried Cassandra"
+        )
+        self._shared = metrics.counter(
+            "ticker_single_flight_shared_total", "get_by_ticker calls served by a shared query"
+        )
+        metrics.gauge(
+            "ticker_single_flight_coalescing_ratio",
+            "Share of get_by_ticker calls that needed no query of their own",
+            self.coalescing_ratio,
+        )
+
+    def coalescing_ratio(self) -> float:
+        total = self._queries.value + self._shared.value
+        return self._shared.value / total if total else 0.0
+
+    def insert(self, entity: TickerPrice) -> None:
+        self._inner.insert(entity)
+        self._forget([entity])
+
+    def insert_many(self, entities: Sequence[TickerPrice], concurrency: int = 64) -> None:
+        self._inner.insert_many(entities, concurrency=concurrency)
+        self._forget(entities)
+
+    def insert_batch(self, entities: Sequence[TickerPrice], concurrency: int = 16) -> None:
+        self._inner.insert_batch(entities, concurrency=concurrency)
+        self._forget(entities)
+
+    def get_by_ticker(
+        self,
+        ticker: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> list[TickerPrice]:
+        prices, shared = self._flights.do(
+            (ticker, start, end), lambda: self._inner.get_by_ticker(ticker, start=start, end=end)
+        )
+        (self._shared if shared else self._queries).inc()
+        # Every caller gets its own list; the prices themselves are immutable.
+        return list(prices)
+
+    def _forget(self, entities: Sequence[TickerPrice]) -> None:
+        tickers = {e.ticker for e in entities}
+        self._flights.forget(lambda key: key[0] in tickers)
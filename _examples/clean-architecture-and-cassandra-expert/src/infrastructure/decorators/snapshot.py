@@ -0,0 +1,39 @@
+from collections.abc import Sequence
+
+from src.domain.entities.candle import as_utc
+from src.domain.entities.ticker_price import TickerPrice
+from src.domain.repositories.latest_price_repository import LatestPriceRepository
+from src.domain.repositories.ticker_price_repository import TickerPriceRepository
+from src.infrastructure.decorators.delegating import DelegatingTickerPriceRepository
+
+
+class SnapshotTickerPriceRepository(DelegatingTickerPriceRepository):
+    """Keeps the latest-price snapshot in step with every write that reaches ``inner``.
+
+    Bulk writes only upsert the newest row of each ticker in the batch.
+    """
+
+    def __init__(self, inner: TickerPriceRepository, snapshot: LatestPriceRepository) -> None:
+        super().__init__(inner)
+        self._snapshot = snapshot
+
+    def insert(self, entity: TickerPrice) -> None:
+        self._inner.insert(entity)
+        self._snapshot.upsert_many([entity])
+
+    def insert_many(self, entities: Sequence[TickerPrice], concurrency: int = 64) -> None:
+        self._inner.insert_many(entities, concurrency=concurrency)
+        self._snapshot.upsert_many(newest_per_ticker(entities))
+
+    def insert_batch(self, entities: Sequence[TickerPrice], concurrency: int = 16) -> None:
+        self._inner.insert_batch(entities, concurrency=concurrency)
+        self._snapshot.upsert_many(newest_per_ticker(entities))
+
+
+def newest_per_ticker(entities: Sequence[TickerPrice]) -> list[TickerPrice]:
+    newest: dict[str, TickerPrice] = {}
+    for entity in entities:
+        current = newest.get(entity.ticker)
+        if current is None or as_utc(entity.ts) > as_utc(current.ts):
+            newest[entity.ticker] = entity
+    return list(newest.values())
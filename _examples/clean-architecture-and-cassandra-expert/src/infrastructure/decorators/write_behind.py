@@ -0,0 +1,154 @@
+"""Write-behind buffering for price inserts.
+
+``insert`` only enqueues the row; a flusher thread drains the queue into
+per-ticker UNLOGGED batches once ``flush_rows`` rows are waiting or
+``flush_interval`` seconds after the oldest one arrived, whichever comes
+first. A single-partition unlogged batch is applied as one mutation, so a
+burst costs a handful of round trips instead of one per row.
+
+The queue is bounded: when it is full ``insert`` blocks for up to
+``put_timeout`` seconds and then raises ``RepositoryBusyError``, pushing
+back on clients instead of growing memory. Rows acknowledged but not yet
+flushed are lost if the process dies, which is the trade-off for latency.
+"""
+
+import logging
+import queue
+import threading
+import time
+from collections.abc import Sequence
+from datetime import datetime
+
+from src.domain.entities.ticker_price import TickerPrice
+from src.domain.repositories.ticker_price_repository import (
+    RepositoryBusyError,
+    TickerPriceRepository,
+)
+from src.infrastructure.decorators.delegating import DelegatingTickerPriceRepository
+from src.infrastructure.decorators.pending import PendingKeys
+from src.infrastructure.metrics import MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+_FLUSH_SECONDS_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+_BATCH_ROWS_BUCKETS = (1, 10, 50, 100, 250, 500, 1000, 5000)
+
+
+class WriteBehindTickerPriceRepository(DelegatingTickerPriceRepository):
+    def __init__(
+        self,
+        inner: TickerPriceRepository,
+        metrics: MetricsRegistry,
+        max_queue: int = 10_000,
+        flush_rows: int = 500,
+        flush_interval: float = 0.05,
+        put_timeout: float = 1.0,
+        max_retries: int = 3,
+        concurrency: int = 16,
+    ) -> None:
+        super().__init__(inner)
+        self._queue: queue.Queue[TickerPrice] = queue.Queue(maxsize=max_queue)
+        self._flush_rows = flush_rows
+        self._flush_interval = flush_interval
+        self._put_timeout = put_timeout
+        self._max_retries = max_retries
+        self._concurrency = concurrency
+        self._unflushed = PendingKeys()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self._flush_seconds = metrics.histogram(
+            "ticker_write_behind_flush_seconds",
+            "Time to write one flushed group of rows",
+            _FLUSH_SECONDS_BUCKETS,
+        )
+        self._batch_rows = metrics.histogram(
+            "ticker_write_behind_batch_rows", "Rows per flush", _BATCH_ROWS_BUCKETS
+        )
+        self._rejected = metrics.counter(
+            "ticker_write_behind_rejected_total", "Inserts refused because the buffer was full"
+        )
+        self._dropped = metrics.counter(
+            "ticker_write_behind_dropped_rows_total", "Rows dropped after exhausting retries"
+        )
+        metrics.gauge(
+            "ticker_write_behind_queue_depth", "Rows waiting to be flushed", self._queue.qsize
+        )
+
+    def insert(self, entity: TickerPrice) -> None:
+        self._unflushed.add_many([entity])
+        try:
+            self._queue.put(entity, timeout=self._put_timeout)
+        except queue.Full:
+            self._unflushed.discard_many([entity])
+            self._rejected.inc()
+            raise RepositoryBusyError("Write buffer is full, retry later") from None
+
+    def exists(self, ticker: str, ts: datetime) -> bool:
+        return (ticker, ts) in self._unflushed or self._inner.exists(ticker, ts)
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize()
+
+    def flush(self) -> int:
+        """Synchronously write everything queued so far; returns rows handed to the DB."""
+        rows: list[TickerPrice] = []
+        while True:
+            try:
+                rows.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        for offset in range(0, len(rows), self._flush_rows):
+            self._write(rows[offset : offset + self._flush_rows])
+        return len(rows)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                first = self._queue.get(timeout=self._flush_interval)
+            except queue.Empty:
+                continue
+            rows = [first]
+            deadline = time.monotonic() + self._flush_interval
+            while len(rows) < self._flush_rows:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    rows.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._write(rows)
+
+    def _write(self, rows: Sequence[TickerPrice]) -> None:
+        try:
+            for attempt in range(self._max_retries + 1):
+                started = time.perf_counter()
+                try:
+                    self._inner.insert_batch(rows, concurrency=self._concurrency)
+                except Exception:
+                    if attempt == self._max_retries:
+                        logger.exception("Dropping %d buffered prices after retries", len(rows))
+                        self._dropped.inc(len(rows))
+                        return
+                    time.sleep(min(0.05 * 2**attempt, 1.0))
+                    continue
+                self._flush_seconds.observe(time.perf_counter() - started)
+                self._batch_rows.observe(len(rows))
+                return
+        finally:
+            self._unflushed.discard_many(rows)
@@ -0,0 +1,101 @@
+"""Minimal in-process metrics, rendered in the Prometheus text format.
+
+Components register their instruments once at construction time and update
+them on the hot path without allocating; ``GET /metrics`` renders a snapshot.
+"""
+
+import threading
+from bisect import bisect_left
+from collections.abc import Callable, Sequence
+
+
+class Counter:
+    def __init__(self) -> None:
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+
+class Histogram:
+    """Cumulative-bucket histogram; ``buckets`` are upper bounds, +Inf is implicit."""
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self._counts[bisect_left(self.buckets, value)] += 1
+            self._sum += value
+
+    @property
+    def count(self) -> int:
+        return sum(self._counts)
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        with self._lock:
+            counts = list(self._counts)
+        bounds = [repr(float(b)) for b in self.buckets] + ["+Inf"]
+        running, result = 0, []
+        for bound, count in zip(bounds, counts, strict=True):
+            running += count
+            result.append((bound, running))
+        return result
+
+
+class MetricsRegistry:
+    """Named instruments; registering an existing name returns the same instrument."""
+
+    def __init__(self) -> None:
+        self._counters: dict[str, tuple[str, Counter]] = {}
+        self._gauges: dict[str, tuple[str, Callable[[], float]]] = {}
+        self._histograms: dict[str, tuple[str, Histogram]] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help_text: str) -> Counter:
+        with self._lock:
+            return self._counters.setdefault(name, (help_text, Counter()))[1]
+
+    def gauge(self, name: str, help_text: str, read: Callable[[], float]) -> None:
+        """Register a gauge sampled by calling ``read`` at render time."""
+        with self._lock:
+            self._gauges[name] = (help_text, read)
+
+    def histogram(self, name: str, help_text: str, buckets: Sequence[float]) -> Histogram:
+        with self._lock:
+            return self._histograms.setdefault(name, (help_text, Histogram(buckets)))[1]
+
+    def value(self, name: str) -> float:
+        """Current value of a counter or gauge (handy for tests and debugging)."""
+        if name in self._counters:
+            return self._counters[name][1].value
+        return float(self._gauges[name][1]())
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for name, (help_text, counter) in sorted(self._counters.items()):
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+            lines.append(f"{name} {counter.value:g}")
+        for name, (help_text, read) in sorted(self._gauges.items()):
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge"]
+            lines.append(f"{name} {float(read()):g}")
+        for name, (help_text, histogram) in sorted(self._histograms.items()):
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+            for bound, count in histogram.cumulative():
+                lines.append(f'{name}_bucket{{le="{bound}"}} {count}')
+            lines.append(f"{name}_sum {histogram.sum:g}")
+            lines.append(f"{name}_count {histogram.count}")
+        return "\n".join(lines) + "\n"
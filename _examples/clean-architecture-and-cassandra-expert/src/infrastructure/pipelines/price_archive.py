@@ -0,0 +1,89 @@
+"""Archive ticker_prices rows before their TTL expires.
+
+Candidates are picked by each row's remaining ``TTL(price)`` rather than its
+``ts``: history loaded late, or rows whose TTL was reset by a rewrite, expire
+on their own schedule. Every (ticker, UTC day) holding a row due within the
+safety margin is copied to the same Hive layout as the full export
+(``ticker=<T>/date=<D>/archive-<run date>.parquet``), keeping only rows no
+earlier archive file of that day holds, and the day's rollup rows are
+recomputed from the archived and live rows together, so late inserts are
+folded in before the raw rows disappear. Re-running on the same date
+rewrites the same file.
+"""
+
+from collections.abc import Callable
+from datetime import date, datetime, time, timedelta, timezone
+from pathlib import Path
+
+import pyarrow.parquet as pq
+
+from src.application.use_cases.rebuild_rollups import RebuildRollups
+from src.domain.entities.candle import as_utc
+from src.domain.entities.ticker_price import TickerPrice
+from src.domain.repositories.candle_repository import CandleRepository
+from src.infrastructure.cassandra.repositories.cassandra_ticker_price_repository import (
+    CassandraTickerPriceRepository,
+)
+from src.infrastructure.pipelines.price_export import write_partition
+
+
+def archived_rows(partition: Path, exclude: str) -> list[TickerPrice]:
+    """Rows of every ``archive-*.parquet`` in ``partition`` except ``<exclude>.parquet``."""
+    return [
+        TickerPrice(**row)
+        for path in sorted(partition.glob("archive-*.parquet"))
+        if path.stem != exclude
+        for row in pq.read_table(path).to_pylist()
+    ]
+
+
+def archive_day(
+    prices: CassandraTickerPriceRepository,
+    candles: CandleRepository,
+    ticker: str,
+    day: date,
+    out_dir: Path,
+    name: str,
+    page_size: int = 5000,
+) -> int:
+    """Archive one ticker's UTC day as ``<name>.parquet``; returns the rows newly copied."""
+    start = datetime.combine(day, time(), tzinfo=timezone.utc)
+    end = start + timedelta(days=1) - timedelta(milliseconds=1)
+    live = [
+        p
+        for page in prices.iter_pages(ticker, start=start, end=end, page_size=page_size)
+        for p in page
+    ]
+    earlier = {
+        as_utc(p.ts): p
+        for p in archived_rows(out_dir / f"ticker={ticker}" / f"date={day.isoformat()}", name)
+    }
+    fresh = [p for p in live if as_utc(p.ts) not in earlier]
+    if not fresh:
+        return 0
+    write_partition(out_dir, ticker, day.isoformat(), fresh, name)
+    # Rows that already expired only survive in the archive; live rows win on a clash.
+    merged = earlier | {as_utc(p.ts): p for p in live}
+    RebuildRollups(prices, candles).write(list(merged.values()))
+    return len(fresh)
+
+
+def archive_expiring(
+    prices: CassandraTickerPriceRepository,
+    candles: CandleRepository,
+    out_dir: Path,
+    *,
+    ahead_days: int = 7,
+    today: date | None = None,
+    report: Callable[[str], None] = print,
+) -> int:
+    """Archive every ticker day with rows expiring within ``ahead_days``; returns rows copied."""
+    today = today or datetime.now(timezone.utc).date()
+    name = f"archive-{today.isoformat()}"
+    copied = 0
+    for ticker, day in sorted(prices.expiring_days(timedelta(days=ahead_days))):
+        rows = archive_day(prices, candles, ticker, day, out_dir, name)
+        if rows:
+            report(f"  {ticker} {day}: {rows:,} rows archived")
+        copied += rows
+    return copied
@@ -0,0 +1,189 @@
+"""Full-table export of ticker_prices to Hive-partitioned Parquet.
+
+The Murmur3 token ring is cut into contiguous ranges that worker processes
+scan independently with paged reads. Each worker buffers at most
+``max_buffer_rows`` rows before writing them out as
+``ticker=<T>/date=<YYYY-MM-DD>/part-<range>-<seq>.parquet`` files, so memory
+per worker stays bounded. A range that fails is retried from scratch after
+its partial files are removed. Prices are written as ``decimal128(38, 18)``;
+one with more decimal places or integer digits than that fails the range
+with a ``ValueError`` naming the row rather than being rounded.
+"""
+
+import multiprocessing
+import time
+from collections import defaultdict, deque
+from collections.abc import Callable
+from decimal import Decimal
+from multiprocessing.pool import AsyncResult
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.domain.entities.candle import as_utc
+from src.domain.entities.ticker_price import TickerPrice
+from src.domain.repositories.ticker_price_repository import TickerPriceRepository
+from src.infrastructure.cassandra.repositories.cassandra_ticker_price_repository import (
+    CassandraTickerPriceRepository,
+)
+from src.infrastructure.cassandra.session import create_session
+from src.infrastructure.cassandra.token_ranges import TokenRange, split_token_ring
+
+# Per-currency scales stay well under 18 decimal places, which still leaves
+# 20 integer digits.
+PRICE_PRECISION = 38
+PRICE_SCALE = 18
+
+SCHEMA = pa.schema([
+    ("ticker", pa.string()),
+    ("ts", pa.timestamp("ms", tz="UTC")),
+    ("price", pa.decimal128(PRICE_PRECISION, PRICE_SCALE)),
+    ("currency", pa.string()),
+    ("source", pa.string()),
+])
+
+
+def export_range(
+    repo: TickerPriceRepository,
+    token_range: TokenRange,
+    out_dir: Path,
+    page_size: int = 5000,
+    max_buffer_rows: int = 100_000,
+) -> int:
+    """Export one token range; returns the number of rows written."""
+    _remove_partial_output(out_dir, token_range)
+    buffer: dict[tuple[str, str], list[TickerPrice]] = defaultdict(list)
+    buffered = written = seq = 0
+    for page in repo.scan_token_range(token_range.start, token_range.end, page_size):
+        for price in page:
+            buffer[(price.ticker, as_utc(price.ts).date().isoformat())].append(price)
+        buffered += len(page)
+        if buffered >= max_buffer_rows:
+            seq = _flush(buffer, out_dir, token_range, seq)
+            written += buffered
+            buffered = 0
+    _flush(buffer, out_dir, token_range, seq)
+    return written + buffered
+
+
+def write_partition(
+    out_dir: Path, ticker: str, day: str, rows: list[TickerPrice], name: str
+) -> Path:
+    """Atomically write ``rows`` as ``ticker=<T>/date=<day>/<name>.parquet``."""
+    target = out_dir / f"ticker={ticker}" / f"date={day}"
+    target.mkdir(parents=True, exist_ok=True)
+    table = pa.table(
+        {
+            "ticker": [r.ticker for r in rows],
+            "ts": [as_utc(r.ts) for r in rows],
+            "price": [_exportable_price(r) for r in rows],
+            "currency": [r.currency for r in rows],
+            "source": [r.source for r in rows],
+        },
+        schema=SCHEMA,
+    )
+    final = target / f"{name}.parquet"
+    tmp = final.with_suffix(".parquet.tmp")
+    pq.write_table(table, tmp)
+    tmp.rename(final)
+    return final
+
+
+def _exportable_price(row: TickerPrice) -> Decimal:
+    exponent = row.price.normalize().as_tuple().exponent
+    if (
+        not row.price.is_finite()
+        or exponent < -PRICE_SCALE
+        or row.price.adjusted() >= PRICE_PRECISION - PRICE_SCALE
+    ):
+        raise ValueError(
+            f"{row.ticker} price {row.price} at {as_utc(row.ts).isoformat()} does not fit "
+            f"decimal128({PRICE_PRECISION}, {PRICE_SCALE})"
+        )
+    return row.price
+
+
+def _flush(
+    buffer: dict[tuple[str, str], list[TickerPrice]],
+    out_dir: Path,
+    token_range: TokenRange,
+    seq: int,
+) -> int:
+    for (ticker, day), rows in buffer.items():
+        write_partition(out_dir, ticker, day, rows, f"part-{token_range.index:05d}-{seq:05d}")
+        seq += 1
+    buffer.clear()
+    return seq
+
+
+def _remove_partial_output(out_dir: Path, token_range: TokenRange) -> None:
+    # Covers both finished parts and a ``.parquet.tmp`` left by a crash mid-write.
+    for stale in out_dir.glob(f"ticker=*/date=*/part-{token_range.index:05d}-*"):
+        stale.unlink()
+
+
+_worker_repo: CassandraTickerPriceRepository | None = None
+
+
+def _init_worker(contact_points: list[str], keyspace: str) -> None:
+    global _worker_repo
+    _worker_repo = CassandraTickerPriceRepository(create_session(contact_points, keyspace))
+
+
+def _export_chunk(
+    token_range: TokenRange, out_dir: Path, page_size: int, max_buffer_rows: int
+) -> int:
+    assert _worker_repo is not None, "worker not initialised"
+    return export_range(_worker_repo, token_range, out_dir, page_size, max_buffer_rows)
+
+
+def export_all(
+    out_dir: Path,
+    *,
+    contact_points: list[str],
+    keyspace: str,
+    workers: int = 4,
+    splits: int = 256,
+    page_size: int = 5000,
+    max_buffer_rows: int = 100_000,
+    retries: int = 3,
+    report: Callable[[str], None] = print,
+) -> tuple[int, list[TokenRange]]:
+    """Export the whole table; returns (rows written, ranges that exhausted their retries)."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    ranges = split_token_ring(splits)
+    attempts: dict[int, int] = defaultdict(int)
+    failed: list[TokenRange] = []
+    written = settled = 0
+    started = time.monotonic()
+    in_flight: deque[tuple[AsyncResult, TokenRange]] = deque()
+
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Pool(workers, initializer=_init_worker, initargs=(contact_points, keyspace)) as pool:
+
+        def submit(token_range: TokenRange) -> None:
+            attempts[token_range.index] += 1
+            args = (token_range, out_dir, page_size, max_buffer_rows)
+            in_flight.append((pool.apply_async(_export_chunk, args), token_range))
+
+        for token_range in ranges:
+            submit(token_range)
+        while in_flight:
+            result, token_range = in_flight.popleft()
+            try:
+                written += result.get()
+            except Exception as exc:
+                if attempts[token_range.index] <= retries:
+                    report(f"  range {token_range.index} failed ({exc}); retrying")
+                    submit(token_range)
+                    continue
+                report(f"  range {token_range.index} gave up after {retries} retries: {exc}")
+                failed.append(token_range)
+            settled += 1
+            elapsed = time.monotonic() - started
+            report(
+                f"  {settled}/{len(ranges)} ranges, {written:,} rows"
+                f"  ({written / elapsed:,.0f} rows/s)"
+            )
+    return written, failed
@@ -0,0 +1,299 @@
+"""Bulk loader for vendor CSV/Parquet price files.
+
+The parent process streams the file as fixed-size Arrow record batches and
+hands them to a pool of worker processes, each holding its own Cassandra
+session. Workers turn a batch into ``TickerPrice`` rows and write them with
+token-aware concurrent execution; rows the API would reject (blank ticker or
+timestamp, a price that is missing, not a number, not positive or too
+precise for its currency) are skipped and counted. Each row's TTL counts
+from its ``ts``, not from the import, so old history expires (and is
+archived) on the same schedule as rows written live. A checkpoint records
+how many leading rows are durably written and how many of those were
+skipped, plus the time span each ticker's rows cover, so an interrupted
+import resumes where it stopped and the rollups of everything it wrote can
+be rebuilt afterwards (``rebuild_rollups``).
+"""
+
+import json
+import multiprocessing
+import os
+import time
+from collections import deque
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from multiprocessing.pool import AsyncResult
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+from src.application.use_cases.rebuild_rollups import RebuildRollups
+from src.domain.entities.price_columns import PriceScales
+from src.domain.entities.ticker_price import TickerPrice
+from src.domain.repositories.ticker_price_repository import TickerPriceRepository
+from src.infrastructure.cassandra.repositories.cassandra_candle_repository import (
+    CassandraCandleRepository,
+)
+from src.infrastructure.cassandra.repositories.cassandra_latest_price_repository import (
+    CassandraLatestPriceRepository,
+)
+from src.infrastructure.cassandra.repositories.cassandra_ticker_price_repository import (
+    CassandraTickerPriceRepository,
+    load_price_scales,
+    table_default_ttl,
+)
+from src.infrastructure.cassandra.session import create_session
+from src.infrastructure.decorators.snapshot import SnapshotTickerPriceRepository
+
+REQUIRED_COLUMNS = ("ticker", "timestamp", "price")
+# Same bound as the API's TickerPriceCreate.ticker.
+MAX_TICKER_LENGTH = 10
+
+Spans = dict[str, tuple[datetime, datetime]]
+
+
+@dataclass
+class Checkpoint:
+    path: Path
+    source_file: str
+    rows_done: int = 0
+    rows_rejected: int = 0
+    spans: Spans = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path, source_file: Path) -> "Checkpoint":
+        if path.exists():
+            data = json.loads(path.read_text())
+            if data.get("source_file") == str(source_file):
+                spans = {
+                    ticker: (datetime.fromisoformat(first), datetime.fromisoformat(last))
+                    for ticker, (first, last) in data.get("spans", {}).items()
+                }
+                return cls(
+                    path,
+                    str(source_file),
+                    int(data["rows_done"]),
+                    int(data.get("rows_rejected", 0)),
+                    spans,
+                )
+        return cls(path, str(source_file))
+
+    def cover(self, spans: Spans) -> None:
+        """Widen each ticker's recorded span to include ``spans``."""
+        for ticker, (first, last) in spans.items():
+            known = self.spans.get(ticker)
+            self.spans[ticker] = (first, last) if known is None else (
+                min(known[0], first), max(known[1], last)
+            )
+
+    def save(self, rows_done: int, rows_rejected: int | None = None) -> None:
+        self.rows_done = rows_done
+        if rows_rejected is not None:
+            self.rows_rejected = rows_rejected
+        data = {
+            "source_file": self.source_file,
+            "rows_done": rows_done,
+            "rows_rejected": self.rows_rejected,
+            "spans": {t: [a.isoformat(), b.isoformat()] for t, (a, b) in self.spans.items()},
+        }
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp.write_text(json.dumps(data))
+        os.replace(tmp, self.path)
+
+
+def read_chunks(path: Path, chunk_size: int, skip_rows: int = 0) -> Iterator[pa.RecordBatch]:
+    """Stream ``path`` as record batches of ``chunk_size`` rows, skipping a prefix."""
+    if path.suffix.lower() == ".parquet":
+        batches = pq.ParquetFile(path).iter_batches(batch_size=chunk_size)
+    else:
+        batches = pa_csv.open_csv(
+            path,
+            convert_options=pa_csv.ConvertOptions(
+                column_types={"ticker": pa.string(), "price": pa.string()},
+                strings_can_be_null=True,
+            ),
+        )
+    buffered: list[pa.RecordBatch] = []
+    buffered_rows = 0
+    for batch in batches:
+        if skip_rows:
+            dropped = min(skip_rows, batch.num_rows)
+            batch = batch.slice(dropped)
+            skip_rows -= dropped
+        buffered.append(batch)
+        buffered_rows += batch.num_rows
+        while buffered_rows >= chunk_size:
+            table = pa.Table.from_batches(buffered).combine_chunks()
+            yield table.slice(0, chunk_size).to_batches()[0]
+            rest = table.slice(chunk_size)
+            buffered = rest.to_batches()
+            buffered_rows = rest.num_rows
+    if buffered_rows:
+        yield pa.Table.from_batches(buffered).combine_chunks().to_batches()[0]
+
+
+def to_entities(
+    batch: pa.RecordBatch, default_source: str = "import", scales: PriceScales | None = None
+) -> tuple[list[TickerPrice], int]:
+    """Normalise a vendor batch column-at-a-time, then build the domain rows.
+
+    Returns the rows and how many were skipped as invalid; with ``scales``,
+    prices with more decimal places than their currency's scale are too.
+    """
+    missing = [c for c in REQUIRED_COLUMNS if c not in batch.schema.names]
+    if missing:
+        raise ValueError(f"Missing required column(s): {', '.join(missing)}")
+    n = batch.num_rows
+    tickers = pc.utf8_upper(pc.utf8_trim_whitespace(batch.column("ticker").cast(pa.string())))
+    stamps = batch.column("timestamp").cast(pa.timestamp("ms", tz="UTC"))
+    prices = batch.column("price").cast(pa.string())
+    currencies = _optional(batch, "currency", "USD", n)
+    sources = _optional(batch, "source", default_source, n)
+    entities: list[TickerPrice] = []
+    for t, ts, p, c, s in zip(
+        tickers.to_pylist(), stamps.to_pylist(), prices.to_pylist(),
+        currencies.to_pylist(), sources.to_pylist(), strict=True,
+    ):
+        price = _positive_price(p)
+        if (
+            not t
+            or len(t) > MAX_TICKER_LENGTH
+            or ts is None
+            or price is None
+            or (scales is not None and scales.scale(price, c) is None)
+        ):
+            continue
+        entities.append(TickerPrice(ticker=t, ts=ts, price=price, currency=c, source=s))
+    return entities, n - len(entities)
+
+
+def _positive_price(text: str | None) -> Decimal | None:
+    try:
+        price = Decimal(text.strip()) if text else None
+    except InvalidOperation:
+        return None
+    return price if price is not None and price.is_finite() and price > 0 else None
+
+
+def _optional(batch: pa.RecordBatch, name: str, default: str, n: int) -> pa.Array:
+    if name not in batch.schema.names:
+        return pa.array([default] * n, type=pa.string())
+    return pc.fill_null(batch.column(name).cast(pa.string()), default)
+
+
+_worker_repo: TickerPriceRepository | None = None
+_worker_scales: PriceScales | None = None
+_worker_concurrency = 64
+
+
+def _init_worker(
+    contact_points: list[str], keyspace: str, concurrency: int, source_ttls: Mapping[str, int]
+) -> None:
+    global _worker_repo, _worker_scales, _worker_concurrency
+    session = create_session(contact_points, keyspace)
+    _worker_scales = load_price_scales(session)
+    prices = CassandraTickerPriceRepository(
+        session,
+        scales=_worker_scales,
+        source_ttls=source_ttls,
+        default_ttl=table_default_ttl(session),
+        ttl_from_ts=True,
+    )
+    _worker_repo = SnapshotTickerPriceRepository(prices, CassandraLatestPriceRepository(session))
+    _worker_concurrency = concurrency
+
+
+def _write_chunk(batch: pa.RecordBatch, default_source: str) -> tuple[Spans, int]:
+    assert _worker_repo is not None, "worker not initialised"
+    entities, rejected = to_entities(batch, default_source, _worker_scales)
+    _worker_repo.insert_many(entities, concurrency=_worker_concurrency)
+    spans: Spans = {}
+    for e in entities:
+        first, last = spans.get(e.ticker, (e.ts, e.ts))
+        spans[e.ticker] = (min(first, e.ts), max(last, e.ts))
+    return spans, rejected
+
+
+def import_file(
+    path: Path,
+    checkpoint: Checkpoint,
+    *,
+    contact_points: list[str],
+    keyspace: str,
+    workers: int = 4,
+    chunk_size: int = 10_000,
+    concurrency: int = 64,
+    default_source: str = "import",
+    source_ttls: Mapping[str, int] | None = None,
+    report: Callable[[str], None] = print,
+) -> int:
+    """Import ``path`` from ``checkpoint.rows_done`` onward; returns rows written.
+
+    Invalid rows are skipped and added to ``checkpoint.rows_rejected``.
+    ``source_ttls`` are the per-source TTL overrides in seconds, as in the API.
+    """
+    rows_done = checkpoint.rows_done
+    rejected = checkpoint.rows_rejected
+    written = 0
+    started = time.monotonic()
+    in_flight: deque[tuple[AsyncResult, int]] = deque()
+
+    def settle_oldest() -> None:
+        # Chunks complete in any order, but the checkpoint only ever advances
+        # over a contiguous prefix, so a resume never skips unwritten rows.
+        nonlocal rows_done, rejected, written
+        result, rows = in_flight.popleft()
+        spans, skipped = result.get()
+        checkpoint.cover(spans)
+        rows_done += rows
+        rejected += skipped
+        written += rows - skipped
+        checkpoint.save(rows_done, rejected)
+        elapsed = time.monotonic() - started
+        report(
+            f"  {rows_done:,} rows, {rejected:,} skipped  ({written / elapsed:,.0f} rows/s)"
+        )
+
+    ctx = multiprocessing.get_context("spawn")
+    initargs = (contact_points, keyspace, concurrency, dict(source_ttls or {}))
+    with ctx.Pool(workers, initializer=_init_worker, initargs=initargs) as pool:
+        for batch in read_chunks(path, chunk_size, skip_rows=rows_done):
+            result = pool.apply_async(_write_chunk, (batch, default_source))
+            in_flight.append((result, batch.num_rows))
+            while len(in_flight) >= workers * 2:
+                settle_oldest()
+        while in_flight:
+            settle_oldest()
+    return written
+
+
+def rebuild_rollups(
+    spans: Spans,
+    *,
+    contact_points: list[str],
+    keyspace: str,
+    report: Callable[[str], None] = print,
+) -> int:
+    """Recompute the rollups of every imported ticker over the days it was written to.
+
+    Bulk writes bypass the ingest-time aggregator; run this once the import
+    is done and while no live inserts are being flushed for these tickers.
+    Returns ticks read.
+    """
+    session = create_session(contact_points, keyspace)
+    use_case = RebuildRollups(
+        CassandraTickerPriceRepository(session), CassandraCandleRepository(session)
+    )
+    folded = 0
+    try:
+        for ticker, (first, last) in sorted(spans.items()):
+            ticks = use_case.execute(ticker, first, last)
+            report(f"  {ticker}: rollups rebuilt from {ticks:,} ticks")
+            folded += ticks
+    finally:
+        session.cluster.shutdown()
+    return folded
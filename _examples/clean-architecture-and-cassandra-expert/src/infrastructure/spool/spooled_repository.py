@@ -0,0 +1,169 @@
+"""Spool-first ingestion: acknowledge once on local disk, replay into Cassandra.
+
+``insert`` appends the row to a ``SpoolLog`` and returns as soon as it is
+fsynced, so ingest latency is bounded by the local disk rather than by a
+struggling cluster. A drainer thread replays sealed segments through the
+wrapped repository's ``insert_batch`` at a capped rate and deletes each
+segment once every row in it has been written. Replays are idempotent
+upserts, so a crash mid-segment only means that segment is written again.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterator
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+
+from src.domain.entities.candle import as_utc
+from src.domain.entities.ticker_price import TickerPrice
+from src.domain.repositories.ticker_price_repository import TickerPriceRepository
+from src.infrastructure.decorators.delegating import DelegatingTickerPriceRepository
+from src.infrastructure.decorators.pending import PendingKeys
+from src.infrastructure.metrics import MetricsRegistry
+from src.infrastructure.spool.log import SpoolLog
+
+logger = logging.getLogger(__name__)
+
+_APPEND_SECONDS_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5)
+_MAX_BACKOFF_SECONDS = 5.0
+
+
+def encode(entity: TickerPrice) -> bytes:
+    return json.dumps(
+        [entity.ticker, as_utc(entity.ts).isoformat(), str(entity.price), entity.currency,
+         entity.source],
+        separators=(",", ":"),
+    ).encode()
+
+
+def decode(payload: bytes) -> TickerPrice:
+    ticker, ts, price, currency, source = json.loads(payload)
+    return TickerPrice(
+        ticker=ticker,
+        ts=datetime.fromisoformat(ts),
+        price=Decimal(price),
+        currency=currency,
+        source=source,
+    )
+
+
+class RateLimiter:
+    """Paces callers to ``rate`` units per second by sleeping before each grant."""
+
+    def __init__(
+        self,
+        rate: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._rate = rate
+        self._clock = clock
+        self._sleep = sleep
+        self._next = 0.0
+
+    def acquire(self, units: int) -> None:
+        now = self._clock()
+        start = max(self._next, now)
+        self._next = start + units / self._rate
+        if start > now:
+            self._sleep(start - now)
+
+
+class SpooledTickerPriceRepository(DelegatingTickerPriceRepository):
+    def __init__(
+        self,
+        inner: TickerPriceRepository,
+        log: SpoolLog,
+        metrics: MetricsRegistry,
+        rows_per_second: float = 5000.0,
+        batch_rows: int = 500,
+        idle_interval: float = 0.5,
+    ) -> None:
+        super().__init__(inner)
+        self._log = log
+        self._limiter = RateLimiter(rows_per_second)
+        self._batch_rows = batch_rows
+        self._idle_interval = idle_interval
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._pending = pending = PendingKeys()
+        # Rows spooled before a restart are still unwritten as far as we know.
+        for segment in log.segments():
+            self._pending.add_many(decode(p) for p in log.read(segment))
+
+        self._append_seconds = metrics.histogram(
+            "ticker_spool_append_seconds", "Spool append latency incl. fsync",
+            _APPEND_SECONDS_BUCKETS,
+        )
+        self._drained = metrics.counter("ticker_spool_drained_rows_total", "Rows replayed")
+        self._errors = metrics.counter("ticker_spool_drain_errors_total", "Failed drain passes")
+        metrics.gauge("ticker_spool_backlog_bytes", "Bytes left to drain", log.backlog_bytes)
+        metrics.gauge("ticker_spool_backlog_rows", "Rows left to drain", lambda: len(pending))
+
+    def insert(self, entity: TickerPrice) -> None:
+        started = time.perf_counter()
+        self._pending.add_many([entity])
+        try:
+            self._log.append(encode(entity))
+        except Exception:
+            self._pending.discard_many([entity])
+            raise
+        self._append_seconds.observe(time.perf_counter() - started)
+
+    def exists(self, ticker: str, ts: datetime) -> bool:
+        return (ticker, ts) in self._pending or self._inner.exists(ticker, ts)
+
+    def drain_once(self) -> int:
+        """Replay every sealed segment, oldest first; returns rows written."""
+        if not self._log.sealed_segments():
+            self._log.seal()
+        written = 0
+        for segment in self._log.sealed_segments():
+            for chunk in self._chunks(segment):
+                if self._stop.is_set():
+                    return written
+                self._limiter.acquire(len(chunk))
+                self._inner.insert_batch(chunk)
+                self._pending.discard_many(chunk)
+                self._drained.inc(len(chunk))
+                written += len(chunk)
+            self._log.remove(segment)
+        return written
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="spool-drainer", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop draining; whatever is left stays on disk for the next start."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._log.close()
+
+    def _run(self) -> None:
+        backoff = self._idle_interval
+        while not self._stop.wait(backoff):
+            try:
+                self.drain_once()
+                backoff = self._idle_interval
+            except Exception:
+                self._errors.inc()
+                logger.exception("Spool drain failed; retrying in %.1fs", backoff)
+                backoff = min(backoff * 2, _MAX_BACKOFF_SECONDS)
+
+    def _chunks(self, segment: Path) -> Iterator[list[TickerPrice]]:
+        chunk: list[TickerPrice] = []
+        for payload in self._log.read(segment):
+            chunk.append(decode(payload))
+            if len(chunk) == self._batch_rows:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
@@ -0,0 +1,82 @@
+"""
+FR-005: Multi-Ticker Batch Query
+=================================
+Priority: P2
+Refs: spec-kit FR style, OpenSpec propose/specs pattern
+
+As a dashboard, I want the price history of many tickers in one request
+so that I pay roughly one partition read of latency instead of fifty.
+
+Acceptance:
+  - GIVEN prices exist for "BAT1" and "BAT2"
+    WHEN  GET /api/v1/ticker-prices?tickers=BAT1,bat2
+    THEN  200 OK with one result group per ticker, in request order
+
+  - GIVEN a long list of tickers
+    WHEN  POST /api/v1/ticker-prices:batch {tickers, start, end}
+    THEN  200 OK with the same grouped shape, filtered to the range
+
+  - GIVEN an empty ticker list
+    WHEN  POST /api/v1/ticker-prices:batch
+    THEN  422 Unprocessable Entity is returned
+
+Edge Cases:
+  - Unknown tickers come back as empty groups, not errors
+  - Duplicate tickers are collapsed into one group
+"""
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from src.api.main import create_app
+
+pytestmark = pytest.mark.functional
+
+
+@pytest.fixture
+def app():
+    return create_app()
+
+
+@pytest.fixture
+async def client(app):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+async def _seed_prices(client: AsyncClient) -> None:
+    for ticker in ("BAT1", "BAT2"):
+        await client.post(
+            "/api/v1/ticker-prices",
+            json={"ticker": ticker, "price": "10.00", "timestamp": "2025-06-10T10:00:00Z"},
+        )
+
+
+class TestFR005BatchTickerPrices:
+    """FR-005 acceptance scenarios."""
+
+    async def test_get_groups_per_ticker(self, client: AsyncClient):
+        await _seed_prices(client)
+        resp = await client.get("/api/v1/ticker-prices", params={"tickers": "BAT1,bat2,ZZZZ"})
+        assert resp.status_code == 200
+        body = resp.json()
+        assert [r["ticker"] for r in body["results"]] == ["BAT1", "BAT2", "ZZZZ"]
+        assert body["results"][0]["count"] >= 1
+        assert body["results"][2]["count"] == 0
+
+    async def test_post_variant_with_range(self, client: AsyncClient):
+        await _seed_prices(client)
+        resp = await client.post(
+            "/api/v1/ticker-prices:batch",
+            json={"tickers": ["BAT1", "BAT1", "BAT2"], "start": "2025-06-10T00:00:00Z",
+                  "end": "2025-06-10T23:59:59Z"},
+        )
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["count"] == 2
+        assert all(r["count"] >= 1 for r in body["results"])
+
+    async def test_empty_ticker_list_returns_422(self, client: AsyncClient):
+        resp = await client.post("/api/v1/ticker-prices:batch", json={"tickers": []})
+        assert resp.status_code == 422
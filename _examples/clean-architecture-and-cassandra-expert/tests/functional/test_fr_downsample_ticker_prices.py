@@ -0,0 +1,81 @@
+"""
+FR-007: Downsampled Ticker History for Charts
+==============================================
+Priority: P2
+Refs: spec-kit FR style, OpenSpec propose/specs pattern
+
+As a charting front end, I want the server to reduce wide ranges to a
+fixed number of visually representative points so that payload size does
+not grow with the width of the range.
+
+Acceptance:
+  - GIVEN 50 prices exist for ticker "LTTB"
+    WHEN  GET /api/v1/ticker-prices/LTTB?points=10
+    THEN  200 OK with exactly 10 prices, newest first
+
+  - GIVEN fewer stored prices than requested points
+    WHEN  GET /api/v1/ticker-prices/LTTB?points=1000
+    THEN  every stored price in the range is returned
+
+  - GIVEN points below 3
+    WHEN  GET /api/v1/ticker-prices/LTTB?points=2
+    THEN  422 Unprocessable Entity is returned
+
+Edge Cases:
+  - The oldest and newest prices of the range are always kept
+"""
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from src.api.main import create_app
+
+pytestmark = pytest.mark.functional
+
+
+@pytest.fixture
+def app():
+    return create_app()
+
+
+@pytest.fixture
+async def client(app):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+async def _seed_prices(client: AsyncClient) -> None:
+    for minute in range(50):
+        await client.post(
+            "/api/v1/ticker-prices",
+            json={"ticker": "LTTB", "price": f"{100 + minute % 9}.50",
+                  "timestamp": f"2025-08-01T10:{minute:02d}:00Z"},
+        )
+
+
+RANGE = {"start": "2025-08-01T10:00:00Z", "end": "2025-08-01T10:59:59Z"}
+
+
+class TestFR007DownsampleTickerPrices:
+    """FR-007 acceptance scenarios."""
+
+    async def test_returns_requested_point_count(self, client: AsyncClient):
+        await _seed_prices(client)
+        resp = await client.get("/api/v1/ticker-prices/LTTB", params={"points": 10, **RANGE})
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["count"] == 10
+        stamps = [p["timestamp"] for p in body["prices"]]
+        assert stamps == sorted(stamps, reverse=True)
+        assert stamps[0].startswith("2025-08-01T10:49")
+        assert stamps[-1].startswith("2025-08-01T10:00")
+
+    async def test_small_range_returned_whole(self, client: AsyncClient):
+        await _seed_prices(client)
+        resp = await client.get("/api/v1/ticker-prices/LTTB", params={"points": 1000, **RANGE})
+        assert resp.json()["count"] == 50
+
+    async def test_points_below_three_returns_422(self, client: AsyncClient):
+        resp = await client.get("/api/v1/ticker-prices/LTTB", params={"points": 2})
+        assert resp.status_code == 422
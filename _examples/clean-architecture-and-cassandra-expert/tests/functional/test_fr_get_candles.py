@@ -0,0 +1,87 @@
+"""
+FR-003: Query OHLC Candles
+===========================
+Priority: P2
+Refs: spec-kit FR style, OpenSpec propose/specs pattern
+
+As a charting client, I want OHLC candles for a ticker at a chosen interval
+so that long ranges are answered from rollups instead of raw ticks.
+
+Acceptance:
+  - GIVEN prices exist for ticker "CNDL"
+    WHEN  GET /api/v1/ticker-prices/CNDL/candles?interval=1h
+    THEN  200 OK with newest-first candles carrying open/high/low/close/count
+
+  - GIVEN several ticks inside the same day
+    WHEN  GET /api/v1/ticker-prices/CNDL/candles?interval=1d
+    THEN  they are folded into a single daily candle
+
+  - GIVEN a malformed interval such as "5x"
+    WHEN  GET /api/v1/ticker-prices/CNDL/candles?interval=5x
+    THEN  422 Unprocessable Entity is returned
+
+Edge Cases:
+  - Intervals that are multiples of 1m/1h/1d read the coarsest fitting rollup
+  - Sub-minute intervals are aggregated on the fly from raw ticks
+"""
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from src.api.main import create_app
+
+pytestmark = pytest.mark.functional
+
+
+@pytest.fixture
+def app():
+    return create_app()
+
+
+@pytest.fixture
+async def client(app):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+async def _seed_prices(client: AsyncClient) -> None:
+    for ts, price in [("2025-04-01T09:00:00Z", "10.00"), ("2025-04-01T09:30:00Z", "12.00"),
+                      ("2025-04-01T15:00:00Z", "11.00")]:
+        await client.post(
+            "/api/v1/ticker-prices",
+            json={"ticker": "CNDL", "price": price, "timestamp": ts},
+        )
+
+
+class TestFR003GetCandles:
+    """FR-003 acceptance scenarios."""
+
+    async def test_hourly_candles(self, client: AsyncClient):
+        await _seed_prices(client)
+        resp = await client.get(
+            "/api/v1/ticker-prices/CNDL/candles",
+            params={"interval": "1h", "start": "2025-04-01T00:00:00Z",
+                    "end": "2025-04-01T23:59:59Z"},
+        )
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["count"] == 2
+        assert body["candles"][0]["bucket"] > body["candles"][1]["bucket"]
+
+    async def test_daily_candle_folds_ticks(self, client: AsyncClient):
+        await _seed_prices(client)
+        resp = await client.get(
+            "/api/v1/ticker-prices/CNDL/candles",
+            params={"interval": "1d", "start": "2025-04-01T00:00:00Z",
+                    "end": "2025-04-01T23:59:59Z"},
+        )
+        assert resp.status_code == 200
+        (candle,) = resp.json()["candles"]
+        assert float(candle["open"]) == pytest.approx(10.0)
+        assert float(candle["high"]) == pytest.approx(12.0)
+        assert float(candle["close"]) == pytest.approx(11.0)
+
+    async def test_invalid_interval_returns_422(self, client: AsyncClient):
+        resp = await client.get("/api/v1/ticker-prices/CNDL/candles", params={"interval": "5x"})
+        assert resp.status_code == 422
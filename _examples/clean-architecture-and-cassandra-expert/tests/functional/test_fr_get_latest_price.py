@@ -0,0 +1,69 @@
+"""
+FR-004: Latest Ticker Price
+============================
+Priority: P1
+Refs: spec-kit FR style, OpenSpec propose/specs pattern
+
+As a data consumer, I want to ask for the current price of a ticker
+so that I do not have to download its whole history to get one row.
+
+Acceptance:
+  - GIVEN several prices exist for ticker "LAST"
+    WHEN  GET /api/v1/ticker-prices/LAST/latest
+    THEN  200 OK with the price that has the newest timestamp
+
+  - GIVEN a newer price is inserted
+    WHEN  GET /api/v1/ticker-prices/LAST/latest
+    THEN  the new price is returned immediately (write-through cache)
+
+  - GIVEN no prices exist for ticker "ZZZZ"
+    WHEN  GET /api/v1/ticker-prices/ZZZZ/latest
+    THEN  404 Not Found is returned
+"""
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from src.api.main import create_app
+
+pytestmark = pytest.mark.functional
+
+
+@pytest.fixture
+def app():
+    return create_app()
+
+
+@pytest.fixture
+async def client(app):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+class TestFR004GetLatestPrice:
+    """FR-004 acceptance scenarios."""
+
+    async def test_returns_newest_price(self, client: AsyncClient):
+        for ts, price in [("2025-05-01T10:00:00Z", "50.00"), ("2025-05-02T10:00:00Z", "51.00")]:
+            await client.post(
+                "/api/v1/ticker-prices", json={"ticker": "LAST", "price": price, "timestamp": ts}
+            )
+        resp = await client.get("/api/v1/ticker-prices/last/latest")
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["ticker"] == "LAST"
+        assert body["timestamp"].startswith("2025-05-02")
+
+    async def test_insert_is_visible_immediately(self, client: AsyncClient):
+        await client.get("/api/v1/ticker-prices/LAST/latest")
+        await client.post(
+            "/api/v1/ticker-prices",
+            json={"ticker": "LAST", "price": "52.00", "timestamp": "2025-05-03T10:00:00Z"},
+        )
+        resp = await client.get("/api/v1/ticker-prices/LAST/latest")
+        assert resp.json()["timestamp"].startswith("2025-05-03")
+
+    async def test_unknown_ticker_returns_404(self, client: AsyncClient):
+        resp = await client.get("/api/v1/ticker-prices/ZZZZ/latest")
+        assert resp.status_code == 404
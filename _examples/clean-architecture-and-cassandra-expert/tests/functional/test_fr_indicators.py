@@ -0,0 +1,63 @@
+"""
+FR-008: Rolling Ticker Indicators
+==================================
+Priority: P2
+Refs: spec-kit FR style, OpenSpec propose/specs pattern
+
+As a strategy service, I want moving averages and rolling volatility kept
+in memory so that I do not recompute them from full history downloads.
+
+Acceptance:
+  - GIVEN prices are inserted for a new ticker
+    WHEN  GET /api/v1/ticker-prices/{ticker}/indicators
+    THEN  200 OK with the window's count, mean, time-weighted mean and volatility
+
+  - GIVEN no prices were seen for ticker "ZZZZ"
+    WHEN  GET /api/v1/ticker-prices/ZZZZ/indicators
+    THEN  404 Not Found is returned
+"""
+
+import uuid
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from src.api.main import create_app
+
+pytestmark = pytest.mark.functional
+
+
+@pytest.fixture
+def app():
+    return create_app()
+
+
+@pytest.fixture
+async def client(app):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+class TestFR008Indicators:
+    """FR-008 acceptance scenarios."""
+
+    async def test_indicators_follow_inserts(self, client: AsyncClient):
+        ticker = f"R{uuid.uuid4().hex[:6].upper()}"
+        for minute, price in [(0, "10.00"), (1, "11.00"), (2, "12.00")]:
+            ts = f"2025-06-01T10:0{minute}:00Z"
+            await client.post(
+                "/api/v1/ticker-prices", json={"ticker": ticker, "price": price, "timestamp": ts}
+            )
+        resp = await client.get(f"/api/v1/ticker-prices/{ticker.lower()}/indicators")
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["ticker"] == ticker
+        assert body["last_price"] == 12.0
+        assert body["count"] == 3
+        assert body["sma"] == pytest.approx(11.0)
+        assert body["volatility"] is not None
+
+    async def test_unknown_ticker_returns_404(self, client: AsyncClient):
+        resp = await client.get("/api/v1/ticker-prices/ZZZZ/indicators")
+        assert resp.status_code == 404
@@ -0,0 +1,76 @@
+"""
+FR-009: Market Snapshot
+========================
+Priority: P2
+Refs: spec-kit FR style, OpenSpec propose/specs pattern
+
+As a data consumer, I want the current price of every ticker in one call
+so that I do not have to scan every ticker partition.
+
+Acceptance:
+  - GIVEN prices were inserted for two tickers
+    WHEN  GET /api/v1/ticker-prices/snapshot
+    THEN  200 OK with the newest price of each of them
+
+  - GIVEN an older price arrives after a newer one
+    WHEN  GET /api/v1/ticker-prices/snapshot
+    THEN  the newer price is still reported
+"""
+
+import uuid
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from src.api.main import create_app
+
+pytestmark = pytest.mark.functional
+
+
+@pytest.fixture
+def app():
+    return create_app()
+
+
+@pytest.fixture
+async def client(app):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+def _ticker() -> str:
+    return f"S{uuid.uuid4().hex[:6].upper()}"
+
+
+async def _snapshot(client: AsyncClient) -> dict[str, dict]:
+    resp = await client.get("/api/v1/ticker-prices/snapshot")
+    assert resp.status_code == 200
+    return {p["ticker"]: p for p in resp.json()["prices"]}
+
+
+class TestFR009MarketSnapshot:
+    """FR-009 acceptance scenarios."""
+
+    async def test_reports_newest_price_per_ticker(self, client: AsyncClient):
+        first, second = _ticker(), _ticker()
+        for ticker, ts, price in [
+            (first, "2025-07-01T10:00:00Z", "10.00"),
+            (first, "2025-07-01T11:00:00Z", "11.00"),
+            (second, "2025-07-01T10:00:00Z", "20.00"),
+        ]:
+            await client.post(
+                "/api/v1/ticker-prices", json={"ticker": ticker, "price": price, "timestamp": ts}
+            )
+        snapshot = await _snapshot(client)
+        assert float(snapshot[first]["price"]) == 11.0
+        assert float(snapshot[second]["price"]) == 20.0
+
+    async def test_late_older_price_does_not_win(self, client: AsyncClient):
+        ticker = _ticker()
+        for ts, price in [("2025-07-02T12:00:00Z", "12.00"), ("2025-07-02T09:00:00Z", "9.00")]:
+            await client.post(
+                "/api/v1/ticker-prices", json={"ticker": ticker, "price": price, "timestamp": ts}
+            )
+        snapshot = await _snapshot(client)
+        assert snapshot[ticker]["timestamp"].startswith("2025-07-02T12:00:00")
@@ -0,0 +1,113 @@
+"""
+FR-006: Paginated and Streamed Ticker History
+==============================================
+Priority: P2
+Refs: spec-kit FR style, OpenSpec propose/specs pattern
+
+As a data consumer, I want to page through or stream long price histories
+so that neither the server nor my client has to hold them in one document.
+
+Acceptance:
+  - GIVEN 5 prices exist for ticker "PAGE"
+    WHEN  GET /api/v1/ticker-prices/PAGE?limit=2
+    THEN  200 OK with 2 prices and a next_cursor
+
+  - GIVEN a next_cursor from a previous page
+    WHEN  GET /api/v1/ticker-prices/PAGE?limit=2&cursor=<next_cursor>
+    THEN  the following prices are returned without overlap
+
+  - GIVEN prices exist for ticker "PAGE"
+    WHEN  GET /api/v1/ticker-prices/PAGE?stream=true
+    THEN  200 OK with an application/x-ndjson body, one price per line
+
+  - GIVEN a malformed cursor
+    WHEN  GET /api/v1/ticker-prices/PAGE?cursor=@@@
+    THEN  400 Bad Request is returned
+
+  - GIVEN a next_cursor issued for ticker "PAGE"
+    WHEN  it is sent with another ticker or another start/end
+    THEN  400 Bad Request is returned
+
+Edge Cases:
+  - The last page has next_cursor = null
+  - Requests without limit/cursor/stream keep the original single-document shape
+"""
+
+import json
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from src.api.main import create_app
+
+pytestmark = pytest.mark.functional
+
+
+@pytest.fixture
+def app():
+    return create_app()
+
+
+@pytest.fixture
+async def client(app):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+async def _seed_prices(client: AsyncClient) -> None:
+    for day in range(1, 6):
+        await client.post(
+            "/api/v1/ticker-prices",
+            json={"ticker": "PAGE", "price": f"{day}.00", "timestamp": f"2025-07-0{day}T10:00:00Z"},
+        )
+
+
+class TestFR006PaginateTickerPrices:
+    """FR-006 acceptance scenarios."""
+
+    async def test_pages_follow_cursor_without_overlap(self, client: AsyncClient):
+        await _seed_prices(client)
+        seen: list[str] = []
+        cursor = None
+        while True:
+            params = {"limit": 2} | ({"cursor": cursor} if cursor else {})
+            resp = await client.get("/api/v1/ticker-prices/PAGE", params=params)
+            assert resp.status_code == 200
+            body = resp.json()
+            assert body["count"] <= 2
+            seen.extend(p["timestamp"] for p in body["prices"])
+            cursor = body["next_cursor"]
+            if cursor is None:
+                break
+        assert len(seen) == len(set(seen)) >= 5
+        assert seen == sorted(seen, reverse=True)
+
+    async def test_stream_returns_ndjson(self, client: AsyncClient):
+        await _seed_prices(client)
+        resp = await client.get("/api/v1/ticker-prices/PAGE", params={"stream": "true"})
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in resp.text.splitlines()]
+        assert len(lines) >= 5
+        assert all(line["ticker"] == "PAGE" for line in lines)
+
+    async def test_malformed_cursor_returns_400(self, client: AsyncClient):
+        resp = await client.get("/api/v1/ticker-prices/PAGE", params={"cursor": "@@@"})
+        assert resp.status_code == 400
+
+    async def test_cursor_of_another_query_returns_400(self, client: AsyncClient):
+        await _seed_prices(client)
+        resp = await client.get("/api/v1/ticker-prices/PAGE", params={"limit": 2})
+        cursor = resp.json()["next_cursor"]
+
+        other = await client.get(
+            "/api/v1/ticker-prices/OTHER", params={"limit": 2, "cursor": cursor}
+        )
+        narrowed = await client.get(
+            "/api/v1/ticker-prices/PAGE",
+            params={"limit": 2, "cursor": cursor, "start": "2025-07-02T00:00:00Z"},
+        )
+
+        assert other.status_code == 400
+        assert narrowed.status_code == 400
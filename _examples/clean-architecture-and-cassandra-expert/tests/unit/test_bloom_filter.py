@@ -0,0 +1,169 @@
+"""Unit tests for the Bloom-filter pre-check on duplicate detection."""
+
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.domain.entities.ticker_price import TickerPrice
+from src.infrastructure.decorators.bloom import (
+    BloomFilter,
+    BloomFilteredTickerPriceRepository,
+    ScalableBloomFilter,
+    shard_owner,
+)
+from src.infrastructure.metrics import MetricsRegistry
+
+TODAY = date(2025, 1, 15)
+
+
+def _price(day: int, minute: int, ticker: str = "AAPL") -> TickerPrice:
+    return TickerPrice(
+        ticker=ticker,
+        ts=datetime(2025, 1, day, 14, minute, tzinfo=timezone.utc),
+        price=Decimal("182.52"),
+    )
+
+
+@pytest.fixture
+def inner():
+    mock = MagicMock()
+    mock.list_tickers.return_value = ["AAPL"]
+    mock.iter_pages.return_value = iter([[_price(14, 0), _price(15, 0)]])
+    mock.exists.return_value = False
+    return mock
+
+
+@pytest.fixture
+def metrics():
+    return MetricsRegistry()
+
+
+def _owns_all(ticker: str) -> bool:
+    return True
+
+
+@pytest.fixture
+def repo(inner, metrics):
+    repo = BloomFilteredTickerPriceRepository(
+        inner, metrics, owns=_owns_all, days=2, today=lambda: TODAY
+    )
+    repo.warm("AAPL")
+    return repo
+
+
+def test_bloom_filter_has_no_false_negatives_and_bounded_fp_rate():
+    bloom = BloomFilter(capacity=2000, fp_rate=0.01)
+    for i in range(2000):
+        bloom.add(f"in-{i}".encode())
+
+    assert all(bloom.might_contain(f"in-{i}".encode()) for i in range(2000))
+    false_positives = sum(bloom.might_contain(f"out-{i}".encode()) for i in range(10_000))
+    assert false_positives / 10_000 < 0.03
+    assert bloom.estimated_fp_rate == pytest.approx(0.01, abs=0.005)
+
+
+def test_scalable_filter_grows_instead_of_saturating():
+    bloom = ScalableBloomFilter(initial_capacity=100, fp_rate=0.01)
+    for i in range(1000):
+        bloom.add(str(i).encode())
+
+    assert bloom.count == 1000
+    assert all(bloom.might_contain(str(i).encode()) for i in range(1000))
+    assert bloom.estimated_fp_rate < 0.02
+
+
+def test_warm_reads_the_covered_window(repo, inner):
+    start = datetime(2025, 1, 14, tzinfo=timezone.utc)
+    inner.iter_pages.assert_called_once_with("AAPL", start=start, page_size=5000)
+
+
+def test_new_key_skips_the_database(repo, inner, metrics):
+    assert not repo.exists("AAPL", _price(15, 30).ts)
+    assert not repo.exists("AAPL", _price(15, 31).ts)
+
+    inner.exists.assert_not_called()
+    assert metrics.value("ticker_bloom_skipped_exists_total") == 2
+
+
+def test_only_one_concurrent_check_of_a_key_is_told_it_is_new(repo, inner):
+    assert not repo.exists("AAPL", _price(15, 30).ts)
+    assert not repo.exists("AAPL", _price(15, 30).ts)
+
+    inner.exists.assert_called_once()
+
+
+def test_unwarmed_tickers_read_the_database_and_are_warmed_on_first_check(repo, inner):
+    repo.exists("MSFT", _price(15, 30).ts)
+    repo.exists("MSFT", _price(15, 31).ts)
+    inner.iter_pages.return_value = iter([[]])
+    assert repo._warm_queue.get_nowait() == "MSFT"
+    repo.warm("MSFT")
+
+    assert not repo.exists("MSFT", _price(15, 32).ts)
+    assert inner.exists.call_count == 2
+    assert repo._warm_queue.empty()
+
+
+def test_tickers_owned_elsewhere_always_read_the_database(inner, metrics):
+    owns = shard_owner(0, 2)
+    other = next(t for t in ("AAPL", "MSFT", "GOOG", "AMZN") if not owns(t))
+    repo = BloomFilteredTickerPriceRepository(inner, metrics, owns=owns, today=lambda: TODAY)
+    inner.iter_pages.return_value = iter([[_price(15, 0, other)]])
+    repo.warm(other)
+
+    repo.exists(other, _price(15, 30).ts)
+    repo.insert(_price(15, 30, other))
+
+    inner.exists.assert_called_once()
+    assert repo.memory_bytes() == 0
+
+
+def test_possibly_present_key_is_confirmed_by_the_database(repo, inner, metrics):
+    inner.exists.return_value = True
+
+    assert repo.exists("AAPL", _price(15, 0).ts)
+    inner.exists.assert_called_once()
+    assert metrics.value("ticker_bloom_checked_exists_total") == 1
+
+
+def test_inserts_are_remembered(repo, inner):
+    inner.exists.return_value = True
+    repo.insert(_price(15, 45))
+
+    assert repo.exists("AAPL", _price(15, 45).ts)
+    inner.insert.assert_called_once_with(_price(15, 45))
+
+
+def test_days_outside_the_window_read_the_database(repo, inner):
+    repo.exists("AAPL", _price(10, 0).ts)
+
+    inner.exists.assert_called_once()
+
+
+def test_before_warm_up_every_check_reads_the_database(inner, metrics):
+    repo = BloomFilteredTickerPriceRepository(
+        inner, metrics, owns=_owns_all, today=lambda: TODAY
+    )
+
+    repo.exists("AAPL", _price(15, 30).ts)
+
+    inner.exists.assert_called_once()
+
+
+def test_window_slides_and_frees_old_filters(inner, metrics):
+    today = [TODAY]
+    repo = BloomFilteredTickerPriceRepository(
+        inner, metrics, owns=_owns_all, days=2, today=lambda: today[0]
+    )
+    repo.warm("AAPL")
+    memory = repo.memory_bytes()
+
+    today[0] = TODAY + timedelta(days=1)
+    repo.exists("AAPL", _price(15, 59).ts)
+
+    assert repo.memory_bytes() < memory
+    repo.exists("AAPL", _price(14, 0).ts)
+    inner.exists.assert_called_once()
+    assert metrics.value("ticker_bloom_memory_bytes") == repo.memory_bytes()
@@ -0,0 +1,61 @@
+"""Unit tests for the Candle domain entity and bucketing helpers."""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from src.domain.entities.candle import Candle, aggregate, bucket_start, parse_interval
+from src.domain.entities.ticker_price import TickerPrice
+
+
+def _tick(minute: int, price: str) -> TickerPrice:
+    return TickerPrice(
+        ticker="AAPL",
+        ts=datetime(2025, 1, 15, 14, minute, tzinfo=timezone.utc),
+        price=Decimal(price),
+    )
+
+
+class TestBucketStart:
+    def test_floors_to_bucket(self):
+        ts = datetime(2025, 1, 15, 14, 37, 12, tzinfo=timezone.utc)
+        assert bucket_start(ts, 3600) == datetime(2025, 1, 15, 14, tzinfo=timezone.utc)
+
+    def test_treats_naive_as_utc(self):
+        ts = datetime(2025, 1, 15, 14, 37)
+        assert bucket_start(ts, 86400) == datetime(2025, 1, 15, tzinfo=timezone.utc)
+
+
+class TestCandle:
+    def test_merge_keeps_open_and_close_by_time(self):
+        late = Candle.from_price(_tick(50, "181.00"), 3600)
+        early = Candle.from_price(_tick(10, "183.00"), 3600)
+
+        merged = late.merge(early)
+
+        assert merged.open == Decimal("183.00")
+        assert merged.close == Decimal("181.00")
+        assert merged.high == Decimal("183.00")
+        assert merged.low == Decimal("181.00")
+        assert merged.count == 2
+
+    def test_aggregate_groups_newest_first(self):
+        ticks = [_tick(5, "1"), _tick(20, "3"), _tick(35, "2")]
+
+        candles = aggregate((Candle.from_price(t, 60) for t in ticks), 900)
+
+        assert [c.count for c in candles] == [1, 1, 1]
+        assert candles[0].bucket > candles[-1].bucket
+        assert len(aggregate(candles, 3600)) == 1
+
+
+class TestParseInterval:
+    def test_parses_units(self):
+        assert parse_interval("5m") == 300
+        assert parse_interval("1w") == 604800
+
+    @pytest.mark.parametrize("spec", ["", "m", "0h", "5x", "-1d"])
+    def test_rejects_garbage(self, spec):
+        with pytest.raises(ValueError):
+            parse_interval(spec)
@@ -0,0 +1,86 @@
+"""Unit tests for LTTB downsampling and the columnar PriceSeries."""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from src.application.services.downsampling import PriceSeries, lttb
+from src.domain.entities.price_columns import PriceColumns
+from src.domain.entities.ticker_price import TickerPrice
+
+
+def _pages(count: int, page_size: int) -> list[list[TickerPrice]]:
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    newest_first = [
+        TickerPrice(
+            ticker="AAPL",
+            ts=base + timedelta(minutes=i),
+            price=Decimal(f"{100 + (i % 7)}.25"),
+            source="feed" if i % 2 else "manual",
+        )
+        for i in reversed(range(count))
+    ]
+    return [newest_first[i:i + page_size] for i in range(0, count, page_size)]
+
+
+class TestLttb:
+    def test_keeps_endpoints_and_threshold(self):
+        x = np.arange(1_000, dtype=np.float64)
+        y = np.sin(x / 40)
+
+        idx = lttb(x, y, 50)
+
+        assert len(idx) == 50
+        assert idx[0] == 0 and idx[-1] == 999
+        assert np.all(np.diff(idx) > 0)
+
+    def test_picks_spike(self):
+        x = np.arange(100, dtype=np.float64)
+        y = np.zeros(100)
+        y[42] = 10.0
+
+        assert 42 in lttb(x, y, 10)
+
+    @pytest.mark.parametrize("threshold", [100, 500])
+    def test_short_series_returned_whole(self, threshold):
+        x = np.arange(100, dtype=np.float64)
+        assert len(lttb(x, x, threshold)) == 100
+
+
+class TestPriceSeries:
+    def test_builds_oldest_first_across_pages(self):
+        series = PriceSeries.from_pages("AAPL", _pages(10, page_size=3))
+
+        assert len(series) == 10
+        assert np.all(np.diff(series.micros) > 0)
+
+    def test_take_restores_rows_newest_first(self):
+        pages = _pages(10, page_size=4)
+        series = PriceSeries.from_pages("AAPL", pages)
+
+        rows = series.take(np.array([0, 9]))
+
+        assert rows[0].ts == pages[0][0].ts
+        assert rows[0].price == pages[0][0].price
+        assert rows[0].source == pages[0][0].source
+        assert rows[1].ts == pages[-1][-1].ts
+
+    def test_empty(self):
+        series = PriceSeries.from_pages("AAPL", [])
+        assert series.take(lttb(series.micros, series.prices, 10)) == []
+
+    def test_take_returns_stored_prices_exactly(self):
+        base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        stored = ["0.3", "2.675", "182.520", "0.000000000000000123"]
+        page = [
+            TickerPrice(ticker="AAPL", ts=base + timedelta(minutes=i), price=Decimal(p))
+            for i, p in reversed(list(enumerate(stored)))
+        ]
+        columns = PriceColumns.from_prices("AAPL", page)
+        series = PriceSeries.from_columns("AAPL", [columns])
+
+        rows = series.take(np.arange(len(stored)))
+
+        assert [str(r.price) for r in rows] == [str(p.price) for p in page]
@@ -0,0 +1,84 @@
+"""Unit tests for the GetCandles use case."""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.application.use_cases.get_candles import GetCandles, coarsest_resolution
+from src.domain.entities.candle import Candle, Resolution
+from src.domain.entities.ticker_price import TickerPrice
+
+
+def _hour_candle(hour: int) -> Candle:
+    ts = datetime(2025, 1, 15, hour, tzinfo=timezone.utc)
+    return Candle(
+        ticker="AAPL", bucket=ts, open=Decimal("1"), high=Decimal("2"),
+        low=Decimal("1"), close=Decimal("2"), open_ts=ts, close_ts=ts, count=3,
+    )
+
+
+@pytest.fixture
+def prices():
+    return MagicMock()
+
+
+@pytest.fixture
+def candles():
+    return MagicMock()
+
+
+class TestCoarsestResolution:
+    def test_picks_widest_tiling_rollup(self):
+        assert coarsest_resolution(4 * 3600) == Resolution.HOUR
+        assert coarsest_resolution(7 * 86400) == Resolution.DAY
+        assert coarsest_resolution(300) == Resolution.MINUTE
+
+    def test_none_for_sub_minute(self):
+        assert coarsest_resolution(30) is None
+
+
+class TestGetCandles:
+    def test_reads_from_rollup(self, prices, candles):
+        candles.get_range.return_value = [_hour_candle(h) for h in range(8)]
+
+        result = GetCandles(prices, candles).execute("AAPL", 4 * 3600)
+
+        candles.get_range.assert_called_once_with("AAPL", Resolution.HOUR, start=None, end=None)
+        prices.get_by_ticker.assert_not_called()
+        assert [c.count for c in result] == [12, 12]
+
+    def test_widens_start_to_bucket(self, prices, candles):
+        candles.get_range.return_value = []
+        start = datetime(2025, 1, 15, 5, 30, tzinfo=timezone.utc)
+
+        GetCandles(prices, candles).execute("AAPL", 4 * 3600, start=start)
+
+        assert candles.get_range.call_args.kwargs["start"] == datetime(
+            2025, 1, 15, 4, tzinfo=timezone.utc
+        )
+
+    def test_overlays_pending_buckets(self, prices, candles):
+        candles.get_range.return_value = [_hour_candle(1)]
+        aggregator = MagicMock()
+        aggregator.pending.return_value = [_hour_candle(1)]
+
+        (result,) = GetCandles(prices, candles, aggregator).execute("AAPL", 3600)
+
+        assert result.count == 6
+
+    def test_falls_back_to_raw_ticks(self, prices, candles):
+        prices.get_by_ticker.return_value = [
+            TickerPrice(
+                ticker="AAPL",
+                ts=datetime(2025, 1, 15, 14, 30, s, tzinfo=timezone.utc),
+                price=Decimal("1"),
+            )
+            for s in (1, 20, 40)
+        ]
+
+        result = GetCandles(prices, candles).execute("AAPL", 30)
+
+        candles.get_range.assert_not_called()
+        assert [c.count for c in result] == [1, 2]
@@ -0,0 +1,80 @@
+"""Unit tests for the GetLatestPrice use case and its write-through cache."""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.application.services.latest_price_cache import LatestPriceCache
+from src.application.use_cases.get_latest_price import GetLatestPrice, TickerPriceNotFoundError
+from src.domain.entities.ticker_price import TickerPrice
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _price(day: int, price: str = "182.52") -> TickerPrice:
+    return TickerPrice(
+        ticker="AAPL", ts=datetime(2025, 1, day, tzinfo=timezone.utc), price=Decimal(price)
+    )
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    return LatestPriceCache(max_age=5.0, clock=clock)
+
+
+@pytest.fixture
+def repo():
+    mock = MagicMock()
+    mock.get_latest.return_value = _price(10)
+    return mock
+
+
+class TestLatestPriceCache:
+    def test_write_through_keeps_newest(self, cache):
+        cache.on_inserted(_price(12))
+        cache.on_inserted(_price(11))
+
+        assert cache.get("AAPL") == _price(12)
+
+    def test_entries_expire_after_max_age(self, cache, clock):
+        cache.put(_price(12))
+        clock.now = 5.5
+
+        assert cache.get("AAPL") is None
+
+
+class TestGetLatestPrice:
+    def test_reads_through_on_miss_then_serves_from_cache(self, cache, repo):
+        use_case = GetLatestPrice(repo, cache)
+
+        assert use_case.execute("AAPL") == _price(10)
+        assert use_case.execute("AAPL") == _price(10)
+        repo.get_latest.assert_called_once_with("AAPL")
+
+    def test_refetches_when_stale(self, cache, repo, clock):
+        use_case = GetLatestPrice(repo, cache)
+        use_case.execute("AAPL")
+        clock.now = 10.0
+
+        use_case.execute("AAPL")
+
+        assert repo.get_latest.call_count == 2
+
+    def test_raises_when_ticker_unknown(self, cache, repo):
+        repo.get_latest.return_value = None
+
+        with pytest.raises(TickerPriceNotFoundError):
+            GetLatestPrice(repo, cache).execute("ZZZZ")
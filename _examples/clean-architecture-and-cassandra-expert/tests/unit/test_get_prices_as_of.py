@@ -0,0 +1,113 @@
+"""Unit tests for the GetPricesAsOf use case and its memo."""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.application.services.as_of_memo import AsOfMemo
+from src.application.use_cases.get_prices_as_of import GetPricesAsOf
+from src.domain.entities.ticker_price import TickerPrice
+
+NOW = datetime(2025, 1, 10, tzinfo=timezone.utc)
+PAST = datetime(2025, 1, 2, 16, tzinfo=timezone.utc)
+
+
+def _price(ticker: str, ts: datetime) -> TickerPrice:
+    return TickerPrice(ticker=ticker, ts=ts, price=Decimal("100.5"))
+
+
+@pytest.fixture
+def repo():
+    mock = MagicMock()
+    mock.get_as_of.side_effect = lambda tickers, at, **_: {
+        t: None if t == "NOPE" else _price(t, at - timedelta(minutes=1)) for t in tickers
+    }
+    return mock
+
+
+@pytest.fixture
+def memo():
+    return AsOfMemo(max_entries=100)
+
+
+def _use_case(repo, memo) -> GetPricesAsOf:
+    return GetPricesAsOf(repo, memo, max_concurrency=8, settle_seconds=300, now=lambda: NOW)
+
+
+class TestGetPricesAsOf:
+    def test_fetches_distinct_tickers_concurrently_in_one_call(self, repo, memo):
+        result = _use_case(repo, memo).execute(["MSFT", "AAPL", "MSFT", "NOPE"], PAST)
+
+        repo.get_as_of.assert_called_once_with(["MSFT", "AAPL", "NOPE"], PAST, concurrency=8)
+        assert list(result) == ["MSFT", "AAPL", "NOPE"]
+        assert result["AAPL"] == _price("AAPL", PAST - timedelta(minutes=1))
+        assert result["NOPE"] is None
+
+    def test_historical_answers_are_memoised_including_misses(self, repo, memo):
+        use_case = _use_case(repo, memo)
+        use_case.execute(["AAPL", "NOPE"], PAST)
+
+        result = use_case.execute(["AAPL", "NOPE", "MSFT"], PAST)
+
+        assert repo.get_as_of.call_args.args[0] == ["MSFT"]
+        assert result["NOPE"] is None
+        assert len(memo) == 3
+
+    def test_insert_landing_during_the_read_keeps_it_out_of_the_memo(self, repo, memo):
+        def racing(tickers, at, **_):
+            memo.on_inserted(_price("AAPL", at - timedelta(seconds=30)))
+            return {t: _price(t, at - timedelta(minutes=1)) for t in tickers}
+
+        repo.get_as_of.side_effect = racing
+        _use_case(repo, memo).execute(["AAPL", "MSFT"], PAST)
+
+        assert memo.lookup("AAPL", PAST) == (False, None)
+        assert memo.lookup("MSFT", PAST)[0]
+
+    def test_recent_timestamps_are_not_memoised(self, repo, memo):
+        use_case = _use_case(repo, memo)
+        recent = NOW - timedelta(seconds=10)
+
+        use_case.execute(["AAPL"], recent)
+        use_case.execute(["AAPL"], recent)
+
+        assert repo.get_as_of.call_count == 2
+        assert len(memo) == 0
+
+
+class TestAsOfMemo:
+    def test_backfill_invalidates_answers_at_or_after_its_timestamp(self, memo):
+        earlier = PAST - timedelta(days=1)
+        memo.put("AAPL", earlier, None, 0)
+        memo.put("AAPL", PAST, None, 0)
+        memo.put("MSFT", PAST, None, 0)
+
+        memo.on_inserted(_price("AAPL", PAST - timedelta(hours=1)))
+
+        assert memo.lookup("AAPL", earlier) == (True, None)
+        assert memo.lookup("AAPL", PAST) == (False, None)
+        assert memo.lookup("MSFT", PAST) == (True, None)
+
+    def test_answers_read_before_an_insert_landed_are_not_stored(self, memo):
+        generation = memo.generation("AAPL")
+        memo.on_inserted(_price("AAPL", PAST - timedelta(hours=1)))
+
+        memo.put("AAPL", PAST, None, generation)
+
+        assert memo.lookup("AAPL", PAST) == (False, None)
+        memo.put("AAPL", PAST, None, memo.generation("AAPL"))
+        assert memo.lookup("AAPL", PAST) == (True, None)
+
+    def test_evicts_least_recently_used(self):
+        memo = AsOfMemo(max_entries=2)
+        memo.put("A", PAST, None, 0)
+        memo.put("B", PAST, None, 0)
+        memo.lookup("A", PAST)
+
+        memo.put("C", PAST, None, 0)
+
+        assert memo.lookup("B", PAST) == (False, None)
+        assert memo.lookup("A", PAST)[0]
+        assert len(memo) == 2
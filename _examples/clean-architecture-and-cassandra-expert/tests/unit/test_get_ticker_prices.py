@@ -6,8 +6,10 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from src.application.services.downsampling import TooManyRowsError
 from src.application.use_cases.get_ticker_prices import GetTickerPrices
-from src.domain.entities.ticker_price import TickerPrice
+from src.domain.entities.price_columns import PriceColumns
+from src.domain.entities.ticker_price import TickerPrice, TickerPricePage
 
 
 @pytest.fixture
@@ -48,3 +50,60 @@ class TestGetTickerPrices:
         use_case.execute("AAPL", start=start, end=end)
 
         repo.get_by_ticker.assert_called_once_with("AAPL", start=start, end=end)
+
+    def test_page_passes_limit_and_paging_state(self, use_case, repo):
+        repo.get_page.return_value = TickerPricePage(prices=[], paging_state=None)
+
+        page = use_case.execute_page("AAPL", limit=50, paging_state=b"\x00\x01")
+
+        repo.get_page.assert_called_once_with(
+            "AAPL", start=None, end=None, limit=50, paging_state=b"\x00\x01"
+        )
+        assert page.paging_state is None
+
+    def test_stream_yields_repository_pages(self, use_case, repo):
+        repo.iter_pages.return_value = iter([["a", "b"], ["c"]])
+
+        pages = list(use_case.stream("AAPL", page_size=2))
+
+        repo.iter_pages.assert_called_once_with("AAPL", start=None, end=None, page_size=2)
+        assert pages == [["a", "b"], ["c"]]
+
+    def test_downsample_reduces_streamed_pages(self, use_case, repo):
+        base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        repo.iter_columns.return_value = iter([
+            PriceColumns.from_prices("AAPL", [
+                TickerPrice(ticker="AAPL", ts=base.replace(hour=h), price=Decimal(h + 1))
+                for h in reversed(range(12, 24))
+            ]),
+            PriceColumns.from_prices("AAPL", [
+                TickerPrice(ticker="AAPL", ts=base.replace(hour=h), price=Decimal(h + 1))
+                for h in reversed(range(12))
+            ]),
+        ])
+
+        result = use_case.downsample("AAPL", points=5, page_size=12)
+
+        repo.iter_columns.assert_called_once_with("AAPL", start=None, end=None, page_size=12)
+        assert len(result) == 5
+        assert result[0].ts == base.replace(hour=23)
+        assert result[-1].ts == base
+
+    def test_downsample_stops_reading_past_max_rows(self, use_case, repo):
+        base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        page = PriceColumns.from_prices("AAPL", [
+            TickerPrice(ticker="AAPL", ts=base.replace(hour=h), price=Decimal(1))
+            for h in reversed(range(10))
+        ])
+        read = []
+
+        def pages():
+            for _ in range(5):
+                read.append(page)
+                yield page
+
+        repo.iter_columns.return_value = pages()
+
+        with pytest.raises(TooManyRowsError):
+            use_case.downsample("AAPL", points=5, max_rows=15)
+        assert len(read) == 2
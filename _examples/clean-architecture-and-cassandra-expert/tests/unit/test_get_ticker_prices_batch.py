@@ -0,0 +1,38 @@
+"""Unit tests for the GetTickerPricesBatch use case."""
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.application.use_cases.get_ticker_prices_batch import GetTickerPricesBatch
+
+
+@pytest.fixture
+def repo():
+    mock = MagicMock()
+    mock.get_by_tickers.side_effect = lambda tickers, **_: {t: [] for t in tickers}
+    return mock
+
+
+class TestGetTickerPricesBatch:
+    def test_fans_out_once_with_concurrency_cap(self, repo):
+        start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+        result = GetTickerPricesBatch(repo, max_concurrency=8).execute(
+            ["AAPL", "MSFT"], start=start
+        )
+
+        repo.get_by_tickers.assert_called_once_with(
+            ["AAPL", "MSFT"], start=start, end=None, concurrency=8
+        )
+        assert list(result) == ["AAPL", "MSFT"]
+
+    def test_deduplicates_preserving_order(self, repo):
+        result = GetTickerPricesBatch(repo).execute(["MSFT", "AAPL", "MSFT"])
+
+        assert list(result) == ["MSFT", "AAPL"]
+
+    def test_empty_request_skips_repository(self, repo):
+        assert GetTickerPricesBatch(repo).execute([]) == {}
+        repo.get_by_tickers.assert_not_called()
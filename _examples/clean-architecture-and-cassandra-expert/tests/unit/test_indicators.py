@@ -0,0 +1,82 @@
+"""Unit tests for the rolling-window indicator engine."""
+
+import math
+import statistics
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from itertools import pairwise
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.application.services.indicators import IndicatorEngine, RollingWindow
+from src.domain.entities.ticker_price import TickerPrice, TickerPricePage
+
+T0 = datetime(2025, 1, 2, 10, tzinfo=timezone.utc)
+
+
+def _price(second: int, price: str, ticker: str = "AAPL") -> TickerPrice:
+    return TickerPrice(ticker=ticker, ts=T0 + timedelta(seconds=second), price=Decimal(price))
+
+
+class TestRollingWindow:
+    def test_matches_full_recomputation_after_eviction(self):
+        ticks = [(0, 100.0), (10, 102.0), (15, 101.0), (45, 105.0), (50, 104.0)]
+        window = RollingWindow(size=3)
+        for ts, price in ticks:
+            window.push(ts, price)
+
+        snapshot = window.snapshot("AAPL")
+
+        kept = ticks[-3:]
+        returns = [math.log(b[1] / a[1]) for a, b in pairwise(kept)]
+        assert snapshot.count == 3
+        assert snapshot.sma == pytest.approx(statistics.mean(p for _, p in kept))
+        # 101 held for 30s, 105 for 5s.
+        assert snapshot.time_weighted_mean == pytest.approx((101 * 30 + 105 * 5) / 35)
+        assert snapshot.volatility == pytest.approx(statistics.stdev(returns))
+        assert snapshot.last_price == 104.0
+
+    def test_ignores_out_of_order_ticks(self):
+        window = RollingWindow(size=5)
+        window.push(10, 1.0)
+
+        assert not window.push(5, 2.0)
+        assert len(window) == 1
+
+    def test_single_tick(self):
+        window = RollingWindow(size=5)
+        window.push(10, 7.0)
+
+        snapshot = window.snapshot("X")
+        assert snapshot.time_weighted_mean == 7.0
+        assert snapshot.volatility is None
+
+
+class TestIndicatorEngine:
+    def test_updates_from_inserts(self):
+        engine = IndicatorEngine(window=10)
+        engine.on_inserted(_price(0, "10"))
+        engine.on_inserted(_price(1, "12"))
+
+        snapshot = engine.get("AAPL")
+
+        assert snapshot.sma == 11.0
+        assert snapshot.last_ts == T0 + timedelta(seconds=1)
+        assert engine.get("MSFT") is None
+
+    def test_seed_loads_newest_rows_and_keeps_newer_live_ticks(self):
+        engine = IndicatorEngine(window=3)
+        engine.on_inserted(_price(30, "13"))
+        repo = MagicMock()
+        repo.list_tickers.return_value = ["AAPL"]
+        repo.get_page.return_value = TickerPricePage(
+            prices=[_price(20, "12"), _price(10, "11"), _price(0, "10")]
+        )
+
+        assert engine.seed_all(repo) == 1
+
+        repo.get_page.assert_called_once_with("AAPL", limit=3)
+        snapshot = engine.get("AAPL")
+        assert snapshot.count == 3
+        assert snapshot.sma == 12.0
@@ -10,6 +10,7 @@ from src.application.use_cases.insert_ticker_price import (
     DuplicateTickerPriceError,
     InsertTickerPrice,
 )
+from src.domain.entities.price_columns import PriceScales, UnscalablePriceError
 from src.domain.entities.ticker_price import TickerPrice
 
 
@@ -48,3 +49,32 @@ class TestInsertTickerPrice:
             use_case.execute(sample_entity)
 
         repo.insert.assert_not_called()
+
+    def test_notifies_listeners_after_insert(self, repo, sample_entity):
+        repo.exists.return_value = False
+        listener = MagicMock()
+
+        InsertTickerPrice(repo, listeners=[listener]).execute(sample_entity)
+
+        listener.on_inserted.assert_called_once_with(sample_entity)
+
+    def test_listeners_skipped_on_duplicate(self, repo, sample_entity):
+        repo.exists.return_value = True
+        listener = MagicMock()
+
+        with pytest.raises(DuplicateTickerPriceError):
+            InsertTickerPrice(repo, listeners=[listener]).execute(sample_entity)
+
+        listener.on_inserted.assert_not_called()
+
+    def test_rejects_price_too_precise_for_its_currency_before_writing(self, repo):
+        entity = TickerPrice(
+            ticker="AAPL",
+            ts=datetime(2025, 1, 15, 14, 30, tzinfo=timezone.utc),
+            price=Decimal("182.5212345"),
+        )
+
+        with pytest.raises(UnscalablePriceError):
+            InsertTickerPrice(repo, scales=PriceScales({"USD": 6})).execute(entity)
+
+        repo.insert.assert_not_called()
@@ -0,0 +1,95 @@
+"""Unit tests for the latest-price snapshot write path and shard reads."""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.domain.entities.ticker_price import TickerPrice
+from src.infrastructure.cassandra.repositories.cassandra_latest_price_repository import (
+    SHARDS,
+    CassandraLatestPriceRepository,
+    shard_of,
+)
+from src.infrastructure.decorators.snapshot import SnapshotTickerPriceRepository
+
+
+def _price(minute: int, ticker: str = "AAPL") -> TickerPrice:
+    return TickerPrice(
+        ticker=ticker,
+        ts=datetime(2025, 1, 15, 14, minute, tzinfo=timezone.utc),
+        price=Decimal("182.52"),
+    )
+
+
+class TestSnapshotDecorator:
+    def test_single_insert_is_written_through(self):
+        inner, snapshot = MagicMock(), MagicMock()
+
+        SnapshotTickerPriceRepository(inner, snapshot).insert(_price(1))
+
+        inner.insert.assert_called_once_with(_price(1))
+        snapshot.upsert_many.assert_called_once_with([_price(1)])
+
+    def test_bulk_insert_upserts_newest_row_per_ticker(self):
+        inner, snapshot = MagicMock(), MagicMock()
+        rows = [_price(3), _price(5), _price(4), _price(1, "MSFT")]
+
+        SnapshotTickerPriceRepository(inner, snapshot).insert_batch(rows)
+
+        inner.insert_batch.assert_called_once_with(rows, concurrency=16)
+        assert snapshot.upsert_many.call_args.args[0] == [_price(5), _price(1, "MSFT")]
+
+    def test_snapshot_not_touched_when_insert_fails(self):
+        inner, snapshot = MagicMock(), MagicMock()
+        inner.insert_many.side_effect = RuntimeError("down")
+
+        with pytest.raises(RuntimeError):
+            SnapshotTickerPriceRepository(inner, snapshot).insert_many([_price(1)])
+
+        snapshot.upsert_many.assert_not_called()
+
+
+class TestCassandraLatestPriceRepository:
+    def test_shards_are_stable_and_in_range(self):
+        assert shard_of("AAPL") == shard_of("AAPL")
+        assert {shard_of(f"T{i}") for i in range(500)} == set(range(SHARDS))
+
+    def test_get_all_reads_every_shard_and_sorts(self, monkeypatch):
+        calls = []
+
+        def fake_execute(session, stmt, params, **_):
+            calls.append(params)
+            row = SimpleNamespace(
+                ticker="MSFT", ts=datetime(2025, 1, 15), price=Decimal("1"),
+                currency="USD", source="test",
+            )
+            return [SimpleNamespace(result_or_exc=[row]), SimpleNamespace(result_or_exc=[
+                SimpleNamespace(**{**vars(row), "ticker": "AAPL"})
+            ])]
+
+        monkeypatch.setattr(
+            "src.infrastructure.cassandra.repositories.cassandra_latest_price_repository"
+            ".execute_concurrent_with_args",
+            fake_execute,
+        )
+        prices = CassandraLatestPriceRepository(MagicMock()).get_all()
+
+        assert calls == [[(shard,) for shard in range(SHARDS)]]
+        assert [p.ticker for p in prices] == ["AAPL", "MSFT"]
+
+    def test_upsert_uses_price_time_as_write_timestamp(self, monkeypatch):
+        captured = {}
+        monkeypatch.setattr(
+            "src.infrastructure.cassandra.repositories.cassandra_latest_price_repository"
+            ".execute_concurrent_with_args",
+            lambda session, stmt, params, **_: captured.setdefault("params", params),
+        )
+
+        CassandraLatestPriceRepository(MagicMock()).upsert_many([_price(0)])
+
+        (params,) = captured["params"]
+        assert params[0] == shard_of("AAPL")
+        assert params[-1] == 1736949600 * 1_000_000
@@ -0,0 +1,28 @@
+"""Unit tests for the in-process metrics registry."""
+
+from src.infrastructure.metrics import MetricsRegistry
+
+
+def test_render_uses_prometheus_text_format():
+    registry = MetricsRegistry()
+    registry.counter("requests_total", "Requests served").inc(3)
+    registry.gauge("queue_depth", "Rows waiting", lambda: 7)
+    histogram = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 2.0):
+        histogram.observe(value)
+
+    text = registry.render()
+
+    assert "# TYPE requests_total counter\nrequests_total 3\n" in text
+    assert "# TYPE queue_depth gauge\nqueue_depth 7\n" in text
+    assert 'latency_seconds_bucket{le="0.1"} 1\n' in text
+    assert 'latency_seconds_bucket{le="1.0"} 2\n' in text
+    assert 'latency_seconds_bucket{le="+Inf"} 3\n' in text
+    assert "latency_seconds_count 3\n" in text
+
+
+def test_registering_a_name_twice_returns_the_same_instrument():
+    registry = MetricsRegistry()
+
+    assert registry.counter("x_total", "x") is registry.counter("x_total", "x")
+    assert registry.histogram("h", "h", (1,)) is registry.histogram("h", "h", (1,))
@@ -0,0 +1,72 @@
+"""Unit tests for archiving rows before their TTL expires (no Cassandra needed)."""
+
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+from src.domain.entities.candle import Resolution  # noqa: E402
+from src.domain.entities.ticker_price import TickerPrice  # noqa: E402
+from src.infrastructure.pipelines.price_archive import archive_expiring  # noqa: E402
+
+
+def _price(ticker: str, hour: int, price: str) -> TickerPrice:
+    return TickerPrice(
+        ticker=ticker, ts=datetime(2024, 1, 15, hour, tzinfo=timezone.utc), price=Decimal(price)
+    )
+
+
+def _prices(live: dict[str, list[TickerPrice]]) -> MagicMock:
+    prices = MagicMock()
+    prices.expiring_days.return_value = {(t, date(2024, 1, 15)) for t in live}
+    prices.iter_pages.side_effect = lambda ticker, **_: iter([live[ticker]])
+    return prices
+
+
+def _archive(prices, candles, out, today):
+    return archive_expiring(prices, candles, out, today=today, report=lambda _: None)
+
+
+def test_archives_days_holding_expiring_rows_and_their_rollups(tmp_path):
+    prices = _prices({"AAPL": [_price("AAPL", 15, "2"), _price("AAPL", 14, "1")], "MSFT": []})
+    candles = MagicMock()
+
+    copied = _archive(prices, candles, tmp_path, date(2025, 1, 15))
+
+    assert copied == 2
+    start = prices.iter_pages.call_args_list[0].kwargs["start"]
+    assert start == datetime(2024, 1, 15, tzinfo=timezone.utc)
+    partition = tmp_path / "ticker=AAPL" / "date=2024-01-15"
+    assert pq.read_table(partition / "archive-2025-01-15.parquet").num_rows == 2
+    assert not (tmp_path / "ticker=MSFT").exists()
+    written = [c.args[0] for c in candles.upsert.call_args_list]
+    assert written.count(Resolution.DAY) == 1
+
+
+def test_later_runs_copy_only_new_rows_and_roll_up_the_archived_ones(tmp_path):
+    _archive(_prices({"AAPL": [_price("AAPL", 14, "1")]}), MagicMock(), tmp_path, date(2025, 1, 15))
+    # The 14:00 row has expired since; a late import added 15:00 with a fresh TTL.
+    candles = MagicMock()
+
+    copied = _archive(
+        _prices({"AAPL": [_price("AAPL", 15, "3")]}), candles, tmp_path, date(2025, 6, 1)
+    )
+
+    assert copied == 1
+    partition = tmp_path / "ticker=AAPL" / "date=2024-01-15"
+    assert pq.read_table(partition / "archive-2025-06-01.parquet").num_rows == 1
+    day = next(c.args[1] for c in candles.upsert.call_args_list if c.args[0] == Resolution.DAY)
+    assert (day.open, day.close, day.count) == (Decimal(1), Decimal(3), 2)
+
+
+def test_days_already_archived_are_not_rewritten(tmp_path):
+    live = {"AAPL": [_price("AAPL", 14, "1")]}
+    _archive(_prices(live), MagicMock(), tmp_path, date(2025, 1, 15))
+    candles = MagicMock()
+
+    assert _archive(_prices(live), candles, tmp_path, date(2025, 1, 16)) == 0
+    candles.upsert.assert_not_called()
+    assert not list(tmp_path.glob("**/archive-2025-01-16.parquet"))
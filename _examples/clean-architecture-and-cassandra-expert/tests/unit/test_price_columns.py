@@ -0,0 +1,114 @@
+"""Unit tests for packed price columns and scaled-integer price storage."""
+
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.domain.entities.price_columns import PriceColumns, UnscalablePriceError, decompose
+from src.domain.entities.ticker_price import TickerPrice
+from src.infrastructure.cassandra.repositories.cassandra_ticker_price_repository import (
+    MIN_HISTORY_TTL,
+    CassandraTickerPriceRepository,
+)
+
+Scale = namedtuple("Scale", "currency scale")
+ScaledRow = namedtuple("ScaledRow", "ticker ts price_scaled currency source")
+
+
+def _price(minute: int, price: str, currency: str = "USD") -> TickerPrice:
+    return TickerPrice(
+        ticker="AAPL",
+        ts=datetime(2025, 1, 15, 14, minute),
+        price=Decimal(price),
+        currency=currency,
+    )
+
+
+def _repo(read_mode: str = "decimal") -> CassandraTickerPriceRepository:
+    session = MagicMock()
+    session.execute.return_value = [Scale("USD", 6), Scale("JPY", 4)]
+    return CassandraTickerPriceRepository(session, read_mode=read_mode)
+
+
+@pytest.mark.parametrize("price", ["182.52", "182.520", "0.000001", "-3.5", "1E+3", "0"])
+def test_decompose_preserves_value_and_scale(price):
+    mantissa, exponent = decompose(Decimal(price))
+
+    assert str(Decimal(mantissa).scaleb(exponent)) == str(Decimal(price))
+
+
+def test_columns_round_trip_prices():
+    prices = [_price(2, "182.520"), _price(1, "182.5"), _price(0, "99.99", currency="JPY")]
+
+    columns = PriceColumns.from_prices("AAPL", prices)
+
+    assert columns.to_prices() == prices
+    assert [str(p.price) for p in columns.to_prices()] == ["182.520", "182.5", "99.99"]
+    np.testing.assert_allclose(columns.floats(), [182.52, 182.5, 99.99])
+    assert len(columns.slice(1, 3)) == 2
+
+
+def test_columns_reject_prices_that_overflow():
+    with pytest.raises(ValueError):
+        PriceColumns.from_prices("AAPL", [_price(0, "1" * 20)])
+
+
+@pytest.mark.parametrize(
+    ("price", "currency", "expected"),
+    [
+        ("182.52", "USD", 182_520_000),
+        ("182.5200000", "USD", 182_520_000),
+        ("150", "JPY", 1_500_000),
+        ("0.0000001", "USD", None),
+        ("1" * 19, "USD", None),
+        ("1.5", "CHF", 1_500_000),
+    ],
+)
+def test_scale_price_uses_the_currency_scale(price, currency, expected):
+    assert _repo().scale_price(Decimal(price), currency) == expected
+
+
+def test_scaled_read_mode_selects_and_decodes_only_bigints():
+    repo = _repo("scaled")
+    row = ScaledRow("AAPL", datetime(2025, 1, 15), 182_520_000, "USD", "m")
+
+    assert repo._to_entity(row).price == Decimal("182.52")
+    assert repo._to_column_row(row)[1:3] == (182_520_000, -6)
+    queries = [c.args[0] for c in repo._session.prepare.call_args_list]
+    range_query = next(q for q in queries if "ts >= ?" in q)
+    assert range_query.startswith("SELECT ticker, ts, price_scaled, currency, source ")
+
+
+def test_scaled_read_mode_rejects_rows_missing_the_backfill():
+    row = ScaledRow("AAPL", datetime(2025, 1, 15), None, "USD", "m")
+
+    with pytest.raises(ValueError, match="backfill"):
+        _repo("scaled")._to_entity(row)
+
+
+def test_writes_reject_prices_that_do_not_fit_the_scale():
+    repo = _repo()
+
+    with pytest.raises(UnscalablePriceError):
+        repo.insert(_price(0, "0.0000001"))
+    repo._session.execute.assert_called_once()  # only the price_scales load
+
+
+def test_history_ttl_counts_from_the_row_ts():
+    session = MagicMock()
+    session.execute.return_value = []
+    repo = CassandraTickerPriceRepository(session, default_ttl=365 * 86400, ttl_from_ts=True)
+    now = datetime.now(timezone.utc)
+
+    def aged(days: int) -> TickerPrice:
+        return TickerPrice(ticker="AAPL", ts=now - timedelta(days=days), price=Decimal(1))
+
+    recent, ancient = repo._ttl_for(aged(5)), repo._ttl_for(aged(900))
+
+    assert 359 * 86400 < recent <= 360 * 86400
+    assert ancient == MIN_HISTORY_TTL
+    assert _repo()._ttl_for(_price(0, "1")) is None
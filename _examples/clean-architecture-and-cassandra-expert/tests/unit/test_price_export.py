@@ -0,0 +1,109 @@
+"""Unit tests for the token-range Parquet export (no Cassandra needed)."""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from itertools import pairwise
+from unittest.mock import MagicMock
+
+import pytest
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+from src.domain.entities.ticker_price import TickerPrice  # noqa: E402
+from src.infrastructure.cassandra.token_ranges import (  # noqa: E402
+    MAX_TOKEN,
+    MIN_TOKEN,
+    TokenRange,
+    split_token_ring,
+)
+from src.infrastructure.pipelines.price_export import export_range  # noqa: E402
+
+
+def _price(ticker: str, day: int, minute: int, price: str) -> TickerPrice:
+    return TickerPrice(
+        ticker=ticker,
+        ts=datetime(2025, 1, day, 14, minute, tzinfo=timezone.utc),
+        price=Decimal(price),
+        currency="USD",
+        source="test",
+    )
+
+
+@pytest.mark.parametrize("splits", [1, 3, 256])
+def test_split_token_ring_covers_ring_without_gaps(splits):
+    ranges = split_token_ring(splits)
+
+    assert len(ranges) == splits
+    assert ranges[0].start == MIN_TOKEN
+    assert ranges[-1].end == MAX_TOKEN
+    for prev, nxt in pairwise(ranges):
+        assert prev.end == nxt.start
+        assert prev.start < prev.end
+    assert [r.index for r in ranges] == list(range(splits))
+
+
+def test_export_range_partitions_by_ticker_and_day(tmp_path):
+    repo = MagicMock()
+    repo.scan_token_range.return_value = iter([
+        [_price("AAPL", 15, 0, "182.52"), _price("AAPL", 16, 0, "183.00")],
+        [_price("MSFT", 15, 1, "400.10"), _price("AAPL", 15, 2, "182.60")],
+    ])
+
+    written = export_range(repo, TokenRange(7, -10, 10), tmp_path, page_size=2)
+
+    assert written == 4
+    repo.scan_token_range.assert_called_once_with(-10, 10, 2)
+    aapl = pq.read_table(tmp_path / "ticker=AAPL" / "date=2025-01-15").to_pylist()
+    assert [row["price"] for row in aapl] == [Decimal("182.52"), Decimal("182.60")]
+    assert (tmp_path / "ticker=AAPL" / "date=2025-01-16").is_dir()
+    assert (tmp_path / "ticker=MSFT" / "date=2025-01-15").is_dir()
+    assert all(p.name.startswith("part-00007-") for p in tmp_path.rglob("*.parquet"))
+
+
+def test_export_range_keeps_eighteen_decimal_places(tmp_path):
+    repo = MagicMock()
+    repo.scan_token_range.return_value = iter([[_price("BTC", 15, 0, "0.000000000000000001")]])
+
+    export_range(repo, TokenRange(0, -10, 10), tmp_path)
+
+    (row,) = pq.read_table(tmp_path / "ticker=BTC").to_pylist()
+    assert row["price"] == Decimal("0.000000000000000001")
+
+
+@pytest.mark.parametrize("price", ["0.0000000000000000001", "1E+20"])
+def test_export_range_rejects_prices_that_do_not_fit(tmp_path, price):
+    repo = MagicMock()
+    repo.scan_token_range.return_value = iter([[_price("BTC", 15, 0, price)]])
+
+    with pytest.raises(ValueError, match=r"BTC price .* does not fit decimal128\(38, 18\)"):
+        export_range(repo, TokenRange(0, -10, 10), tmp_path)
+
+
+def test_export_range_flushes_when_buffer_is_full(tmp_path):
+    repo = MagicMock()
+    repo.scan_token_range.return_value = iter([
+        [_price("AAPL", 15, 0, "1")],
+        [_price("AAPL", 15, 1, "2")],
+        [_price("AAPL", 15, 2, "3")],
+    ])
+
+    export_range(repo, TokenRange(0, -10, 10), tmp_path, max_buffer_rows=1)
+
+    assert len(list((tmp_path / "ticker=AAPL" / "date=2025-01-15").glob("*.parquet"))) == 3
+
+
+def test_export_range_retry_replaces_partial_output(tmp_path):
+    stale = tmp_path / "ticker=AAPL" / "date=2025-01-15"
+    stale.mkdir(parents=True)
+    (stale / "part-00003-00009.parquet").write_bytes(b"partial")
+    (stale / "part-00003-00010.parquet.tmp").write_bytes(b"partial")
+    (stale / "part-00004-00000.parquet").write_bytes(b"other range")
+    repo = MagicMock()
+    repo.scan_token_range.return_value = iter([[_price("AAPL", 15, 0, "1")]])
+
+    export_range(repo, TokenRange(3, -10, 10), tmp_path)
+
+    assert sorted(p.name for p in stale.iterdir()) == [
+        "part-00003-00000.parquet",
+        "part-00004-00000.parquet",
+    ]
@@ -0,0 +1,92 @@
+"""Unit tests for the in-process live price fan-out."""
+
+import asyncio
+import threading
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from src.api.routes.ticker_prices import websocket_live_prices
+from src.application.services.price_hub import PriceHub
+from src.domain.entities.ticker_price import TickerPrice
+
+
+def _price(minute: int, ticker: str = "AAPL") -> TickerPrice:
+    return TickerPrice(
+        ticker=ticker,
+        ts=datetime(2025, 1, 2, 10, minute, tzinfo=timezone.utc),
+        price=Decimal("182.52"),
+    )
+
+
+async def test_subscriber_receives_prices_for_its_ticker_only():
+    hub = PriceHub()
+    aapl = hub.subscribe("AAPL")
+
+    hub.on_inserted(_price(1, "MSFT"))
+    hub.on_inserted(_price(2))
+
+    assert await aapl.next(timeout=1) == _price(2)
+    with pytest.raises(TimeoutError):
+        await aapl.next(timeout=0.01)
+
+
+async def test_publishing_from_another_thread_is_delivered_on_the_loop():
+    hub = PriceHub()
+    subscription = hub.subscribe("AAPL")
+
+    thread = threading.Thread(target=hub.on_inserted, args=(_price(1),))
+    thread.start()
+    thread.join()
+
+    assert await subscription.next(timeout=1) == _price(1)
+
+
+async def test_slow_subscriber_is_dropped_without_affecting_others():
+    hub = PriceHub(queue_size=2)
+    slow = hub.subscribe("AAPL")
+    fast = hub.subscribe("AAPL")
+
+    for minute in range(3):
+        hub.on_inserted(_price(minute))
+        await asyncio.sleep(0)
+        if minute < 2:
+            assert await fast.next(timeout=1) == _price(minute)
+
+    assert await slow.next(timeout=1) is None
+    assert slow.dropped
+    assert hub.dropped == 1
+    assert hub.subscriber_count == 1
+    assert await fast.next(timeout=1) == _price(2)
+
+
+async def test_close_unsubscribes():
+    hub = PriceHub()
+    subscription = hub.subscribe("AAPL")
+
+    subscription.close()
+    hub.on_inserted(_price(1))
+
+    assert hub.subscriber_count == 0
+    with pytest.raises(TimeoutError):
+        await subscription.next(timeout=0.01)
+
+
+
+class _LeavingClient:
+    """WebSocket stand-in whose client disconnects without sending anything."""
+
+    async def accept(self) -> None:
+        pass
+
+    async def receive(self) -> dict:
+        return {"type": "websocket.disconnect", "code": 1000}
+
+
+async def test_websocket_unsubscribes_when_client_leaves_a_quiet_ticker():
+    hub = PriceHub()
+
+    await asyncio.wait_for(websocket_live_prices(_LeavingClient(), "AAPL", hub), timeout=1)
+
+    assert hub.subscriber_count == 0
@@ -0,0 +1,114 @@
+"""Unit tests for the bulk price import pipeline (no Cassandra needed)."""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from src.domain.entities.price_columns import PriceScales  # noqa: E402
+from src.infrastructure.pipelines.price_import import (  # noqa: E402
+    Checkpoint,
+    read_chunks,
+    to_entities,
+)
+
+CSV = """ticker,timestamp,price,source
+aapl,2025-01-15T14:30:00Z,182.52,vendor
+msft,2025-01-15T14:31:00Z,400.10,
+goog,2025-01-15T14:32:00Z,140,vendor
+aapl,2025-01-15T14:33:00Z,182.60,vendor
+msft,2025-01-15T14:34:00Z,400.20,vendor
+"""
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "prices.csv"
+    path.write_text(CSV)
+    return path
+
+
+class TestReadChunks:
+    def test_rechunks_to_fixed_size(self, csv_file):
+        sizes = [b.num_rows for b in read_chunks(csv_file, chunk_size=2)]
+        assert sizes == [2, 2, 1]
+
+    def test_skips_checkpointed_prefix(self, csv_file):
+        (batch,) = read_chunks(csv_file, chunk_size=10, skip_rows=3)
+        assert batch.column("ticker").to_pylist() == ["aapl", "msft"]
+
+    def test_reads_parquet(self, csv_file, tmp_path):
+        parquet = tmp_path / "prices.parquet"
+        pq.write_table(pa.Table.from_batches(list(read_chunks(csv_file, 10))), parquet)
+        assert sum(b.num_rows for b in read_chunks(parquet, chunk_size=4)) == 5
+
+
+class TestToEntities:
+    def test_normalises_columns(self, csv_file):
+        (batch,) = read_chunks(csv_file, chunk_size=10)
+
+        rows, rejected = to_entities(batch, default_source="bulk")
+
+        assert rejected == 0
+        assert rows[0].ticker == "AAPL"
+        assert rows[0].ts == datetime(2025, 1, 15, 14, 30, tzinfo=timezone.utc)
+        assert rows[0].price == Decimal("182.52")
+        assert rows[0].currency == "USD"
+        assert rows[1].source == "bulk"
+
+    def test_skips_and_counts_rows_the_api_would_reject(self):
+        batch = pa.record_batch({
+            "ticker": ["AAPL", None, "  ", "MSFT", "MSFT", "MSFT", "MSFT", "WAYTOOLONGTICKER"],
+            "timestamp": pa.array([datetime(2025, 1, 15, tzinfo=timezone.utc)] * 8),
+            "price": ["1.5", "2", "2", None, " ", "abc", "-1", "2"],
+        })
+
+        rows, rejected = to_entities(batch)
+
+        assert [(r.ticker, r.price) for r in rows] == [("AAPL", Decimal("1.5"))]
+        assert rejected == 7
+
+    def test_skips_prices_too_precise_for_their_currency(self):
+        batch = pa.record_batch({
+            "ticker": ["AAPL", "AAPL"],
+            "timestamp": pa.array([datetime(2025, 1, 15, tzinfo=timezone.utc)] * 2),
+            "price": ["1.25", "1.255"],
+        })
+
+        rows, rejected = to_entities(batch, scales=PriceScales({"USD": 2}))
+
+        assert [r.price for r in rows] == [Decimal("1.25")]
+        assert rejected == 1
+
+    def test_rejects_missing_columns(self):
+        batch = pa.record_batch({"ticker": ["AAPL"]})
+        with pytest.raises(ValueError, match="timestamp, price"):
+            to_entities(batch)
+
+
+class TestCheckpoint:
+    def test_round_trip(self, tmp_path, csv_file):
+        path = tmp_path / "cp.json"
+        Checkpoint.load(path, csv_file).save(1234, 5)
+        checkpoint = Checkpoint.load(path, csv_file)
+        assert (checkpoint.rows_done, checkpoint.rows_rejected) == (1234, 5)
+
+    def test_round_trips_the_widened_ticker_spans(self, tmp_path, csv_file):
+        path = tmp_path / "cp.json"
+        t = [datetime(2024, 1, d, tzinfo=timezone.utc) for d in (1, 2, 3)]
+        checkpoint = Checkpoint.load(path, csv_file)
+        checkpoint.cover({"AAPL": (t[1], t[1])})
+        checkpoint.cover({"AAPL": (t[0], t[2]), "MSFT": (t[1], t[1])})
+        checkpoint.save(10)
+
+        assert Checkpoint.load(path, csv_file).spans == {
+            "AAPL": (t[0], t[2]), "MSFT": (t[1], t[1])
+        }
+
+    def test_ignores_checkpoint_of_other_file(self, tmp_path, csv_file):
+        path = tmp_path / "cp.json"
+        Checkpoint.load(path, tmp_path / "other.csv").save(99)
+        assert Checkpoint.load(path, csv_file).rows_done == 0
@@ -0,0 +1,106 @@
+"""Unit tests for price alignment and the GetPriceMatrix use case."""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.application.services.downsampling import PriceSeries
+from src.application.services.price_matrix import PriceMatrix, time_grid
+from src.application.use_cases.get_price_matrix import GetPriceMatrix
+from src.domain.entities.price_columns import PriceColumns
+from src.domain.entities.ticker_price import TickerPrice
+
+T0 = datetime(2025, 1, 2, 10, tzinfo=timezone.utc)
+
+
+def _series(ticker: str, points: list[tuple[int, float]]) -> PriceSeries:
+    """``points`` are (minute offset from T0, price), oldest first."""
+    prices = [
+        TickerPrice(ticker=ticker, ts=T0 + timedelta(minutes=m), price=Decimal(str(p)))
+        for m, p in reversed(points)
+    ]
+    return PriceSeries.from_pages(ticker, [prices])
+
+
+class TestAlign:
+    def test_forward_fills_onto_the_grid(self):
+        grid = time_grid(T0, T0 + timedelta(minutes=4), 60)
+        matrix = PriceMatrix.align(
+            [_series("A", [(0, 10.0), (2, 11.0)]), _series("B", [(1, 5.0), (4, 6.0)])], grid
+        )
+
+        assert matrix.tickers == ("A", "B")
+        np.testing.assert_array_equal(matrix.prices[:, 0], [10, 10, 11, 11, 11])
+        np.testing.assert_array_equal(matrix.prices[:, 1], [np.nan, 5, 5, 5, 6])
+
+    def test_seed_fills_before_first_observation(self):
+        grid = time_grid(T0, T0 + timedelta(minutes=2), 60)
+        matrix = PriceMatrix.align([_series("B", [(1, 5.0)]), _series("C", [])], grid, [4.0, 7.0])
+
+        np.testing.assert_array_equal(matrix.prices, [[4, 7], [5, 7], [5, 7]])
+
+    def test_correlation_of_returns(self):
+        grid = time_grid(T0, T0 + timedelta(minutes=3), 60)
+        up = _series("UP", [(0, 100.0), (1, 110.0), (2, 99.0), (3, 108.9)])
+        down = _series("DOWN", [(0, 50.0), (1, 45.0), (2, 49.5), (3, 44.55)])
+        matrix = PriceMatrix.align([up, down], grid)
+
+        np.testing.assert_allclose(matrix.correlation(), [[1, -1], [-1, 1]])
+        variance = np.var([0.1, -0.1, 0.1], ddof=1)
+        np.testing.assert_allclose(np.diag(matrix.covariance()), [variance, variance])
+
+    def test_statistics_are_nan_without_two_complete_steps(self):
+        matrix = PriceMatrix.align([_series("A", [(0, 1.0)])], time_grid(T0, T0, 60))
+
+        assert np.isnan(matrix.correlation()).all()
+
+
+class TestGetPriceMatrix:
+    @pytest.fixture
+    def repo(self):
+        mock = MagicMock()
+        mock.get_as_of.return_value = {
+            "A": TickerPrice(ticker="A", ts=T0 - timedelta(hours=1), price=Decimal("9")),
+            "B": None,
+        }
+        mock.iter_columns.side_effect = lambda ticker, **_: iter(
+            [PriceColumns.from_prices(ticker, _series(ticker, [(1, 10.0)]).take(np.arange(1)))]
+        )
+        return mock
+
+    def test_reads_each_ticker_range_and_seeds_from_as_of(self, repo):
+        matrix = GetPriceMatrix(repo).execute(["A", "B", "A"], T0, T0 + timedelta(minutes=1), 60)
+
+        repo.get_as_of.assert_called_once_with(["A", "B"], T0, concurrency=32)
+        assert repo.iter_columns.call_count == 2
+        np.testing.assert_array_equal(matrix.prices, [[9, np.nan], [10, 10]])
+
+    def test_rejects_oversized_matrix(self, repo):
+        use_case = GetPriceMatrix(repo, max_cells=10)
+
+        with pytest.raises(ValueError, match="exceeds"):
+            use_case.execute(["A", "B"], T0, T0 + timedelta(minutes=10), 60)
+        repo.get_as_of.assert_not_called()
+
+    def test_rejects_oversized_matrix_before_building_the_grid(self, repo, monkeypatch):
+        built = MagicMock()
+        monkeypatch.setattr("src.application.use_cases.get_price_matrix.time_grid", built)
+
+        with pytest.raises(ValueError, match="exceeds"):
+            GetPriceMatrix(repo).execute(["A"], T0, T0 + timedelta(days=3650), 1)
+        built.assert_not_called()
+
+    def test_rejects_blank_tickers(self, repo):
+        with pytest.raises(ValueError, match="blank"):
+            GetPriceMatrix(repo).execute(["A", " "], T0, T0 + timedelta(minutes=1), 60)
+        repo.get_as_of.assert_not_called()
+
+    def test_accepts_naive_and_aware_bounds_together(self, repo):
+        naive_end = (T0 + timedelta(minutes=1)).replace(tzinfo=None)
+
+        matrix = GetPriceMatrix(repo).execute(["A", "B"], T0, naive_end, 60)
+
+        assert len(matrix.grid) == 2
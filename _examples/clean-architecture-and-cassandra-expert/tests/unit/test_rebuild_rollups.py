@@ -0,0 +1,47 @@
+"""Unit tests for the RebuildRollups use case."""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+from src.application.use_cases.rebuild_rollups import RebuildRollups
+from src.domain.entities.candle import Resolution
+from src.domain.entities.ticker_price import TickerPrice
+
+
+def _tick(day: int, minute: int) -> TickerPrice:
+    return TickerPrice(
+        ticker="AAPL", ts=datetime(2025, 1, day, 14, minute, tzinfo=timezone.utc), price=Decimal(1)
+    )
+
+
+class TestRebuildRollups:
+    def test_writes_every_resolution(self):
+        prices = MagicMock()
+        prices.iter_pages.return_value = iter([[_tick(15, minute) for minute in (3, 2, 1)]])
+        candles = MagicMock()
+
+        read = RebuildRollups(prices, candles).execute("AAPL")
+
+        assert read == 3
+        written = [c.args[0] for c in candles.upsert.call_args_list]
+        assert written.count(Resolution.MINUTE) == 3
+        assert written.count(Resolution.HOUR) == 1
+        assert written.count(Resolution.DAY) == 1
+
+    def test_writes_day_by_day_across_pages_over_whole_days(self):
+        prices = MagicMock()
+        prices.iter_pages.return_value = iter(
+            [[_tick(16, 5), _tick(16, 4)], [_tick(16, 3), _tick(15, 2)], [_tick(15, 1)]]
+        )
+        candles = MagicMock()
+
+        RebuildRollups(prices, candles).execute(
+            "AAPL", datetime(2025, 1, 15, 14, tzinfo=timezone.utc), datetime(2025, 1, 16, 9)
+        )
+
+        kwargs = prices.iter_pages.call_args.kwargs
+        assert kwargs["start"] == datetime(2025, 1, 15, tzinfo=timezone.utc)
+        assert kwargs["end"] == datetime(2025, 1, 16, 23, 59, 59, 999000, tzinfo=timezone.utc)
+        days = [c.args[1] for c in candles.upsert.call_args_list if c.args[0] == Resolution.DAY]
+        assert [(d.bucket.day, d.count) for d in days] == [(16, 3), (15, 2)]
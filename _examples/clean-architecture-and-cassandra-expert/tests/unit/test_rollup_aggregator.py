@@ -0,0 +1,93 @@
+"""Unit tests for the RollupAggregator ingest-time buffer."""
+
+from collections import namedtuple
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.application.services.rollup_aggregator import RollupAggregator
+from src.domain.entities.candle import Candle, Resolution
+from src.domain.entities.ticker_price import TickerPrice
+from src.infrastructure.cassandra.repositories.cassandra_candle_repository import (
+    CassandraCandleRepository,
+)
+
+
+@pytest.fixture
+def repo():
+    return MagicMock()
+
+
+@pytest.fixture
+def aggregator(repo):
+    return RollupAggregator(repo, flush_interval=60)
+
+
+def _tick(second: int, price: str) -> TickerPrice:
+    return TickerPrice(
+        ticker="AAPL",
+        ts=datetime(2025, 1, 15, 14, 30, second, tzinfo=timezone.utc),
+        price=Decimal(price),
+    )
+
+
+class TestRollupAggregator:
+    def test_folds_ticks_into_one_bucket_per_resolution(self, aggregator):
+        aggregator.add_many([_tick(1, "10"), _tick(2, "12")])
+
+        for res in Resolution:
+            (candle,) = aggregator.pending("AAPL", res)
+            assert candle.count == 2
+            assert candle.close == Decimal("12")
+
+    def test_flush_writes_and_clears(self, aggregator, repo):
+        aggregator.on_inserted(_tick(1, "10"))
+
+        written = aggregator.flush()
+
+        assert written == len(Resolution)
+        assert repo.merge.call_count == len(Resolution)
+        repo.upsert.assert_not_called()
+        assert aggregator.pending("AAPL", Resolution.MINUTE) == []
+
+    def test_flush_merges_each_bucket_once(self, aggregator, repo):
+        aggregator.add_many([_tick(1, "10"), _tick(2, "12")])
+
+        aggregator.flush()
+
+        minute = [c.args[1] for c in repo.merge.call_args_list if c.args[0] == Resolution.MINUTE]
+        assert [c.count for c in minute] == [2]
+
+    def test_failed_flush_keeps_buckets(self, aggregator, repo):
+        repo.merge.side_effect = RuntimeError("cassandra down")
+        aggregator.add_many([_tick(1, "10")])
+
+        with pytest.raises(RuntimeError):
+            aggregator.flush()
+
+        assert len(aggregator.pending("AAPL", Resolution.DAY)) == 1
+
+
+class TestCassandraMerge:
+    Row = namedtuple("Row", "ticker bucket open high low close open_ts close_ts tick_count")
+
+    def _read(self, count: int) -> MagicMock:
+        at = datetime(2025, 1, 15, 14, 30, 1, tzinfo=timezone.utc)
+        row = self.Row("AAPL", at, 10, 10, 10, 10, at, at, count)
+        return MagicMock(one=MagicMock(return_value=row))
+
+    def test_retries_with_the_current_row_when_another_merge_won(self):
+        session = MagicMock()
+        session.execute.side_effect = [
+            self._read(1), MagicMock(was_applied=False), self._read(5), MagicMock(was_applied=True)
+        ]
+        repo = CassandraCandleRepository(session)
+        candle = Candle.from_price(_tick(2, "12"), Resolution.MINUTE.seconds)
+
+        repo.merge(Resolution.MINUTE, candle)
+
+        swaps = [c.args[1] for c in session.execute.call_args_list if len(c.args) == 2]
+        assert [values[6] for values in swaps] == [2, 6]
+        assert [values[9] for values in swaps] == [1, 5]
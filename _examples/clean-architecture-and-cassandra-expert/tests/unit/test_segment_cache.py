@@ -0,0 +1,182 @@
+"""Unit tests for the closed-segment cache in front of the price repository."""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from src.domain.entities.candle import as_utc
+from src.domain.entities.ticker_price import TickerPrice
+from src.infrastructure.decorators.segment_cache import (
+    Segment,
+    SegmentCachedTickerPriceRepository,
+    SegmentStore,
+)
+
+NOW = datetime(2025, 1, 20, 12, 0, tzinfo=timezone.utc)
+
+
+class InMemoryRepo:
+    """Mimics the driver: naive UTC timestamps, newest first, inclusive bounds."""
+
+    def __init__(self) -> None:
+        self.rows: list[TickerPrice] = []
+        self.calls: list[tuple[str, datetime | None, datetime | None]] = []
+
+    def insert(self, entity: TickerPrice) -> None:
+        self.rows.append(entity)
+
+    def get_by_ticker(self, ticker, start=None, end=None):
+        self.calls.append(("get_by_ticker", start, end))
+        return self._select(ticker, start, end)
+
+    def iter_pages(self, ticker, start=None, end=None, page_size=1000):
+        self.calls.append(("iter_pages", start, end))
+        rows = self._select(ticker, start, end)
+        for offset in range(0, max(len(rows), 1), page_size):
+            yield rows[offset : offset + page_size]
+
+    def _select(self, ticker, start, end):
+        rows = [
+            r for r in self.rows
+            if r.ticker == ticker
+            and (start is None or as_utc(r.ts) >= as_utc(start))
+            and (end is None or as_utc(r.ts) <= as_utc(end))
+        ]
+        return sorted(rows, key=lambda r: r.ts, reverse=True)
+
+
+def _price(day: int, hour: int, price: str, source: str = "test") -> TickerPrice:
+    return TickerPrice(
+        ticker="AAPL", ts=datetime(2025, 1, day, hour), price=Decimal(price), source=source
+    )
+
+
+@pytest.fixture
+def inner():
+    repo = InMemoryRepo()
+    for day in range(10, 21):
+        repo.insert(_price(day, 10, f"{180 + day}.50"))
+        repo.insert(_price(day, 11, f"{180 + day}.500", source="vendor"))
+    return repo
+
+
+@pytest.fixture
+def store():
+    return SegmentStore(max_bytes=1024 * 1024)
+
+
+@pytest.fixture
+def repo(inner, store):
+    return SegmentCachedTickerPriceRepository(inner, store, now=lambda: NOW)
+
+
+def test_range_matches_the_database_exactly(repo, inner):
+    start = datetime(2025, 1, 12, 10, 30, tzinfo=timezone.utc)
+
+    cached = repo.get_by_ticker("AAPL", start=start)
+
+    assert cached == inner.get_by_ticker("AAPL", start=start)
+    assert [str(p.price) for p in cached[:2]] == ["200.500", "200.50"]
+    assert cached[0].ts.tzinfo is None
+
+
+def test_closed_days_are_read_once_and_only_the_tail_is_requeried(repo, inner):
+    start = datetime(2025, 1, 10, tzinfo=timezone.utc)
+    repo.get_by_ticker("AAPL", start=start)
+    inner.calls.clear()
+
+    repo.get_by_ticker("AAPL", start=start)
+
+    assert inner.calls == [("get_by_ticker", datetime(2025, 1, 20, tzinfo=timezone.utc), None)]
+
+
+def test_range_inside_closed_history_needs_no_tail_query(repo, inner):
+    start = datetime(2025, 1, 11, 11, tzinfo=timezone.utc)
+    end = datetime(2025, 1, 13, 10, tzinfo=timezone.utc)
+
+    prices = repo.get_by_ticker("AAPL", start=start, end=end)
+
+    assert [p.ts.day for p in prices] == [13, 12, 12, 11]
+    assert [call[0] for call in inner.calls] == ["iter_pages"]
+
+
+def test_insert_invalidates_the_touched_segment(repo, inner):
+    start = datetime(2025, 1, 15, tzinfo=timezone.utc)
+    end = datetime(2025, 1, 15, 23, tzinfo=timezone.utc)
+    repo.get_by_ticker("AAPL", start=start, end=end)
+
+    repo.insert(_price(15, 12, "999.99"))
+
+    assert repo.get_by_ticker("AAPL", start=start, end=end)[0].price == Decimal("999.99")
+
+
+def test_unbounded_start_goes_to_the_database(repo, inner, store):
+    repo.get_by_ticker("AAPL")
+
+    assert inner.calls == [("get_by_ticker", None, None)]
+    assert len(store) == 0
+
+
+def test_iter_pages_splits_cached_days_into_pages(repo):
+    start = datetime(2025, 1, 10, tzinfo=timezone.utc)
+    end = datetime(2025, 1, 14, 23, tzinfo=timezone.utc)
+
+    pages = list(repo.iter_pages("AAPL", start=start, end=end, page_size=3))
+
+    assert [len(page) for page in pages] == [2, 2, 2, 2, 2]
+    assert [p.ts.day for page in pages for p in page][::2] == [14, 13, 12, 11, 10]
+
+
+def test_loaded_days_are_yielded_before_the_whole_run_is_read(inner, store):
+    repo = SegmentCachedTickerPriceRepository(inner, store, now=lambda: NOW, load_page_size=2)
+    consumed = []
+    read_pages = inner.iter_pages
+
+    def counting(*args, **kwargs):
+        for page in read_pages(*args, **kwargs):
+            consumed.append(page)
+            yield page
+
+    inner.iter_pages = counting
+    start = datetime(2025, 1, 10, tzinfo=timezone.utc)
+    end = datetime(2025, 1, 19, 23, tzinfo=timezone.utc)
+    pages = repo.iter_pages("AAPL", start=start, end=end)
+
+    assert [p.ts.day for p in next(pages)] == [19, 19]
+    assert len(consumed) == 2
+    assert [p.ts.day for page in pages for p in page][::2] == list(range(18, 9, -1))
+
+
+def test_store_evicts_least_recently_used_segments():
+    one = Segment.encode("AAPL", [_price(10, 10, "1.0")])
+    store = SegmentStore(max_bytes=one.nbytes * 2)
+    for day in (10, 11, 12):
+        store.put(("AAPL", datetime(2025, 1, day).date()), one, version=0)
+
+    assert len(store) == 2
+    assert store.get(("AAPL", datetime(2025, 1, 10).date())) is None
+    assert store.bytes <= store.max_bytes
+
+
+def test_load_racing_with_a_write_is_not_cached():
+    store = SegmentStore(max_bytes=1024 * 1024)
+    key = ("AAPL", datetime(2025, 1, 10).date())
+    version = store.version(key)
+
+    store.discard(key)
+    store.put(key, Segment.encode("AAPL", [_price(10, 10, "1.0")]), version)
+
+    assert store.get(key) is None
+
+
+def test_prices_that_do_not_pack_are_served_uncached(inner, store):
+    inner.insert(_price(16, 12, "1" * 25 + ".5"))
+    repo = SegmentCachedTickerPriceRepository(inner, store, now=lambda: NOW)
+    start = datetime(2025, 1, 16, tzinfo=timezone.utc)
+    end = datetime(2025, 1, 16, 23, tzinfo=timezone.utc)
+
+    prices = repo.get_by_ticker("AAPL", start=start, end=end)
+
+    assert prices[0].price == Decimal("1" * 25 + ".5")
+    assert len(store) == 0
@@ -0,0 +1,122 @@
+"""Unit tests for request coalescing of identical concurrent reads."""
+
+import threading
+import time
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.domain.entities.ticker_price import TickerPrice
+from src.infrastructure.decorators.single_flight import (
+    SingleFlight,
+    SingleFlightTickerPriceRepository,
+)
+from src.infrastructure.metrics import MetricsRegistry
+
+PRICE = TickerPrice(
+    ticker="AAPL", ts=datetime(2025, 1, 15, 14, 30, tzinfo=timezone.utc), price=Decimal("182.52")
+)
+
+
+def _run_concurrently(fn, count: int) -> list:
+    results: list = [None] * count
+
+    def run(i: int) -> None:
+        results[i] = fn()
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for t in threads:
+        t.start()
+    return results, threads
+
+
+def _wait_for(predicate) -> None:
+    deadline = time.monotonic() + 2
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+@pytest.fixture
+def gate():
+    return threading.Event()
+
+
+@pytest.fixture
+def inner(gate):
+    mock = MagicMock()
+
+    def slow_read(ticker, start=None, end=None):
+        gate.wait(2)
+        return [PRICE]
+
+    mock.get_by_ticker.side_effect = slow_read
+    return mock
+
+
+def test_concurrent_identical_reads_share_one_query(inner, gate):
+    metrics = MetricsRegistry()
+    repo = SingleFlightTickerPriceRepository(inner, metrics)
+    results, threads = _run_concurrently(lambda: repo.get_by_ticker("AAPL"), 8)
+    _wait_for(lambda: repo._flights.waiting == 7)
+    gate.set()
+    for t in threads:
+        t.join()
+
+    assert inner.get_by_ticker.call_count == 1
+    assert all(r == [PRICE] for r in results)
+    assert len({id(r) for r in results}) == 8  # each caller owns its list
+    assert repo.coalescing_ratio() == pytest.approx(7 / 8)
+    assert "ticker_single_flight_coalescing_ratio 0.875" in metrics.render()
+
+
+def test_different_ranges_are_not_coalesced(inner, gate):
+    gate.set()
+    repo = SingleFlightTickerPriceRepository(inner, MetricsRegistry())
+    repo.get_by_ticker("AAPL")
+    repo.get_by_ticker("AAPL", start=PRICE.ts)
+    assert inner.get_by_ticker.call_count == 2
+
+
+def test_insert_stops_new_readers_joining_an_older_query(inner, gate):
+    repo = SingleFlightTickerPriceRepository(inner, MetricsRegistry())
+    _, threads = _run_concurrently(lambda: repo.get_by_ticker("AAPL"), 1)
+    _wait_for(lambda: repo._flights.in_flight == 1)
+
+    repo.insert(PRICE)
+    _, more = _run_concurrently(lambda: repo.get_by_ticker("AAPL"), 1)
+    gate.set()
+    for t in threads + more:
+        t.join()
+
+    assert inner.get_by_ticker.call_count == 2
+    inner.insert.assert_called_once_with(PRICE)
+
+
+def test_errors_reach_every_waiting_caller():
+    flight = SingleFlight()
+    gate = threading.Event()
+    errors: list[Exception] = []
+
+    def failing() -> int:
+        gate.wait(2)
+        raise RuntimeError("cassandra down")
+
+    def call() -> None:
+        try:
+            flight.do("k", failing)
+        except RuntimeError as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    for t in threads:
+        t.start()
+    time.sleep(0.05)
+    gate.set()
+    for t in threads:
+        t.join()
+
+    assert len(errors) == 3
+    assert flight.in_flight == 0
@@ -0,0 +1,130 @@
+"""Unit tests for the on-disk spool and its draining repository."""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.domain.entities.ticker_price import TickerPrice
+from src.infrastructure.metrics import MetricsRegistry
+from src.infrastructure.spool.log import SpoolLog
+from src.infrastructure.spool.spooled_repository import (
+    RateLimiter,
+    SpooledTickerPriceRepository,
+    decode,
+    encode,
+)
+
+
+def _price(minute: int, price: str = "182.520") -> TickerPrice:
+    return TickerPrice(
+        ticker="AAPL",
+        ts=datetime(2025, 1, 15, 14, minute, tzinfo=timezone.utc),
+        price=Decimal(price),
+        source="feed",
+    )
+
+
+@pytest.fixture
+def log(tmp_path):
+    return SpoolLog(tmp_path / "spool", segment_bytes=256, group_commit_delay=0)
+
+
+@pytest.fixture
+def inner():
+    mock = MagicMock()
+    mock.exists.return_value = False
+    return mock
+
+
+def _spooled(inner, log, **kwargs) -> SpooledTickerPriceRepository:
+    return SpooledTickerPriceRepository(
+        inner, log, MetricsRegistry(), rows_per_second=1e9, batch_rows=2, **kwargs
+    )
+
+
+def test_codec_round_trips_a_price():
+    assert decode(encode(_price(0))) == _price(0)
+    assert str(decode(encode(_price(0))).price) == "182.520"
+
+
+def test_log_rolls_segments_and_reads_back_in_order(log):
+    payloads = [f"record-{i:03d}".encode() * 4 for i in range(20)]
+    for payload in payloads:
+        log.append(payload)
+    log.seal()
+
+    segments = log.sealed_segments()
+    assert len(segments) > 1
+    assert [p for s in segments for p in SpoolLog.read(s)] == payloads
+
+
+def test_torn_tail_is_ignored(log):
+    log.append(b"first")
+    log.append(b"second")
+    log.seal()
+    segment = log.sealed_segments()[0]
+    segment.write_bytes(segment.read_bytes()[:-3])
+
+    assert list(SpoolLog.read(segment)) == [b"first"]
+
+
+def test_drain_replays_rows_and_removes_segments(inner, log):
+    repo = _spooled(inner, log)
+    for minute in range(3):
+        repo.insert(_price(minute))
+    inner.insert_batch.assert_not_called()
+
+    assert repo.drain_once() == 3
+
+    written = [row for c in inner.insert_batch.call_args_list for row in c.args[0]]
+    assert written == [_price(minute) for minute in range(3)]
+    assert log.sealed_segments() == []
+
+
+def test_spooled_rows_count_as_existing_until_drained(inner, log):
+    repo = _spooled(inner, log)
+    repo.insert(_price(0))
+
+    assert repo.exists("AAPL", _price(0).ts)
+    repo.drain_once()
+    assert not repo.exists("AAPL", _price(0).ts)
+
+
+def test_failed_drain_keeps_the_segment_for_retry(inner, log):
+    repo = _spooled(inner, log)
+    repo.insert(_price(0))
+    inner.insert_batch.side_effect = RuntimeError("overloaded")
+
+    with pytest.raises(RuntimeError):
+        repo.drain_once()
+
+    assert len(log.sealed_segments()) == 1
+    assert repo.exists("AAPL", _price(0).ts)
+
+
+def test_restart_recovers_undrained_rows(inner, tmp_path):
+    first = SpoolLog(tmp_path / "spool", group_commit_delay=0)
+    _spooled(inner, first).insert(_price(0))
+    first.close()
+
+    repo = _spooled(inner, SpoolLog(tmp_path / "spool", group_commit_delay=0))
+
+    assert repo.exists("AAPL", _price(0).ts)
+    assert repo.drain_once() == 1
+
+
+def test_rate_limiter_paces_grants():
+    now = [0.0]
+    slept: list[float] = []
+
+    def sleep(seconds: float) -> None:
+        slept.append(seconds)
+        now[0] += seconds
+
+    limiter = RateLimiter(100.0, clock=lambda: now[0], sleep=sleep)
+    for _ in range(3):
+        limiter.acquire(50)
+
+    assert slept == [0.5, 0.5]
@@ -0,0 +1,105 @@
+"""Unit tests for the write-behind insert buffer."""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.domain.entities.ticker_price import TickerPrice
+from src.domain.repositories.ticker_price_repository import RepositoryBusyError
+from src.infrastructure.decorators.write_behind import WriteBehindTickerPriceRepository
+from src.infrastructure.metrics import MetricsRegistry
+
+
+def _price(minute: int, ticker: str = "AAPL") -> TickerPrice:
+    return TickerPrice(
+        ticker=ticker,
+        ts=datetime(2025, 1, 15, 14, minute, tzinfo=timezone.utc),
+        price=Decimal("182.52"),
+    )
+
+
+@pytest.fixture
+def inner():
+    mock = MagicMock()
+    mock.exists.return_value = False
+    return mock
+
+
+@pytest.fixture
+def metrics():
+    return MetricsRegistry()
+
+
+@pytest.fixture
+def repo(inner, metrics):
+    return WriteBehindTickerPriceRepository(
+        inner, metrics, max_queue=3, flush_rows=2, put_timeout=0.01, max_retries=1
+    )
+
+
+def test_insert_is_buffered_until_flush(repo, inner, metrics):
+    repo.insert(_price(0))
+    repo.insert(_price(1, "MSFT"))
+
+    inner.insert_batch.assert_not_called()
+    assert metrics.value("ticker_write_behind_queue_depth") == 2
+
+    assert repo.flush() == 2
+    inner.insert_batch.assert_called_once_with([_price(0), _price(1, "MSFT")], concurrency=16)
+    assert metrics.value("ticker_write_behind_queue_depth") == 0
+
+
+def test_flush_splits_into_groups_of_flush_rows(repo, inner):
+    for minute in range(3):
+        repo.insert(_price(minute))
+
+    repo.flush()
+
+    assert [len(c.args[0]) for c in inner.insert_batch.call_args_list] == [2, 1]
+
+
+def test_buffered_rows_count_as_existing(repo, inner):
+    repo.insert(_price(0))
+
+    assert repo.exists("AAPL", _price(0).ts)
+    inner.exists.assert_not_called()
+
+    repo.flush()
+    assert not repo.exists("AAPL", _price(0).ts)
+
+
+def test_full_buffer_pushes_back(repo, metrics):
+    for minute in range(3):
+        repo.insert(_price(minute))
+
+    with pytest.raises(RepositoryBusyError):
+        repo.insert(_price(3))
+    assert metrics.value("ticker_write_behind_rejected_total") == 1
+    assert not repo.exists("AAPL", _price(3).ts)
+
+
+def test_failed_flush_is_retried_then_dropped(repo, inner, metrics):
+    inner.insert_batch.side_effect = [RuntimeError("timeout"), None]
+    repo.insert(_price(0))
+    repo.flush()
+    assert inner.insert_batch.call_count == 2
+    assert metrics.value("ticker_write_behind_dropped_rows_total") == 0
+
+    inner.insert_batch.side_effect = RuntimeError("down")
+    repo.insert(_price(1))
+    repo.flush()
+    assert metrics.value("ticker_write_behind_dropped_rows_total") == 1
+
+
+def test_stop_drains_the_background_flusher(inner, metrics):
+    repo = WriteBehindTickerPriceRepository(inner, metrics, flush_rows=100, flush_interval=0.05)
+    repo.start()
+    for minute in range(5):
+        repo.insert(_price(minute))
+
+    repo.stop()
+
+    written = [row for c in inner.insert_batch.call_args_list for row in c.args[0]]
+    assert written == [_price(minute) for minute in range(5)]
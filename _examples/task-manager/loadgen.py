@@ -0,0 +1,427 @@
+"""
+Task Manager load generator
+===========================
+
+Drives a weighted mix of create/get/list/update/delete requests against a
+running Task Manager API and shows live latency percentiles, throughput and
+error rates. Started from the TUI:
+
+    uv run python tui.py --load --workers 32 --rps 200 --duration 60
+    uv run python tui.py --load --model open --rps 500 --mix get=70,list=10,create=20
+
+Workload models:
+    closed  Each of --workers loops request → response → next request, so
+            throughput falls as latency rises. --rps (optional) caps the
+            combined rate.
+    open    Requests arrive at --rps as a Poisson process, whatever the
+            latency; --workers only bounds how many are in flight. Latency
+            is measured from the scheduled arrival, so queueing delay on an
+            overloaded server is counted instead of hidden. Arrivals that
+            find the backlog full are counted as dropped.
+
+A JSON summary is written to --summary when the run ends (or on Ctrl+C).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import math
+import random
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import httpx
+from rich.console import Console, Group
+from rich.live import Live
+from rich.panel import Panel
+from rich.table import Table
+
+OPERATIONS = ("create", "get", "list", "update", "delete")
+DEFAULT_MIX = "create=20,get=40,list=20,update=15,delete=5"
+STATUSES = ("todo", "in_progress", "done")
+# Tasks remembered for get/update/delete; oldest are forgotten first.
+MAX_KNOWN_IDS = 10_000
+# Rates on the dashboard cover this many trailing seconds.
+RATE_WINDOW_SECONDS = 5
+
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class LoadConfig:
+    base_url: str
+    workers: int = 16
+    model: str = "closed"
+    rps: float = 0.0
+    duration: float = 30.0
+    mix: dict[str, float] = field(default_factory=lambda: parse_mix(DEFAULT_MIX))
+    list_limit: int = 50
+    summary: Path = Path("load-summary.json")
+    timeout: float = 10.0
+
+
+def parse_mix(spec: str) -> dict[str, float]:
+    """``"get=70,create=30"`` → normalised weights; unknown operations are rejected."""
+    weights: dict[str, float] = {}
+    for part in spec.split(","):
+        name, _, weight = part.strip().partition("=")
+        if name not in OPERATIONS:
+            raise argparse.ArgumentTypeError(f"unknown operation {name!r} in mix")
+        try:
+            weights[name] = float(weight)
+        except ValueError as exc:
+            raise argparse.ArgumentTypeError(f"bad weight for {name!r}: {weight!r}") from exc
+    total = sum(weights.values())
+    if total <= 0 or any(w < 0 for w in weights.values()):
+        raise argparse.ArgumentTypeError("mix weights must be non-negative and not all zero")
+    return {name: w / total for name, w in weights.items()}
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    group = parser.add_argument_group("load mode (--load)")
+    group.add_argument("--workers", type=int, default=16, help="concurrent workers")
+    group.add_argument("--model", choices=("closed", "open"), default="closed")
+    group.add_argument(
+        "--rps", type=float, default=0.0, help="target requests/s (required for --model open)"
+    )
+    group.add_argument("--duration", type=float, default=30.0, help="seconds to run")
+    group.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX, help=DEFAULT_MIX)
+    group.add_argument("--list-limit", type=int, default=50, help="page size of list requests")
+    group.add_argument("--summary", type=Path, default=Path("load-summary.json"))
+
+
+def config_from_args(args: argparse.Namespace, base_url: str) -> LoadConfig:
+    if args.model == "open" and args.rps <= 0:
+        raise SystemExit("--model open needs a positive --rps")
+    if args.workers < 1:
+        raise SystemExit("--workers must be at least 1")
+    mix = args.mix if isinstance(args.mix, dict) else parse_mix(args.mix)
+    return LoadConfig(
+        base_url=base_url,
+        workers=args.workers,
+        model=args.model,
+        rps=args.rps,
+        duration=args.duration,
+        mix=mix,
+        list_limit=args.list_limit,
+        summary=args.summary,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Statistics
+# ---------------------------------------------------------------------------
+
+
+class LatencyHistogram:
+    """Log-bucketed latencies: ~1% relative precision in constant memory."""
+
+    _GROWTH = math.log(1.01)
+
+    def __init__(self) -> None:
+        self._buckets: Counter[int] = Counter()
+        self.count = 0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        micros = max(seconds * 1e6, 1.0)
+        self._buckets[int(math.log(micros) / self._GROWTH)] += 1
+        self.count += 1
+        self.max = max(self.max, seconds)
+
+    def percentile(self, p: float) -> float:
+        """Latency in seconds below which ``p`` percent of samples fall (0 if empty)."""
+        if not self.count:
+            return 0.0
+        rank = math.ceil(self.count * p / 100)
+        seen = 0
+        for bucket in sorted(self._buckets):
+            seen += self._buckets[bucket]
+            if seen >= rank:
+                return min(math.exp((bucket + 1) * self._GROWTH) / 1e6, self.max)
+        return self.max
+
+
+class OperationStats:
+    def __init__(self) -> None:
+        self.latency = LatencyHistogram()
+        self.errors: Counter[str] = Counter()
+        self._recent: deque[float] = deque()
+
+    @property
+    def requests(self) -> int:
+        return self.latency.count
+
+    def record(self, seconds: float, now: float, error: str | None = None) -> None:
+        self.latency.record(seconds)
+        if error is not None:
+            self.errors[error] += 1
+        self._recent.append(now)
+
+    def rate(self, now: float, elapsed: float) -> float:
+        while self._recent and self._recent[0] < now - RATE_WINDOW_SECONDS:
+            self._recent.popleft()
+        return len(self._recent) / max(min(elapsed, RATE_WINDOW_SECONDS), 1e-3)
+
+    def summary(self, elapsed: float) -> dict:
+        errors = sum(self.errors.values())
+        return {
+            "requests": self.requests,
+            "errors": errors,
+            "error_rate": errors / self.requests if self.requests else 0.0,
+            "error_kinds": dict(self.errors),
+            "throughput_rps": self.requests / elapsed if elapsed else 0.0,
+            "latency_ms": {
+                name: self.latency.percentile(p) * 1000
+                for name, p in (("p50", 50), ("p90", 90), ("p99", 99), ("p999", 99.9))
+            }
+            | {"max": self.latency.max * 1000},
+        }
+
+
+class RunStats:
+    def __init__(self) -> None:
+        self.started = time.monotonic()
+        self.by_op = {op: OperationStats() for op in OPERATIONS}
+        self.total = OperationStats()
+        self.dropped = 0
+        self.in_flight = 0
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    def record(self, op: str, seconds: float, error: str | None = None) -> None:
+        now = time.monotonic()
+        self.by_op[op].record(seconds, now, error)
+        self.total.record(seconds, now, error)
+
+
+# ---------------------------------------------------------------------------
+# Workload
+# ---------------------------------------------------------------------------
+
+
+class RateLimiter:
+    """Spaces out permits evenly at ``rate`` per second across all callers."""
+
+    def __init__(self, rate: float) -> None:
+        self._interval = 1.0 / rate
+        self._next = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            self._next = max(self._next, now)
+            delay = self._next - now
+            self._next += self._interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class LoadRunner:
+    def __init__(self, config: LoadConfig) -> None:
+        self.config = config
+        self.stats = RunStats()
+        self._ids: deque[str] = deque(maxlen=MAX_KNOWN_IDS)
+        self._ops = list(config.mix)
+        self._weights = [config.mix[op] for op in self._ops]
+        self._client: httpx.AsyncClient | None = None
+
+    async def run(self, on_tick=None) -> None:
+        limits = httpx.Limits(
+            max_connections=self.config.workers, max_keepalive_connections=self.config.workers
+        )
+        async with httpx.AsyncClient(
+            base_url=self.config.base_url, timeout=self.config.timeout, limits=limits
+        ) as client:
+            self._client = client
+            await self._seed_ids()
+            self.stats = RunStats()
+            deadline = self.stats.started + self.config.duration
+            if self.config.model == "open":
+                work = self._run_open(deadline)
+            else:
+                work = self._run_closed(deadline)
+            task = asyncio.create_task(work)
+            try:
+                while not task.done():
+                    if on_tick is not None:
+                        on_tick()
+                    await asyncio.wait({task}, timeout=0.25)
+            finally:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+
+    async def _seed_ids(self) -> None:
+        try:
+            resp = await self._client.get("/api/v1/tasks", params={"limit": 500})
+            if resp.status_code == 200:
+                self._ids.extend(t["id"] for t in resp.json().get("tasks", []))
+        except httpx.HTTPError:
+            pass  # Reported through the first real requests instead.
+
+    async def _run_closed(self, deadline: float) -> None:
+        limiter = RateLimiter(self.config.rps) if self.config.rps > 0 else None
+
+        async def worker() -> None:
+            while time.monotonic() < deadline:
+                if limiter is not None:
+                    await limiter.wait()
+                await self._one(time.monotonic())
+
+        await asyncio.gather(*(worker() for _ in range(self.config.workers)))
+
+    async def _run_open(self, deadline: float) -> None:
+        # Bounded backlog: beyond it the server is hopelessly behind and
+        # arrivals are counted as dropped instead of queueing forever.
+        backlog: asyncio.Queue[float] = asyncio.Queue(self.config.workers * 4)
+
+        async def worker() -> None:
+            while True:
+                scheduled = await backlog.get()
+                await self._one(scheduled)
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.config.workers)]
+        try:
+            arrival = time.monotonic()
+            while arrival < deadline:
+                arrival += random.expovariate(self.config.rps)
+                delay = arrival - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                try:
+                    backlog.put_nowait(arrival)
+                except asyncio.QueueFull:
+                    self.stats.dropped += 1
+        finally:
+            for w in workers:
+                w.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _one(self, scheduled: float) -> None:
+        op = random.choices(self._ops, self._weights)[0]
+        if op in ("get", "update", "delete") and not self._ids:
+            op = "create"
+        self.stats.in_flight += 1
+        error = None
+        try:
+            resp = await self._request(op)
+            if resp.status_code >= 400:
+                error = f"http_{resp.status_code}"
+        except httpx.HTTPError as exc:
+            error = type(exc).__name__
+        finally:
+            self.stats.in_flight -= 1
+        self.stats.record(op, time.monotonic() - scheduled, error)
+
+    async def _request(self, op: str) -> httpx.Response:
+        c = self._client
+        if op == "create":
+            resp = await c.post(
+                "/api/v1/tasks",
+                json={"title": f"load-{random.getrandbits(32):08x}", "description": "loadgen"},
+            )
+            if resp.status_code == 201:
+                self._ids.append(resp.json()["id"])
+            return resp
+        if op == "list":
+            params = {"limit": self.config.list_limit}
+            if random.random() < 0.5:
+                params["status"] = random.choice(STATUSES)
+            return await c.get("/api/v1/tasks", params=params)
+        task_id = random.choice(self._ids)
+        if op == "get":
+            return await c.get(f"/api/v1/tasks/{task_id}")
+        if op == "update":
+            return await c.patch(
+                f"/api/v1/tasks/{task_id}", json={"status": random.choice(STATUSES)}
+            )
+        # Another worker may have picked the same task first.
+        with contextlib.suppress(ValueError):
+            self._ids.remove(task_id)
+        return await c.delete(f"/api/v1/tasks/{task_id}")
+
+
+# ---------------------------------------------------------------------------
+# Reporting
+# ---------------------------------------------------------------------------
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:,.1f}"
+
+
+def render(runner: LoadRunner) -> Group:
+    cfg, stats = runner.config, runner.stats
+    now = time.monotonic()
+    target = f"{cfg.rps:,.0f} rps" if cfg.rps > 0 else "unthrottled"
+    header = (
+        f"[bold]{cfg.base_url}[/bold]  model=[cyan]{cfg.model}[/cyan]  target={target}  "
+        f"workers={cfg.workers}  elapsed={stats.elapsed:,.0f}/{cfg.duration:,.0f}s  "
+        f"in-flight={stats.in_flight}  dropped={stats.dropped}"
+    )
+    table = Table(expand=True)
+    for column in ("Operation", "Requests", "Rate/s", "Errors", "p50 ms", "p90 ms", "p99 ms",
+                   "Max ms"):
+        table.add_column(column, justify="left" if column == "Operation" else "right")
+    rows = [(op, stats.by_op[op]) for op in OPERATIONS if op in cfg.mix]
+    rows.append(("[bold]total[/bold]", stats.total))
+    for name, op_stats in rows:
+        errors = sum(op_stats.errors.values())
+        error_rate = errors / op_stats.requests if op_stats.requests else 0.0
+        style = "red" if error_rate > 0.01 else "green"
+        hist = op_stats.latency
+        table.add_row(
+            name,
+            f"{op_stats.requests:,}",
+            f"{op_stats.rate(now, stats.elapsed):,.1f}",
+            f"[{style}]{errors:,} ({error_rate:.1%})[/{style}]",
+            _ms(hist.percentile(50)),
+            _ms(hist.percentile(90)),
+            _ms(hist.percentile(99)),
+            _ms(hist.max),
+        )
+    return Group(Panel(header, title="Load test", border_style="cyan"), table)
+
+
+def summary(runner: LoadRunner) -> dict:
+    cfg, stats = runner.config, runner.stats
+    elapsed = stats.elapsed
+    return {
+        "base_url": cfg.base_url,
+        "model": cfg.model,
+        "target_rps": cfg.rps or None,
+        "workers": cfg.workers,
+        "mix": cfg.mix,
+        "duration_s": elapsed,
+        "dropped": stats.dropped,
+        "total": stats.total.summary(elapsed),
+        "operations": {
+            op: stats.by_op[op].summary(elapsed) for op in OPERATIONS if op in cfg.mix
+        },
+    }
+
+
+def run_load(config: LoadConfig, console: Console) -> dict:
+    """Run the load test with a live dashboard; returns (and writes) the summary."""
+    runner = LoadRunner(config)
+    with Live(render(runner), console=console, refresh_per_second=4) as live:
+        try:
+            asyncio.run(runner.run(on_tick=lambda: live.update(render(runner))))
+        except KeyboardInterrupt:
+            console.print("[yellow]Interrupted — writing partial summary.[/yellow]")
+        live.update(render(runner))
+    result = summary(runner)
+    config.summary.write_text(json.dumps(result, indent=2))
+    console.print(f"Summary written to [bold]{config.summary}[/bold]")
+    return result
@@ -0,0 +1,42 @@
+"""Archive old done tasks.
+
+Moves done tasks created more than --older-than-days ago from the
+tasks_by_status "done" partition into the month-bucketed tasks_archive
+table, so that partition stays small. Schedule it daily; a run that is
+interrupted is simply repeated by the next one.
+"""
+
+import argparse
+import os
+import sys
+from datetime import timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.application.use_cases.archive_done_tasks import ArchiveDoneTasks
+from src.infrastructure.cassandra.repositories.cassandra_task_repository import (
+    CassandraTaskRepository,
+)
+from src.infrastructure.cassandra.session import create_session
+
+CONTACT_POINTS = os.getenv("CASSANDRA_CONTACT_POINTS", "127.0.0.1").split(",")
+KEYSPACE = os.getenv("CASSANDRA_KEYSPACE", "task_manager")
+
+
+def run_archive(args: argparse.Namespace) -> None:
+    session = create_session(CONTACT_POINTS, KEYSPACE)
+    use_case = ArchiveDoneTasks(CassandraTaskRepository(session))
+    archived = use_case.execute(timedelta(days=args.older_than_days))
+    session.cluster.shutdown()
+    print(f"Archived {archived} done task(s) older than {args.older_than_days} day(s)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--older-than-days", type=int, default=30, help="minimum task age")
+    try:
+        run_archive(parser.parse_args())
+    except Exception as exc:
+        print(f"Archive failed: {exc}", file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,47 @@
+import hashlib
+import json
+from collections.abc import Mapping
+from datetime import datetime, timedelta, timezone
+
+from src.domain.entities.task import Task
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def task_etag(task: Task) -> str:
+    """Strong validator for a single task, derived from its write timestamps."""
+    tag = f"{task.id.hex}-{_millis(task.updated_at)}"
+    if task.archived_at is not None:
+        tag += f"-a{_millis(task.archived_at)}"
+    return f'"{tag}"'
+
+
+def list_etag(version: int, query: Mapping[str, object]) -> str:
+    """Weak validator for one list view: the collection version plus the query shaping it.
+
+    ``query`` must already be normalised, so equivalent requests share a tag.
+    """
+    # Weak: the same version can serialise differently (e.g. sort ties).
+    digest = hashlib.blake2b(
+        json.dumps(query, sort_keys=True, default=str).encode(), digest_size=8
+    ).hexdigest()
+    return f'W/"tasks-{version}-{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison against an If-None-Match header, as RFC 9110 requires for GET."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    wanted = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == wanted for candidate in if_none_match.split(",")
+    )
+
+
+def _millis(ts: datetime) -> int:
+    # Cassandra stores milliseconds and returns naive UTC datetimes.
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return (ts - _EPOCH) // timedelta(milliseconds=1)
@@ -1,6 +1,6 @@
 from fastapi import FastAPI
 
-from src.api.routes import tasks
+from src.api.routes import metrics, tasks
 
 
 def create_app() -> FastAPI:
@@ -10,6 +10,7 @@ def create_app() -> FastAPI:
         version="0.1.0",
     )
     app.include_router(tasks.router)
+    app.include_router(metrics.router)
     return app
 
 
@@ -0,0 +1,12 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from src.api.dependencies import get_metrics_registry
+from src.infrastructure.metrics import MetricsRegistry
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def get_metrics(registry: MetricsRegistry = Depends(get_metrics_registry)) -> str:
+    return registry.render()
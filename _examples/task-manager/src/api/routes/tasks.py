@@ -1,24 +1,47 @@
+import base64
+import binascii
+from collections.abc import AsyncIterator
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 
 from src.api.dependencies import (
+    get_change_feed,
     get_create_use_case,
     get_delete_use_case,
     get_get_use_case,
     get_list_use_case,
+    get_many_use_case,
     get_update_use_case,
 )
-from src.api.schemas.task import TaskCreate, TaskListResponse, TaskResponse, TaskStatusUpdate
+from src.api.etag import etag_matches, list_etag, task_etag
+from src.api.schemas.task import (
+    TaskChangeResponse,
+    TaskCreate,
+    TaskIdsQuery,
+    TaskListResponse,
+    TaskResponse,
+    TaskStatusUpdate,
+)
+from src.application.services.change_feed import ChangeFeed, Subscription, TaskChange
 from src.application.use_cases.create_task import CreateTask
 from src.application.use_cases.delete_task import DeleteTask
 from src.application.use_cases.get_task import GetTask, TaskNotFoundError
-from src.application.use_cases.list_tasks import ListTasks
+from src.application.use_cases.get_tasks import GetTasks
+from src.application.use_cases.list_tasks import ListPosition, ListTasks
 from src.application.use_cases.update_task_status import UpdateTaskStatus
 from src.domain.entities.task import Task, TaskStatus
 
 router = APIRouter(prefix="/api/v1/tasks", tags=["tasks"])
 
+MAX_IDS = 500
+MAX_PAGE_SIZE = 500
+# Clients may reuse a cached body, but only after revalidating it with If-None-Match.
+_REVALIDATE = {"Cache-Control": "no-cache"}
+# Comment line sent on idle change feeds so proxies keep the connection open.
+HEARTBEAT_SECONDS = 15.0
+
 
 def _to_response(task: Task) -> TaskResponse:
     return TaskResponse(
@@ -28,6 +51,86 @@ def _to_response(task: Task) -> TaskResponse:
         status=task.status.value,
         created_at=task.created_at,
         updated_at=task.updated_at,
+        archived_at=task.archived_at,
+    )
+
+
+def _parse_ids(ids: str) -> list[UUID]:
+    try:
+        parsed = [UUID(part.strip()) for part in ids.split(",") if part.strip()]
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="ids must be comma-separated UUIDs"
+        ) from exc
+    if len(parsed) > MAX_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=f"At most {MAX_IDS} ids per request"
+        )
+    return parsed
+
+
+def _encode_cursor(position: ListPosition | None) -> str | None:
+    if position is None:
+        return None
+    prefix = position.status.value
+    if position.bucket is not None:
+        prefix += f"@{position.bucket}"
+    raw = prefix.encode() + b":" + (position.paging_state or b"")
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: str) -> ListPosition:
+    try:
+        raw = base64.b64decode(cursor.encode(), altchars=b"-_", validate=True)
+        prefix, _, paging_state = raw.partition(b":")
+        status_value, _, bucket = prefix.decode().partition("@")
+        return ListPosition(TaskStatus(status_value), paging_state or None, bucket or None)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Malformed cursor"
+        ) from exc
+
+
+def _not_modified(etag: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag, **_REVALIDATE}
+    )
+
+
+def _sse_event(feed: ChangeFeed, change: TaskChange) -> str:
+    body = TaskChangeResponse(
+        kind=change.kind.value, task_id=change.task_id, at=change.at, task=_to_response(change.task)
+    )
+    return (
+        f"id: {feed.event_id(change)}\nevent: {change.kind.value}\n"
+        f"data: {body.model_dump_json()}\n\n"
+    )
+
+
+async def _changes(feed: ChangeFeed, subscription: Subscription) -> AsyncIterator[str]:
+    try:
+        if subscription.gap:
+            yield "event: reset\ndata: resume point lost, re-read /api/v1/tasks\n\n"
+        for change in subscription.backlog:
+            yield _sse_event(feed, change)
+        while True:
+            try:
+                change = await subscription.next(timeout=HEARTBEAT_SECONDS)
+            except TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            if change is None:
+                yield "event: dropped\ndata: subscriber too slow, reconnect\n\n"
+                return
+            yield _sse_event(feed, change)
+    finally:
+        subscription.close()
+
+
+def _to_many_response(use_case: GetTasks, ids: list[UUID]) -> TaskListResponse:
+    tasks, missing = use_case.execute(ids)
+    return TaskListResponse(
+        count=len(tasks), tasks=[_to_response(t) for t in tasks], missing=missing
     )
 
 
@@ -41,26 +144,96 @@ def create_task(
     return _to_response(created)
 
 
+# Registered before /{task_id} so "changes" is not parsed as a task id.
+@router.get("/changes")
+async def stream_changes(
+    last_event_id: str | None = Header(default=None),
+    after: str | None = Query(default=None, description="Resume after this event id"),
+    feed: ChangeFeed = Depends(get_change_feed),
+) -> StreamingResponse:
+    subscription = feed.subscribe(last_event_id or after)
+    return StreamingResponse(
+        _changes(feed, subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/{task_id}", response_model=TaskResponse)
 def get_task(
     task_id: UUID,
+    response: Response,
+    if_none_match: str | None = Header(default=None),
     use_case: GetTask = Depends(get_get_use_case),
-) -> TaskResponse:
+) -> TaskResponse | Response:
     try:
         task = use_case.execute(task_id)
     except TaskNotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    etag = task_etag(task)
+    if etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+    response.headers.update({"ETag": etag, **_REVALIDATE})
     return _to_response(task)
 
 
+@router.post(":get", response_model=TaskListResponse)
+def get_many_tasks(
+    body: TaskIdsQuery,
+    use_case: GetTasks = Depends(get_many_use_case),
+) -> TaskListResponse:
+    return _to_many_response(use_case, body.ids)
+
+
 @router.get("", response_model=TaskListResponse)
 def list_tasks(
+    response: Response,
     task_status: str | None = Query(default=None, alias="status"),
+    ids: str | None = Query(default=None, examples=["<uuid>,<uuid>"]),
+    include_archived: bool = Query(default=False),
+    limit: int | None = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(default=None),
+    if_none_match: str | None = Header(default=None),
     use_case: ListTasks = Depends(get_list_use_case),
-) -> TaskListResponse:
+    many_use_case: GetTasks = Depends(get_many_use_case),
+) -> TaskListResponse | Response:
+    task_ids = list(dict.fromkeys(_parse_ids(ids))) if ids is not None else None
     status_filter = TaskStatus(task_status) if task_status else None
-    tasks = use_case.execute(status_filter)
-    return TaskListResponse(count=len(tasks), tasks=[_to_response(t) for t in tasks])
+    position = _decode_cursor(cursor) if cursor else None
+    paged = limit is not None or position is not None
+    query = {
+        "ids": task_ids,
+        "status": status_filter,
+        "include_archived": include_archived,
+        "limit": (limit or MAX_PAGE_SIZE) if paged else None,
+        "cursor": None if position is None else _encode_cursor(position),
+    }
+    # Read the stamp before the data: a write racing the read then only
+    # costs the client one extra full response, never a stale 304.
+    etag = list_etag(use_case.version(), query)
+    if etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+    response.headers.update({"ETag": etag, **_REVALIDATE})
+    if task_ids is not None:
+        return _to_many_response(many_use_case, task_ids)
+    if not paged:
+        tasks = use_case.execute(status_filter, include_archived=include_archived)
+        return TaskListResponse(count=len(tasks), tasks=[_to_response(t) for t in tasks])
+
+    try:
+        tasks, position = use_case.page(
+            limit or MAX_PAGE_SIZE,
+            status_filter,
+            position,
+            include_archived=include_archived,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return TaskListResponse(
+        count=len(tasks),
+        tasks=[_to_response(t) for t in tasks],
+        next_cursor=_encode_cursor(position),
+    )
 
 
 @router.patch("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -13,6 +13,10 @@ class TaskStatusUpdate(BaseModel):
     status: str = Field(..., pattern="^(todo|in_progress|done)$", examples=["in_progress"])
 
 
+class TaskIdsQuery(BaseModel):
+    ids: list[UUID] = Field(..., min_length=1, max_length=500)
+
+
 class TaskResponse(BaseModel):
     id: UUID
     title: str
@@ -20,8 +24,21 @@ class TaskResponse(BaseModel):
     status: str
     created_at: datetime
     updated_at: datetime
+    archived_at: datetime | None = None
+
+
+class TaskChangeResponse(BaseModel):
+    kind: str
+    task_id: UUID
+    at: datetime
+    # The task as written; for deletes, as it was just before.
+    task: TaskResponse
 
 
 class TaskListResponse(BaseModel):
     count: int
     tasks: list[TaskResponse]
+    # Requested ids that do not exist; only filled for multi-get requests.
+    missing: list[UUID] = Field(default_factory=list)
+    # Pass back as ``cursor`` for the next page; only set for paged requests.
+    next_cursor: str | None = None
@@ -0,0 +1,151 @@
+import asyncio
+import secrets
+import threading
+from collections import defaultdict, deque
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import StrEnum
+from uuid import UUID
+
+from src.domain.entities.task import Task
+
+
+class ChangeKind(StrEnum):
+    CREATED = "created"
+    STATUS_CHANGED = "status_changed"
+    DELETED = "deleted"
+
+
+@dataclass(frozen=True)
+class TaskChange:
+    seq: int
+    kind: ChangeKind
+    task_id: UUID
+    # The task as written; for deletes, as it was just before.
+    task: Task
+    at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class Subscription:
+    """One live consumer of the feed, bound to the event loop it was created on.
+
+    ``backlog`` holds the retained changes after the requested resume point
+    and must be sent before anything from :meth:`next`. ``gap`` is True (and
+    the backlog empty) when that resume point is no longer retained or came
+    from another process; the client then has to re-read the task list.
+
+    A consumer that lets its bounded queue fill up is dropped; it then
+    receives ``None`` and should reconnect with its last event id.
+    """
+
+    def __init__(
+        self, feed: "ChangeFeed", maxsize: int, backlog: list[TaskChange], gap: bool
+    ) -> None:
+        self.loop = asyncio.get_running_loop()
+        self.backlog = backlog
+        self.gap = gap
+        self.dropped = False
+        self._feed = feed
+        self._queue: asyncio.Queue[TaskChange | None] = asyncio.Queue(maxsize)
+
+    async def next(self, timeout: float | None = None) -> TaskChange | None:
+        """Next change, or None once dropped. Raises ``TimeoutError`` if none arrives in time."""
+        return await asyncio.wait_for(self._queue.get(), timeout)
+
+    def close(self) -> None:
+        self._feed.unsubscribe(self)
+
+    def offer(self, change: TaskChange) -> None:
+        # Runs on ``self.loop``, scheduled by the feed.
+        if self.dropped:
+            return
+        try:
+            self._queue.put_nowait(change)
+        except asyncio.QueueFull:
+            self.dropped = True
+            self.close()
+            self._feed.dropped += 1
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait(None)
+
+
+class ChangeFeed:
+    """In-process broadcaster of task writes, with a ring buffer for resuming.
+
+    Every change gets an event id ``<epoch>-<seq>``. The epoch is random per
+    process, so an id from before a restart (or from another replica) is
+    recognised as a gap instead of silently skipping changes. Only writes
+    handled by this process are seen.
+    """
+
+    def __init__(self, history: int = 1024, queue_size: int = 256) -> None:
+        self.epoch = secrets.token_hex(4)
+        self._queue_size = queue_size
+        self._history: deque[TaskChange] = deque(maxlen=history)
+        self._subscribers: set[Subscription] = set()
+        self._lock = threading.Lock()
+        self._seq = 0
+        self.dropped = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    def event_id(self, change: TaskChange) -> str:
+        return f"{self.epoch}-{change.seq}"
+
+    def publish(self, kind: ChangeKind, task: Task) -> TaskChange:
+        """Record a change and hand it to every subscriber; safe from any thread."""
+        with self._lock:
+            self._seq += 1
+            change = TaskChange(seq=self._seq, kind=kind, task_id=task.id, task=task)
+            self._history.append(change)
+            subs = list(self._subscribers)
+        by_loop: dict[asyncio.AbstractEventLoop, list[Subscription]] = defaultdict(list)
+        for subscription in subs:
+            by_loop[subscription.loop].append(subscription)
+        for loop, group in by_loop.items():
+            try:
+                loop.call_soon_threadsafe(_deliver, group, change)
+            except RuntimeError:
+                # Loop already closed (shutdown); its subscribers are gone with it.
+                for subscription in group:
+                    self.unsubscribe(subscription)
+        return change
+
+    def subscribe(self, last_event_id: str | None = None) -> Subscription:
+        """Must be called from the event loop that will consume the subscription.
+
+        With ``last_event_id`` the retained changes after it are replayed; the
+        backlog and the live queue are split under the publish lock, so no
+        change is missed or sent twice.
+        """
+        with self._lock:
+            backlog, gap = self._since(last_event_id)
+            subscription = Subscription(self, self._queue_size, backlog, gap)
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def _since(self, last_event_id: str | None) -> tuple[list[TaskChange], bool]:
+        if last_event_id is None:
+            return [], False
+        epoch, _, seq = last_event_id.partition("-")
+        if epoch != self.epoch or not seq.isdigit() or int(seq) > self._seq:
+            return [], True
+        after = int(seq)
+        oldest = self._history[0].seq if self._history else self._seq + 1
+        if after + 1 < oldest:
+            return [], True
+        return [c for c in self._history if c.seq > after], False
+
+
+def _deliver(subscriptions: Iterable[Subscription], change: TaskChange) -> None:
+    for subscription in subscriptions:
+        subscription.offer(change)
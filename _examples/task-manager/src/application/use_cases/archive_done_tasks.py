@@ -0,0 +1,15 @@
+from datetime import datetime, timedelta, timezone
+
+from src.domain.repositories.task_repository import TaskRepository
+
+
+class ArchiveDoneTasks:
+    def __init__(self, repo: TaskRepository) -> None:
+        self._repo = repo
+
+    def execute(self, older_than: timedelta, now: datetime | None = None) -> int:
+        """Archive done tasks created more than ``older_than`` ago; returns how many moved."""
+        if older_than <= timedelta(0):
+            raise ValueError("older_than must be positive")
+        now = now or datetime.now(timezone.utc)
+        return self._repo.archive_done(now - older_than)
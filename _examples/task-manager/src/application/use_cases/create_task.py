@@ -1,11 +1,15 @@
+from src.application.services.change_feed import ChangeFeed, ChangeKind
 from src.domain.entities.task import Task
 from src.domain.repositories.task_repository import TaskRepository
 
 
 class CreateTask:
-    def __init__(self, repo: TaskRepository) -> None:
+    def __init__(self, repo: TaskRepository, feed: ChangeFeed | None = None) -> None:
         self._repo = repo
+        self._feed = feed
 
     def execute(self, task: Task) -> Task:
         self._repo.insert(task)
+        if self._feed is not None:
+            self._feed.publish(ChangeKind.CREATED, task)
         return task
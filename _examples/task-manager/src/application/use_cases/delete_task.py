@@ -1,15 +1,19 @@
 from uuid import UUID
 
-from src.domain.repositories.task_repository import TaskRepository
+from src.application.services.change_feed import ChangeFeed, ChangeKind
 from src.application.use_cases.get_task import TaskNotFoundError
+from src.domain.repositories.task_repository import TaskRepository
 
 
 class DeleteTask:
-    def __init__(self, repo: TaskRepository) -> None:
+    def __init__(self, repo: TaskRepository, feed: ChangeFeed | None = None) -> None:
         self._repo = repo
+        self._feed = feed
 
     def execute(self, task_id: UUID) -> None:
         task = self._repo.get_by_id(task_id)
         if task is None:
             raise TaskNotFoundError(task_id)
         self._repo.delete(task_id)
+        if self._feed is not None:
+            self._feed.publish(ChangeKind.DELETED, task)
@@ -0,0 +1,18 @@
+from collections.abc import Sequence
+from uuid import UUID
+
+from src.domain.entities.task import Task
+from src.domain.repositories.task_repository import TaskRepository
+
+
+class GetTasks:
+    def __init__(self, repo: TaskRepository) -> None:
+        self._repo = repo
+
+    def execute(self, task_ids: Sequence[UUID]) -> tuple[list[Task], list[UUID]]:
+        """Return (found tasks, missing ids), both in request order without duplicates."""
+        unique = list(dict.fromkeys(task_ids))
+        found = self._repo.get_many(unique) if unique else {}
+        tasks = [found[task_id] for task_id in unique if task_id in found]
+        missing = [task_id for task_id in unique if task_id not in found]
+        return tasks, missing
@@ -1,17 +1,103 @@
+from dataclasses import dataclass
+
 from src.domain.entities.task import Task, TaskStatus
 from src.domain.repositories.task_repository import TaskRepository
 
 
+@dataclass(frozen=True)
+class ListPosition:
+    """Where a paged listing resumes: statuses are walked one after another.
+
+    ``bucket`` is set once the listing has moved on to the archive, which is
+    walked month by month after the live statuses.
+    """
+
+    status: TaskStatus
+    paging_state: bytes | None = None
+    bucket: str | None = None
+
+
 class ListTasks:
     def __init__(self, repo: TaskRepository) -> None:
         self._repo = repo
 
-    def execute(self, status: TaskStatus | None = None) -> list[Task]:
-        if status is not None:
-            return self._repo.list_by_status(status)
-        # Collect all statuses when no filter is given
+    def execute(
+        self, status: TaskStatus | None = None, include_archived: bool = False
+    ) -> list[Task]:
+        statuses = list(TaskStatus) if status is None else [status]
         results: list[Task] = []
-        for s in TaskStatus:
+        for s in statuses:
             results.extend(self._repo.list_by_status(s))
-        results.sort(key=lambda t: t.created_at, reverse=True)
+        # Archived tasks are all done, so other filters never need the archive.
+        if include_archived and TaskStatus.DONE in statuses:
+            results.extend(self._repo.list_archived())
+        if len(statuses) > 1 or include_archived:
+            results.sort(key=lambda t: t.created_at, reverse=True)
         return results
+
+    def page(
+        self,
+        limit: int,
+        status: TaskStatus | None = None,
+        position: ListPosition | None = None,
+        include_archived: bool = False,
+    ) -> tuple[list[Task], ListPosition | None]:
+        """Up to ``limit`` tasks and the position of the next page (None at the end).
+
+        Without a status filter, pages run through todo, in_progress and done in
+        turn, newest first within each, rather than one global created_at order.
+        With ``include_archived``, archived tasks follow the live ones, most
+        recently completed month first.
+        """
+        statuses = list(TaskStatus) if status is None else [status]
+        if position is not None and position.status not in statuses:
+            raise ValueError(f"cursor is for status {position.status}, not {status}")
+        archived = include_archived and TaskStatus.DONE in statuses
+        if position is not None and position.bucket is not None:
+            if not archived:
+                raise ValueError("cursor is for archived tasks, pass include_archived")
+            return self._archive_page(limit, [], position.bucket, position.paging_state)
+        start = 0 if position is None else statuses.index(position.status)
+        paging_state = None if position is None else position.paging_state
+        tasks: list[Task] = []
+        for i, s in enumerate(statuses[start:], start):
+            page = self._repo.list_page(s, limit - len(tasks), paging_state)
+            tasks.extend(page.tasks)
+            if page.paging_state is not None:
+                return tasks, ListPosition(s, page.paging_state)
+            paging_state = None
+            if len(tasks) >= limit:
+                if i + 1 < len(statuses):
+                    return tasks, ListPosition(statuses[i + 1])
+                break
+        if not archived:
+            return tasks, None
+        return self._archive_page(limit, tasks, None, None)
+
+    def _archive_page(
+        self,
+        limit: int,
+        tasks: list[Task],
+        bucket: str | None,
+        paging_state: bytes | None,
+    ) -> tuple[list[Task], ListPosition | None]:
+        buckets = self._repo.archive_buckets()
+        # Resume at ``bucket``, or the next older one if it has emptied since.
+        start = 0 if bucket is None else next(
+            (i for i, b in enumerate(buckets) if b <= bucket), len(buckets)
+        )
+        if start < len(buckets) and buckets[start] != bucket:
+            paging_state = None
+        for b in buckets[start:]:
+            if len(tasks) >= limit:
+                return tasks, ListPosition(TaskStatus.DONE, bucket=b)
+            page = self._repo.list_archived_page(b, limit - len(tasks), paging_state)
+            tasks.extend(page.tasks)
+            if page.paging_state is not None:
+                return tasks, ListPosition(TaskStatus.DONE, page.paging_state, b)
+            paging_state = None
+        return tasks, None
+
+    def version(self) -> int:
+        """Stamp that changes whenever any list result may have changed."""
+        return self._repo.collection_version()
@@ -1,13 +1,15 @@
 from uuid import UUID
 
+from src.application.services.change_feed import ChangeFeed, ChangeKind
+from src.application.use_cases.get_task import TaskNotFoundError
 from src.domain.entities.task import TaskStatus
 from src.domain.repositories.task_repository import TaskRepository
-from src.application.use_cases.get_task import TaskNotFoundError
 
 
 class UpdateTaskStatus:
-    def __init__(self, repo: TaskRepository) -> None:
+    def __init__(self, repo: TaskRepository, feed: ChangeFeed | None = None) -> None:
         self._repo = repo
+        self._feed = feed
 
     def execute(self, task_id: UUID, new_status: TaskStatus) -> None:
         task = self._repo.get_by_id(task_id)
@@ -15,3 +17,5 @@ class UpdateTaskStatus:
             raise TaskNotFoundError(task_id)
         updated = task.with_status(new_status)
         self._repo.update(updated)
+        if self._feed is not None:
+            self._feed.publish(ChangeKind.STATUS_CHANGED, updated)
@@ -18,9 +18,14 @@ class Task:
     status: TaskStatus = TaskStatus.TODO
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    # Set once the task has been moved out of tasks_by_status into the archive.
+    archived_at: datetime | None = None
 
     def with_status(self, new_status: TaskStatus) -> "Task":
-        """Return a copy with updated status and updated_at timestamp."""
+        """Return a copy with updated status and updated_at timestamp.
+
+        Only done tasks live in the archive, so any other status un-archives it.
+        """
         return Task(
             id=self.id,
             title=self.title,
@@ -28,4 +33,11 @@ class Task:
             status=new_status,
             created_at=self.created_at,
             updated_at=datetime.now(timezone.utc),
+            archived_at=self.archived_at if new_status is TaskStatus.DONE else None,
         )
+
+
+@dataclass(frozen=True)
+class TaskPage:
+    tasks: list[Task]
+    paging_state: bytes | None = None
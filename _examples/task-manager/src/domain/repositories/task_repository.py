@@ -1,7 +1,9 @@
+from collections.abc import Sequence
+from datetime import datetime
 from typing import Protocol
 from uuid import UUID
 
-from src.domain.entities.task import Task, TaskStatus
+from src.domain.entities.task import Task, TaskPage, TaskStatus
 
 
 class TaskRepository(Protocol):
@@ -9,8 +11,26 @@ class TaskRepository(Protocol):
 
     def get_by_id(self, task_id: UUID) -> Task | None: ...
 
+    def get_many(self, task_ids: Sequence[UUID]) -> dict[UUID, Task]: ...
+
     def list_by_status(self, status: TaskStatus) -> list[Task]: ...
 
+    def list_page(
+        self, status: TaskStatus, limit: int, paging_state: bytes | None = None
+    ) -> TaskPage: ...
+
+    def list_archived(self) -> list[Task]: ...
+
+    def archive_buckets(self) -> list[str]: ...
+
+    def list_archived_page(
+        self, bucket: str, limit: int, paging_state: bytes | None = None
+    ) -> TaskPage: ...
+
+    def archive_done(self, created_before: datetime) -> int: ...
+
+    def collection_version(self) -> int: ...
+
     def update(self, task: Task) -> None: ...
 
     def delete(self, task_id: UUID) -> None: ...
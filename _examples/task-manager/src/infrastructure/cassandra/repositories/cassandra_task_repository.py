@@ -1,13 +1,24 @@
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import replace
+from datetime import datetime, timezone
+from itertools import islice
 from uuid import UUID
 
 from cassandra.cluster import Session
+from cassandra.concurrent import execute_concurrent, execute_concurrent_with_args
 
-from src.domain.entities.task import Task, TaskStatus
+from src.domain.entities.task import Task, TaskPage, TaskStatus
+
+# Every write to tasks, tasks_by_status or tasks_archive bumps this counter row.
+_VERSION_SCOPE = "tasks"
+# tasks_archive_buckets holds a handful of rows per year, so one partition is plenty.
+_BUCKET_SHARD = 0
 
 
 class CassandraTaskRepository:
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: Session, concurrency: int = 64) -> None:
         self._session = session
+        self._concurrency = concurrency
         self._insert_task = session.prepare(
             "INSERT INTO tasks (id, title, description, status, created_at, updated_at) "
             "VALUES (?, ?, ?, ?, ?, ?)"
@@ -17,19 +28,55 @@ class CassandraTaskRepository:
             "VALUES (?, ?, ?, ?)"
         )
         self._select_by_id = session.prepare(
-            "SELECT id, title, description, status, created_at, updated_at "
+            "SELECT id, title, description, status, created_at, updated_at, archived_at "
             "FROM tasks WHERE id = ?"
         )
         self._select_by_status = session.prepare(
             "SELECT status, created_at, id, title "
             "FROM tasks_by_status WHERE status = ?"
         )
-        self._delete_task = session.prepare("DELETE FROM tasks WHERE id = ?")
+        # Writes to tasks are conditional on the state they were read in, like
+        # the archive claim below: plain writes would not be ordered against it.
+        self._delete_task = session.prepare(
+            "DELETE FROM tasks WHERE id = ? IF updated_at = ? AND archived_at = ?"
+        )
         self._delete_by_status = session.prepare(
             "DELETE FROM tasks_by_status WHERE status = ? AND created_at = ? AND id = ?"
         )
         self._update_task = session.prepare(
-            "UPDATE tasks SET status = ?, updated_at = ? WHERE id = ?"
+            "UPDATE tasks SET status = ?, updated_at = ?, archived_at = ? WHERE id = ? "
+            "IF updated_at = ? AND archived_at = ?"
+        )
+        self._select_done_before = session.prepare(
+            "SELECT id FROM tasks_by_status WHERE status = ? AND created_at < ?"
+        )
+        # Conditional, so a task reopened since the index scan is left alone.
+        self._archive_if_done = session.prepare(
+            "UPDATE tasks SET archived_at = ? WHERE id = ? IF status = ? AND updated_at = ?"
+        )
+        self._insert_archived = session.prepare(
+            "INSERT INTO tasks_archive "
+            "(bucket, updated_at, id, title, description, status, created_at, archived_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+        )
+        self._insert_bucket = session.prepare(
+            "INSERT INTO tasks_archive_buckets (shard, bucket) VALUES (?, ?)"
+        )
+        self._select_buckets = session.prepare(
+            "SELECT bucket FROM tasks_archive_buckets WHERE shard = ?"
+        )
+        self._select_archived = session.prepare(
+            "SELECT id, title, description, status, created_at, updated_at, archived_at "
+            "FROM tasks_archive WHERE bucket = ?"
+        )
+        self._delete_archived = session.prepare(
+            "DELETE FROM tasks_archive WHERE bucket = ? AND updated_at = ? AND id = ?"
+        )
+        self._bump_version = session.prepare(
+            "UPDATE tasks_version SET version = version + 1 WHERE scope = ?"
+        )
+        self._select_version = session.prepare(
+            "SELECT version FROM tasks_version WHERE scope = ?"
         )
 
     def insert(self, task: Task) -> None:
@@ -42,34 +89,122 @@ class CassandraTaskRepository:
             self._insert_by_status,
             (task.status.value, task.created_at, task.id, task.title),
         )
+        self._bump()
 
     def get_by_id(self, task_id: UUID) -> Task | None:
         row = self._session.execute(self._select_by_id, (task_id,)).one()
-        if row is None:
-            return None
-        return Task(
-            id=row.id,
-            title=row.title,
-            description=row.description,
-            status=TaskStatus(row.status),
-            created_at=row.created_at,
-            updated_at=row.updated_at,
+        return None if row is None else _to_task(row)
+
+    def get_many(self, task_ids: Sequence[UUID]) -> dict[UUID, Task]:
+        """Look up each id concurrently; ids that do not exist are left out."""
+        results = execute_concurrent_with_args(
+            self._session,
+            self._select_by_id,
+            [(task_id,) for task_id in task_ids],
+            concurrency=self._concurrency,
         )
+        found: dict[UUID, Task] = {}
+        for result in results:
+            row = result.result_or_exc.one()
+            if row is not None:
+                found[row.id] = _to_task(row)
+        return found
 
     def list_by_status(self, status: TaskStatus) -> list[Task]:
-        rows = self._session.execute(self._select_by_status, (status.value,))
-        tasks: list[Task] = []
-        for row in rows:
-            # Fetch full data from main table
-            full = self.get_by_id(row.id)
-            if full is not None:
-                tasks.append(full)
-        return tasks
+        ids = [row.id for row in self._session.execute(self._select_by_status, (status.value,))]
+        # Fetch full data from main table, keeping the index order
+        found = self.get_many(ids)
+        return [found[task_id] for task_id in ids if task_id in found]
+
+    def list_page(
+        self, status: TaskStatus, limit: int, paging_state: bytes | None = None
+    ) -> TaskPage:
+        bound = self._select_by_status.bind((status.value,))
+        bound.fetch_size = limit
+        result = self._session.execute(bound, paging_state=paging_state)
+        ids = [row.id for row in result.current_rows]
+        found = self.get_many(ids)
+        return TaskPage(
+            tasks=[found[task_id] for task_id in ids if task_id in found],
+            paging_state=result.paging_state,
+        )
+
+    def list_archived(self) -> list[Task]:
+        """Every archived task, most recently completed first."""
+        results = execute_concurrent_with_args(
+            self._session,
+            self._select_archived,
+            [(bucket,) for bucket in self.archive_buckets()],
+            concurrency=self._concurrency,
+        )
+        return [_to_task(row) for result in results for row in result.result_or_exc]
+
+    def archive_buckets(self) -> list[str]:
+        """Months present in tasks_archive, newest first."""
+        rows = self._session.execute(self._select_buckets, (_BUCKET_SHARD,))
+        return [row.bucket for row in rows]
+
+    def list_archived_page(
+        self, bucket: str, limit: int, paging_state: bytes | None = None
+    ) -> TaskPage:
+        bound = self._select_archived.bind((bucket,))
+        bound.fetch_size = limit
+        result = self._session.execute(bound, paging_state=paging_state)
+        return TaskPage(
+            tasks=[_to_task(row) for row in result.current_rows],
+            paging_state=result.paging_state,
+        )
+
+    def archive_done(self, created_before: datetime) -> int:
+        """Move done tasks created before ``created_before`` to tasks_archive.
+
+        Each task is claimed with a conditional ``archived_at`` write on the
+        status and ``updated_at`` it was read with, and only claimed tasks are
+        copied and dropped from tasks_by_status, so a task reopened while the
+        scan runs stays where it is. Returns how many tasks were archived.
+        """
+        done = TaskStatus.DONE.value
+        rows = self._session.execute(self._select_done_before, (done, created_before))
+        archived_at = datetime.now(timezone.utc)
+        archived = 0
+        for ids in _chunks((row.id for row in rows), self._concurrency * 8):
+            # Stale index rows (status already moved on) are skipped.
+            tasks = [t for t in self.get_many(ids).values() if t.status is TaskStatus.DONE]
+            claims = execute_concurrent_with_args(
+                self._session,
+                self._archive_if_done,
+                [(archived_at, t.id, done, t.updated_at) for t in tasks],
+                concurrency=self._concurrency,
+                raise_on_first_error=True,
+            )
+            writes = []
+            for task, claim in zip(tasks, claims, strict=True):
+                if claim.result_or_exc.was_applied:
+                    writes.extend(self._archive_writes(replace(task, archived_at=archived_at)))
+                    writes.append((self._delete_by_status, (done, task.created_at, task.id)))
+                    archived += 1
+            execute_concurrent(
+                self._session, writes, concurrency=self._concurrency, raise_on_first_error=True
+            )
+        self._bump()
+        return archived
+
+    def collection_version(self) -> int:
+        """Changes whenever any task is written; 0 before the first write."""
+        row = self._session.execute(self._select_version, (_VERSION_SCOPE,)).one()
+        return 0 if row is None or row.version is None else row.version
 
     def update(self, task: Task) -> None:
-        # Retrieve old record to remove old status index entry
-        old = self._session.execute(self._select_by_id, (task.id,)).one()
-        if old and old.status != task.status.value:
+        old = self._write_if_unchanged(
+            self._update_task,
+            task.id,
+            lambda old: (task.status.value, task.updated_at, _next_archived_at(old, task), task.id),
+        )
+        if old is None:
+            return
+        if old.archived_at is not None:
+            self._update_archived(old, task)
+        elif old.status != task.status.value:
             self._session.execute(
                 self._delete_by_status,
                 (old.status, old.created_at, task.id),
@@ -78,16 +213,102 @@ class CassandraTaskRepository:
                 self._insert_by_status,
                 (task.status.value, task.created_at, task.id, task.title),
             )
-        self._session.execute(
-            self._update_task,
-            (task.status.value, task.updated_at, task.id),
-        )
+        self._bump()
 
     def delete(self, task_id: UUID) -> None:
-        old = self._session.execute(self._select_by_id, (task_id,)).one()
-        if old:
+        old = self._write_if_unchanged(self._delete_task, task_id, lambda old: (task_id,))
+        if old is None:
+            return
+        if old.archived_at is not None:
+            self._session.execute(
+                self._delete_archived, (_bucket(old.updated_at), old.updated_at, task_id)
+            )
+        else:
             self._session.execute(
                 self._delete_by_status,
                 (old.status, old.created_at, task_id),
             )
-        self._session.execute(self._delete_task, (task_id,))
+        self._bump()
+
+    def _write_if_unchanged(
+        self, statement, task_id: UUID, params: Callable[..., tuple]
+    ):
+        """Run ``statement`` on the tasks row only if it is unchanged since read.
+
+        ``params(old)`` gives the leading parameters; the row's ``updated_at``
+        and ``archived_at`` as read are appended as the condition. Retries on
+        a fresh read until the write applies, so the index and archive rows
+        touched afterwards match the row that was replaced. Returns that row,
+        or None if the task does not exist.
+        """
+        while True:
+            old = self._session.execute(self._select_by_id, (task_id,)).one()
+            if old is None:
+                return None
+            result = self._session.execute(
+                statement, (*params(old), old.updated_at, old.archived_at)
+            )
+            if result.was_applied:
+                return old
+
+    def _bump(self) -> None:
+        # After the data write, so a reader that saw the old version re-fetches.
+        # Counter updates cannot share a batch with regular writes, so this is
+        # one extra round trip per write.
+        self._session.execute(self._bump_version, (_VERSION_SCOPE,))
+
+    def _update_archived(self, old, task: Task) -> None:
+        # The archive is keyed by updated_at, so the old row always goes.
+        self._session.execute(
+            self._delete_archived, (_bucket(old.updated_at), old.updated_at, task.id)
+        )
+        if task.status is TaskStatus.DONE:
+            archived = replace(task, archived_at=task.archived_at or old.archived_at)
+            for statement, params in self._archive_writes(archived):
+                self._session.execute(statement, params)
+            return
+        self._session.execute(
+            self._insert_by_status,
+            (task.status.value, task.created_at, task.id, task.title),
+        )
+
+    def _archive_writes(self, task: Task) -> list[tuple]:
+        bucket = _bucket(task.updated_at)
+        return [
+            (
+                self._insert_archived,
+                (bucket, task.updated_at, task.id, task.title, task.description,
+                 task.status.value, task.created_at, task.archived_at),
+            ),
+            (self._insert_bucket, (_BUCKET_SHARD, bucket)),
+        ]
+
+
+def _next_archived_at(old, task: Task) -> datetime | None:
+    """An archived task stays archived only while it is still done."""
+    if old.archived_at is None or task.status is not TaskStatus.DONE:
+        return None
+    return task.archived_at or old.archived_at
+
+
+def _bucket(updated_at: datetime) -> str:
+    """Archive partition of a task: the UTC month it was last updated in."""
+    return updated_at.strftime("%Y-%m")
+
+
+def _chunks(items: Iterable[UUID], size: int) -> Iterator[list[UUID]]:
+    it = iter(items)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+def _to_task(row) -> Task:
+    return Task(
+        id=row.id,
+        title=row.title,
+        description=row.description,
+        status=TaskStatus(row.status),
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+        archived_at=row.archived_at,
+    )
@@ -0,0 +1,175 @@
+"""Request coalescing: concurrent identical reads share one Cassandra query.
+
+While a ``get_by_id`` or ``list_by_status`` is in flight, other threads asking
+for the same task or status wait for it instead of querying again. Nothing is
+cached: once the query returns, the next caller queries again.
+
+Writes forget the in-flight reads they affect, so a read started after a
+write was acknowledged never joins one that may predate it.
+"""
+
+import threading
+from collections.abc import Callable, Hashable, Sequence
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from src.domain.entities.task import Task, TaskPage, TaskStatus
+from src.domain.repositories.task_repository import TaskRepository
+from src.infrastructure.metrics import MetricsRegistry
+
+
+class _Call:
+    __slots__ = ("done", "error", "result")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Runs at most one ``fn`` per key at a time; concurrent callers share its outcome."""
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self._waiting = 0
+
+    @property
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+    @property
+    def waiting(self) -> int:
+        """Callers currently blocked on another caller's ``fn``."""
+        with self._lock:
+            return self._waiting
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> tuple[Any, bool]:
+        """``(result, shared)``; ``shared`` is True when another caller's ``fn`` ran.
+
+        Exceptions raised by ``fn`` propagate to every caller sharing it.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self._waiting += 1
+        if not leader:
+            call.done.wait()
+            with self._lock:
+                self._waiting -= 1
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def forget(self, matches: Callable[[Hashable], bool]) -> None:
+        """Stop new callers from joining in-flight calls whose key ``matches``."""
+        with self._lock:
+            for key in [k for k in self._calls if matches(k)]:
+                del self._calls[key]
+
+
+class SingleFlightTaskRepository:
+    """``TaskRepository`` that coalesces ``get_by_id`` and ``list_by_status``."""
+
+    def __init__(self, inner: TaskRepository, metrics: MetricsRegistry) -> None:
+        self._inner = inner
+        self.flights = SingleFlight()
+        self._queries = metrics.counter(
+            "task_single_flight_queries_total", "Reads that queried Cassandra"
+        )
+        self._shared = metrics.counter(
+            "task_single_flight_shared_total", "Reads served by a shared query"
+        )
+        metrics.gauge(
+            "task_single_flight_coalescing_ratio",
+            "Share of reads that needed no query of their own",
+            self.coalescing_ratio,
+        )
+        metrics.gauge(
+            "task_single_flight_in_flight",
+            "Distinct reads in flight",
+            lambda: self.flights.in_flight,
+        )
+
+    def coalescing_ratio(self) -> float:
+        total = self._queries.value + self._shared.value
+        return self._shared.value / total if total else 0.0
+
+    def insert(self, task: Task) -> None:
+        self._inner.insert(task)
+        self._forget(task.id, {task.status})
+
+    def get_by_id(self, task_id: UUID) -> Task | None:
+        return self._do(("id", task_id), lambda: self._inner.get_by_id(task_id))
+
+    def get_many(self, task_ids: Sequence[UUID]) -> dict[UUID, Task]:
+        return self._inner.get_many(task_ids)
+
+    def list_by_status(self, status: TaskStatus) -> list[Task]:
+        tasks = self._do(("status", status), lambda: self._inner.list_by_status(status))
+        # Every caller gets its own list; tasks themselves are immutable.
+        return list(tasks)
+
+    def list_page(
+        self, status: TaskStatus, limit: int, paging_state: bytes | None = None
+    ) -> TaskPage:
+        return self._inner.list_page(status, limit, paging_state)
+
+    def list_archived(self) -> list[Task]:
+        return self._inner.list_archived()
+
+    def archive_buckets(self) -> list[str]:
+        return self._inner.archive_buckets()
+
+    def list_archived_page(
+        self, bucket: str, limit: int, paging_state: bytes | None = None
+    ) -> TaskPage:
+        return self._inner.list_archived_page(bucket, limit, paging_state)
+
+    def archive_done(self, created_before: datetime) -> int:
+        archived = self._inner.archive_done(created_before)
+        # Which tasks moved is not reported, so every in-flight task read goes too.
+        self.flights.forget(lambda key: key[0] == "id" or key == ("status", TaskStatus.DONE))
+        return archived
+
+    def collection_version(self) -> int:
+        return self._inner.collection_version()
+
+    def update(self, task: Task) -> None:
+        self._inner.update(task)
+        self._forget_with_every_status(task.id)
+
+    def delete(self, task_id: UUID) -> None:
+        self._inner.delete(task_id)
+        self._forget_with_every_status(task_id)
+
+    def _do(self, key: tuple, fn: Callable[[], Any]) -> Any:
+        result, shared = self.flights.do(key, fn)
+        (self._shared if shared else self._queries).inc()
+        return result
+
+    def _forget(self, task_id: UUID, statuses: set[TaskStatus]) -> None:
+        keys = {("id", task_id)} | {("status", s) for s in statuses}
+        self.flights.forget(keys.__contains__)
+
+    def _forget_with_every_status(self, task_id: UUID) -> None:
+        # The status a task had before the write is unknown here, and looking
+        # it up would cost a read per write, so every status list goes.
+        self.flights.forget(lambda key: key == ("id", task_id) or key[0] == "status")
@@ -0,0 +1,56 @@
+"""Minimal in-process metrics, rendered in the Prometheus text format.
+
+Components register their instruments once at construction time and update
+them on the hot path without allocating; ``GET /metrics`` renders a snapshot.
+"""
+
+import threading
+from collections.abc import Callable
+
+
+class Counter:
+    def __init__(self) -> None:
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+
+class MetricsRegistry:
+    """Named instruments; registering an existing name returns the same instrument."""
+
+    def __init__(self) -> None:
+        self._counters: dict[str, tuple[str, Counter]] = {}
+        self._gauges: dict[str, tuple[str, Callable[[], float]]] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help_text: str) -> Counter:
+        with self._lock:
+            return self._counters.setdefault(name, (help_text, Counter()))[1]
+
+    def gauge(self, name: str, help_text: str, read: Callable[[], float]) -> None:
+        """Register a gauge sampled by calling ``read`` at render time."""
+        with self._lock:
+            self._gauges[name] = (help_text, read)
+
+    def value(self, name: str) -> float:
+        """Current value of a counter or gauge (handy for tests and debugging)."""
+        if name in self._counters:
+            return self._counters[name][1].value
+        return float(self._gauges[name][1]())
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for name, (help_text, counter) in sorted(self._counters.items()):
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+            lines.append(f"{name} {counter.value:g}")
+        for name, (help_text, read) in sorted(self._gauges.items()):
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge"]
+            lines.append(f"{name} {float(read()):g}")
+        return "\n".join(lines) + "\n"
@@ -4,6 +4,6 @@ import pytest
 def pytest_collection_modifyitems(config, items):
     for item in items:
         if "functional" in str(item.fspath):
-            item.add_marker(pytest.marker.functional)
+            item.add_marker(pytest.mark.functional)
         elif "unit" in str(item.fspath):
-            item.add_marker(pytest.marker.unit)
+            item.add_marker(pytest.mark.unit)
@@ -0,0 +1,84 @@
+"""
+FR-004: Archive Done Tasks
+==========================
+Priority: P3
+
+As an operator, I want old done tasks moved out of the status index
+so that listing tasks stays fast as history grows.
+
+Acceptance:
+  - GIVEN a done task that has been archived
+    WHEN GET /api/v1/tasks?status=done
+    THEN it is not listed
+  - GIVEN the same task
+    WHEN GET /api/v1/tasks?status=done&include_archived=true
+    THEN it is listed with archived_at set
+  - GIVEN an archived task
+    WHEN GET /api/v1/tasks?status=done&include_archived=true&limit=1, following next_cursor
+    THEN it is listed after the live done tasks
+  - GIVEN an archived task
+    WHEN PATCH /api/v1/tasks/{id} with status todo
+    THEN it is listed under todo again and no longer archived
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from src.api.dependencies import get_task_repo
+from src.api.main import app
+from src.application.use_cases.archive_done_tasks import ArchiveDoneTasks
+
+
+@pytest.fixture
+def client():
+    transport = ASGITransport(app=app)
+    return AsyncClient(transport=transport, base_url="http://test")
+
+
+def _ids(resp) -> list[str]:
+    return [t["id"] for t in resp.json()["tasks"]]
+
+
+@pytest.mark.functional
+async def test_archive_done_tasks(client):
+    async with client as c:
+        task_id = (await c.post("/api/v1/tasks", json={"title": "Archive me"})).json()["id"]
+        await c.patch(f"/api/v1/tasks/{task_id}", json={"status": "done"})
+
+        tomorrow = datetime.now(timezone.utc) + timedelta(days=1)
+        assert ArchiveDoneTasks(get_task_repo()).execute(timedelta(days=1), now=tomorrow) >= 1
+
+        hot = await c.get("/api/v1/tasks", params={"status": "done"})
+        assert task_id not in _ids(hot)
+        everything = await c.get(
+            "/api/v1/tasks", params={"status": "done", "include_archived": "true"}
+        )
+        archived = {t["id"]: t for t in everything.json()["tasks"]}
+        assert archived[task_id]["archived_at"] is not None
+
+        await c.patch(f"/api/v1/tasks/{task_id}", json={"status": "todo"})
+        reopened = (await c.get(f"/api/v1/tasks/{task_id}")).json()
+        todo = await c.get("/api/v1/tasks", params={"status": "todo"})
+    assert reopened["archived_at"] is None
+    assert task_id in _ids(todo)
+
+
+@pytest.mark.functional
+async def test_paged_listing_continues_into_the_archive(client):
+    async with client as c:
+        task_id = (await c.post("/api/v1/tasks", json={"title": "Page me"})).json()["id"]
+        await c.patch(f"/api/v1/tasks/{task_id}", json={"status": "done"})
+        tomorrow = datetime.now(timezone.utc) + timedelta(days=1)
+        ArchiveDoneTasks(get_task_repo()).execute(timedelta(days=1), now=tomorrow)
+
+        seen: list[str] = []
+        params = {"status": "done", "include_archived": "true", "limit": "50"}
+        while True:
+            body = (await c.get("/api/v1/tasks", params=params)).json()
+            seen.extend(t["id"] for t in body["tasks"])
+            if body["next_cursor"] is None:
+                break
+            params["cursor"] = body["next_cursor"]
+    assert task_id in seen
@@ -0,0 +1,62 @@
+"""
+FR-005: Conditional Requests
+============================
+Priority: P3
+
+As a client that re-fetches tasks often, I want ETags on reads
+so that unchanged data costs a header check instead of a full body.
+
+Acceptance:
+  - GIVEN an existing task and the ETag from GET /api/v1/tasks/{id}
+    WHEN the same GET is sent with If-None-Match set to that ETag
+    THEN 304 Not Modified is returned without a body
+  - GIVEN the ETag from GET /api/v1/tasks
+    WHEN any task is written and the list is requested with that ETag
+    THEN 200 is returned with a new ETag
+"""
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from src.api.main import app
+
+
+@pytest.fixture
+def client():
+    transport = ASGITransport(app=app)
+    return AsyncClient(transport=transport, base_url="http://test")
+
+
+@pytest.mark.functional
+async def test_conditional_get_task(client):
+    async with client as c:
+        task_id = (await c.post("/api/v1/tasks", json={"title": "Cache me"})).json()["id"]
+        first = await c.get(f"/api/v1/tasks/{task_id}")
+        again = await c.get(
+            f"/api/v1/tasks/{task_id}", headers={"If-None-Match": first.headers["ETag"]}
+        )
+    assert again.status_code == 304
+    assert again.content == b""
+
+
+@pytest.mark.functional
+async def test_list_etag_changes_after_write(client):
+    async with client as c:
+        etag = (await c.get("/api/v1/tasks")).headers["ETag"]
+        unchanged = await c.get("/api/v1/tasks", headers={"If-None-Match": etag})
+        await c.post("/api/v1/tasks", json={"title": "Bump"})
+        changed = await c.get("/api/v1/tasks", headers={"If-None-Match": etag})
+    assert unchanged.status_code == 304
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+@pytest.mark.functional
+async def test_list_etag_differs_per_query(client):
+    async with client as c:
+        todo = (await c.get("/api/v1/tasks", params={"status": "todo"})).headers["ETag"]
+        done = await c.get(
+            "/api/v1/tasks", params={"status": "done"}, headers={"If-None-Match": todo}
+        )
+    assert done.status_code == 200
+    assert done.headers["ETag"] != todo
@@ -0,0 +1,44 @@
+"""
+FR-003: Get Many Tasks by ID
+=============================
+Priority: P2
+
+As a UI, I want to resolve a list of task ids in one request
+so that I do not have to issue one GET per id.
+
+Acceptance:
+  - GIVEN two existing tasks and one unknown id
+    WHEN GET /api/v1/tasks?ids=<a>,<unknown>,<b>
+    THEN both tasks are returned in request order and the unknown id is listed as missing
+  - GIVEN the same ids in a JSON body
+    WHEN POST /api/v1/tasks:get
+    THEN the same result is returned
+"""
+
+from uuid import uuid4
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from src.api.main import app
+
+
+@pytest.fixture
+def client():
+    transport = ASGITransport(app=app)
+    return AsyncClient(transport=transport, base_url="http://test")
+
+
+@pytest.mark.functional
+async def test_get_many_tasks(client):
+    unknown = str(uuid4())
+    async with client as c:
+        a = (await c.post("/api/v1/tasks", json={"title": "Many A"})).json()["id"]
+        b = (await c.post("/api/v1/tasks", json={"title": "Many B"})).json()["id"]
+        by_query = await c.get("/api/v1/tasks", params={"ids": f"{a},{unknown},{b}"})
+        by_body = await c.post("/api/v1/tasks:get", json={"ids": [a, unknown, b]})
+    for resp in (by_query, by_body):
+        assert resp.status_code == 200
+        data = resp.json()
+        assert [t["id"] for t in data["tasks"]] == [a, b]
+        assert data["missing"] == [unknown]
@@ -0,0 +1,46 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.application.use_cases.archive_done_tasks import ArchiveDoneTasks
+from src.application.use_cases.list_tasks import ListTasks
+from src.domain.entities.task import Task, TaskStatus
+
+NOW = datetime(2025, 6, 30, tzinfo=timezone.utc)
+
+
+class TestArchiveDoneTasks:
+    def test_archives_tasks_created_before_cutoff(self):
+        repo = MagicMock()
+        repo.archive_done.return_value = 3
+        assert ArchiveDoneTasks(repo).execute(timedelta(days=30), now=NOW) == 3
+        repo.archive_done.assert_called_once_with(NOW - timedelta(days=30))
+
+    def test_rejects_non_positive_age(self):
+        with pytest.raises(ValueError):
+            ArchiveDoneTasks(MagicMock()).execute(timedelta(0))
+
+
+class TestListTasksIncludeArchived:
+    def test_archived_tasks_merged_newest_first(self):
+        old = Task(title="Old", status=TaskStatus.DONE, created_at=NOW - timedelta(days=90),
+                   archived_at=NOW)
+        new = Task(title="New", status=TaskStatus.DONE, created_at=NOW)
+        repo = MagicMock()
+        repo.list_by_status.return_value = [new]
+        repo.list_archived.return_value = [old]
+
+        assert ListTasks(repo).execute(TaskStatus.DONE, include_archived=True) == [new, old]
+
+    def test_archive_skipped_by_default_and_for_other_statuses(self):
+        repo = MagicMock()
+        repo.list_by_status.return_value = []
+        ListTasks(repo).execute(TaskStatus.DONE)
+        ListTasks(repo).execute(TaskStatus.TODO, include_archived=True)
+        repo.list_archived.assert_not_called()
+
+    def test_reopening_clears_archived_at(self):
+        task = Task(title="Done", status=TaskStatus.DONE, archived_at=NOW)
+        assert task.with_status(TaskStatus.DONE).archived_at == NOW
+        assert task.with_status(TaskStatus.TODO).archived_at is None
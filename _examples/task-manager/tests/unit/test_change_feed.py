@@ -0,0 +1,64 @@
+import asyncio
+from unittest.mock import MagicMock
+
+from src.application.services.change_feed import ChangeFeed, ChangeKind
+from src.application.use_cases.create_task import CreateTask
+from src.application.use_cases.delete_task import DeleteTask
+from src.application.use_cases.update_task_status import UpdateTaskStatus
+from src.domain.entities.task import Task, TaskStatus
+
+
+class TestChangeFeed:
+    async def test_delivers_changes_published_from_other_threads(self):
+        feed = ChangeFeed()
+        subscription = feed.subscribe()
+        task = Task(title="Live")
+        await asyncio.to_thread(feed.publish, ChangeKind.CREATED, task)
+
+        change = await subscription.next(timeout=1)
+        assert (change.kind, change.task_id, change.seq) == (ChangeKind.CREATED, task.id, 1)
+
+    async def test_resume_replays_only_changes_after_last_event_id(self):
+        feed = ChangeFeed()
+        first = feed.publish(ChangeKind.CREATED, Task(title="A"))
+        second = feed.publish(ChangeKind.CREATED, Task(title="B"))
+
+        subscription = feed.subscribe(feed.event_id(first))
+        assert subscription.backlog == [second]
+        assert not subscription.gap
+
+    async def test_resume_point_outside_history_is_a_gap(self):
+        feed = ChangeFeed(history=2)
+        first = feed.publish(ChangeKind.CREATED, Task(title="A"))
+        for title in "BCD":
+            feed.publish(ChangeKind.CREATED, Task(title=title))
+
+        assert feed.subscribe(feed.event_id(first)).gap
+        assert feed.subscribe("other-process-1").gap
+        assert feed.subscribe(f"{feed.epoch}-99").gap
+
+    async def test_slow_consumer_is_dropped(self):
+        feed = ChangeFeed(queue_size=2)
+        subscription = feed.subscribe()
+        for title in "ABC":
+            feed.publish(ChangeKind.CREATED, Task(title=title))
+
+        assert await subscription.next(timeout=1) is None
+        assert feed.dropped == 1
+        assert feed.subscriber_count == 0
+
+
+class TestUseCasesPublish:
+    def test_create_update_delete_publish_changes(self):
+        feed = MagicMock()
+        task = Task(title="Feed me")
+        repo = MagicMock()
+        repo.get_by_id.return_value = task
+
+        CreateTask(repo, feed).execute(task)
+        UpdateTaskStatus(repo, feed).execute(task.id, TaskStatus.DONE)
+        DeleteTask(repo, feed).execute(task.id)
+
+        kinds = [c.args[0] for c in feed.publish.call_args_list]
+        assert kinds == [ChangeKind.CREATED, ChangeKind.STATUS_CHANGED, ChangeKind.DELETED]
+        assert feed.publish.call_args_list[1].args[1].status == TaskStatus.DONE
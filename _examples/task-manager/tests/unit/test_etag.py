@@ -0,0 +1,47 @@
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from src.api.etag import etag_matches, list_etag, task_etag
+from src.application.use_cases.list_tasks import ListTasks
+from src.domain.entities.task import Task, TaskStatus
+
+UPDATED = datetime(2025, 6, 30, 12, 0, 0, 123000, tzinfo=timezone.utc)
+
+
+class TestTaskEtag:
+    def test_naive_and_aware_utc_give_the_same_tag(self):
+        task = Task(title="T", updated_at=UPDATED)
+        stored = Task(title="T", id=task.id, updated_at=UPDATED.replace(tzinfo=None))
+        assert task_etag(task) == task_etag(stored)
+
+    def test_changes_with_updated_at_and_archival(self):
+        task = Task(title="T", updated_at=UPDATED)
+        assert task_etag(task) != task_etag(task.with_status(TaskStatus.DONE))
+        archived = Task(title="T", id=task.id, updated_at=UPDATED, archived_at=UPDATED)
+        assert task_etag(task) != task_etag(archived)
+
+
+class TestEtagMatches:
+    def test_matches_any_listed_tag_with_weak_comparison(self):
+        etag = list_etag(7, {})
+        assert etag_matches(f'"other", {etag.removeprefix("W/")}', etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches(None, etag)
+        assert not etag_matches(list_etag(8, {}), etag)
+
+
+class TestListEtag:
+    def test_differs_per_query_but_not_per_key_order(self):
+        todo = {"status": TaskStatus.TODO, "limit": 50}
+        assert list_etag(7, todo) == list_etag(7, {"limit": 50, "status": TaskStatus.TODO})
+        assert list_etag(7, todo) != list_etag(7, {**todo, "status": TaskStatus.DONE})
+        assert list_etag(7, todo) != list_etag(7, {**todo, "cursor": "dG9kbzo="})
+        assert list_etag(7, {"ids": [uuid4()]}) != list_etag(7, {"ids": [uuid4()]})
+
+
+class TestListTasksVersion:
+    def test_version_comes_from_repository(self):
+        repo = MagicMock()
+        repo.collection_version.return_value = 42
+        assert ListTasks(repo).version() == 42
@@ -0,0 +1,24 @@
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from src.application.use_cases.get_tasks import GetTasks
+from src.domain.entities.task import Task
+
+
+class TestGetTasks:
+    def test_returns_tasks_in_request_order_and_reports_missing(self):
+        first, second = Task(title="First"), Task(title="Second")
+        unknown = uuid4()
+        repo = MagicMock()
+        repo.get_many.return_value = {first.id: first, second.id: second}
+
+        tasks, missing = GetTasks(repo).execute([second.id, unknown, first.id, second.id])
+
+        repo.get_many.assert_called_once_with([second.id, unknown, first.id])
+        assert tasks == [second, first]
+        assert missing == [unknown]
+
+    def test_empty_request_skips_repository(self):
+        repo = MagicMock()
+        assert GetTasks(repo).execute([]) == ([], [])
+        repo.get_many.assert_not_called()
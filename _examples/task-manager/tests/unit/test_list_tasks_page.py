@@ -0,0 +1,82 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.application.use_cases.list_tasks import ListPosition, ListTasks
+from src.domain.entities.task import Task, TaskPage, TaskStatus
+
+
+class TestListTasksPage:
+    def test_continues_partition_from_paging_state(self):
+        task = Task(title="A")
+        repo = MagicMock()
+        repo.list_page.return_value = TaskPage(tasks=[task], paging_state=b"more")
+
+        tasks, position = ListTasks(repo).page(1, TaskStatus.TODO)
+
+        assert tasks == [task]
+        assert position == ListPosition(TaskStatus.TODO, b"more")
+        repo.list_page.assert_called_once_with(TaskStatus.TODO, 1, None)
+
+    def test_fills_page_from_the_next_status(self):
+        todo, doing = Task(title="T"), Task(title="D", status=TaskStatus.IN_PROGRESS)
+        repo = MagicMock()
+        repo.list_page.side_effect = [TaskPage([todo]), TaskPage([doing])]
+
+        tasks, position = ListTasks(repo).page(2)
+
+        assert tasks == [todo, doing]
+        assert position == ListPosition(TaskStatus.DONE)
+        assert repo.list_page.call_args_list[1].args == (TaskStatus.IN_PROGRESS, 1, None)
+
+    def test_last_status_exhausted_ends_listing(self):
+        repo = MagicMock()
+        repo.list_page.return_value = TaskPage([])
+        position = ListPosition(TaskStatus.DONE, b"state")
+
+        assert ListTasks(repo).page(10, position=position) == ([], None)
+        repo.list_page.assert_called_once_with(TaskStatus.DONE, 10, b"state")
+
+    def test_rejects_cursor_for_another_status(self):
+        with pytest.raises(ValueError):
+            ListTasks(MagicMock()).page(10, TaskStatus.TODO, ListPosition(TaskStatus.DONE))
+
+
+class TestListTasksPageArchived:
+    def test_continues_into_archive_after_done(self):
+        done, archived = Task(title="D", status=TaskStatus.DONE), Task(title="A")
+        repo = MagicMock()
+        repo.list_page.return_value = TaskPage([done])
+        repo.archive_buckets.return_value = ["2025-06", "2025-05"]
+        repo.list_archived_page.return_value = TaskPage([archived], paging_state=b"more")
+
+        tasks, position = ListTasks(repo).page(2, TaskStatus.DONE, include_archived=True)
+
+        assert tasks == [done, archived]
+        assert position == ListPosition(TaskStatus.DONE, b"more", "2025-06")
+        repo.list_archived_page.assert_called_once_with("2025-06", 1, None)
+
+    def test_full_page_points_at_first_bucket(self):
+        repo = MagicMock()
+        repo.list_page.return_value = TaskPage([Task(title="D")])
+        repo.archive_buckets.return_value = ["2025-06"]
+
+        _, position = ListTasks(repo).page(1, TaskStatus.DONE, include_archived=True)
+
+        assert position == ListPosition(TaskStatus.DONE, bucket="2025-06")
+        repo.list_archived_page.assert_not_called()
+
+    def test_resumes_at_next_older_bucket_when_cursor_bucket_emptied(self):
+        repo = MagicMock()
+        repo.archive_buckets.return_value = ["2025-06", "2025-04"]
+        repo.list_archived_page.return_value = TaskPage([])
+        position = ListPosition(TaskStatus.DONE, b"state", "2025-05")
+
+        assert ListTasks(repo).page(5, position=position, include_archived=True) == ([], None)
+        repo.list_page.assert_not_called()
+        repo.list_archived_page.assert_called_once_with("2025-04", 5, None)
+
+    def test_rejects_archive_cursor_without_include_archived(self):
+        position = ListPosition(TaskStatus.DONE, bucket="2025-06")
+        with pytest.raises(ValueError):
+            ListTasks(MagicMock()).page(10, position=position)
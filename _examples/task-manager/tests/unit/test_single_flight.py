@@ -0,0 +1,102 @@
+import threading
+import time
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.domain.entities.task import Task, TaskStatus
+from src.infrastructure.decorators.single_flight import SingleFlightTaskRepository
+from src.infrastructure.metrics import MetricsRegistry
+
+
+def _start(fn, count: int) -> list[threading.Thread]:
+    threads = [threading.Thread(target=fn) for _ in range(count)]
+    for t in threads:
+        t.start()
+    return threads
+
+
+def _wait_for(predicate) -> None:
+    deadline = time.monotonic() + 2
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+class TestSingleFlightTaskRepository:
+    @pytest.fixture
+    def gate(self):
+        return threading.Event()
+
+    @pytest.fixture
+    def inner(self, gate):
+        task = Task(title="Hot")
+        mock = MagicMock()
+        mock.get_by_id.side_effect = lambda task_id: gate.wait(2) and task
+        mock.list_by_status.side_effect = lambda status: gate.wait(2) and [task]
+        return mock
+
+    def test_concurrent_get_by_id_shares_one_query(self, inner, gate):
+        metrics = MetricsRegistry()
+        repo = SingleFlightTaskRepository(inner, metrics)
+        task_id = Task(title="x").id
+        threads = _start(lambda: repo.get_by_id(task_id), 5)
+        _wait_for(lambda: repo.flights.waiting == 4)
+        gate.set()
+        for t in threads:
+            t.join()
+
+        assert inner.get_by_id.call_count == 1
+        assert repo.coalescing_ratio() == pytest.approx(0.8)
+        assert "task_single_flight_shared_total 4" in metrics.render()
+
+    def test_write_forgets_in_flight_status_lists(self, inner, gate):
+        metrics = MetricsRegistry()
+        repo = SingleFlightTaskRepository(inner, metrics)
+        threads = _start(lambda: repo.list_by_status(TaskStatus.TODO), 1)
+        _wait_for(lambda: repo.flights.in_flight == 1)
+
+        repo.insert(Task(title="New"))
+        threads += _start(lambda: repo.list_by_status(TaskStatus.TODO), 1)
+        gate.set()
+        for t in threads:
+            t.join()
+
+        assert inner.list_by_status.call_count == 2
+        assert metrics.value("task_single_flight_shared_total") == 0
+
+    def test_write_keeps_unaffected_status_lists_in_flight(self, inner, gate):
+        repo = SingleFlightTaskRepository(inner, MetricsRegistry())
+        threads = _start(lambda: repo.list_by_status(TaskStatus.DONE), 1)
+        _wait_for(lambda: repo.flights.in_flight == 1)
+
+        repo.insert(Task(title="New"))
+        assert repo.flights.in_flight == 1
+        repo.archive_done(datetime.now(timezone.utc))
+        assert repo.flights.in_flight == 0
+        gate.set()
+        for t in threads:
+            t.join()
+
+    def test_update_forgets_every_status_list_without_reading(self, inner, gate):
+        repo = SingleFlightTaskRepository(inner, MetricsRegistry())
+        threads = _start(lambda: repo.list_by_status(TaskStatus.TODO), 1)
+        threads += _start(lambda: repo.list_by_status(TaskStatus.IN_PROGRESS), 1)
+        threads += _start(lambda: repo.list_by_status(TaskStatus.DONE), 1)
+        _wait_for(lambda: repo.flights.in_flight == 3)
+
+        repo.update(Task(title="Hot").with_status(TaskStatus.DONE))
+
+        assert repo.flights.in_flight == 0
+        inner.get_by_id.assert_not_called()
+        gate.set()
+        for t in threads:
+            t.join()
+
+    def test_list_results_are_not_shared_objects(self, inner, gate):
+        gate.set()
+        repo = SingleFlightTaskRepository(inner, MetricsRegistry())
+        first = repo.list_by_status(TaskStatus.TODO)
+        first.clear()
+        assert repo.list_by_status(TaskStatus.TODO) != []
@@ -8,6 +8,9 @@ interactively. Responses are automatically chained: IDs returned from
 create/list operations are stored in a context ring so subsequent calls
 (get, update, delete) can reuse them with a single Enter press.
 
+All requests share one keep-alive connection pool, and task lists are
+browsed a page at a time (the next page is fetched in the background).
+
 Usage:
     # Start the API server first:
     uv run uvicorn src.api.main:app --port 8000
@@ -15,12 +18,16 @@ Usage:
     # Then in another terminal:
     uv run python tui.py
     uv run python tui.py --base-url http://localhost:8000  # (default)
+
+    # Or put load on the API instead (see loadgen.py for the options):
+    uv run python tui.py --load --workers 32 --rps 200 --duration 60
 """
 
 from __future__ import annotations
 
-import sys
+import argparse
 from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 
 import httpx
@@ -30,6 +37,8 @@ from rich.table import Table
 from rich.text import Text
 from rich.theme import Theme
 
+import loadgen
+
 # ---------------------------------------------------------------------------
 # Setup
 # ---------------------------------------------------------------------------
@@ -91,8 +100,26 @@ ctx = Context()
 # ---------------------------------------------------------------------------
 
 
+_http: httpx.Client | None = None
+
+
 def _client() -> httpx.Client:
-    return httpx.Client(base_url=BASE_URL, timeout=10.0)
+    """The session-wide client; its pool keeps connections open between actions."""
+    global _http
+    if _http is None:
+        _http = httpx.Client(
+            base_url=BASE_URL,
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=4, max_keepalive_connections=4),
+        )
+    return _http
+
+
+def _close_client() -> None:
+    global _http
+    if _http is not None:
+        _http.close()
+        _http = None
 
 
 def _display_task(task: dict, *, label: str = "Task") -> None:
@@ -187,8 +214,7 @@ def action_create() -> None:
     console.rule("[success]Create Task[/success]")
     title = _prompt("Title")
     description = _prompt("Description", required=False)
-    with _client() as c:
-        resp = c.post("/api/v1/tasks", json={"title": title, "description": description})
+    resp = _client().post("/api/v1/tasks", json={"title": title, "description": description})
     if resp.status_code == 201:
         data = resp.json()
         ctx.push(data["id"])
@@ -200,8 +226,7 @@ def action_create() -> None:
 def action_get() -> None:
     console.rule("[success]Get Task[/success]")
     task_id = _prompt_task_id()
-    with _client() as c:
-        resp = c.get(f"/api/v1/tasks/{task_id}")
+    resp = _client().get(f"/api/v1/tasks/{task_id}")
     if resp.status_code == 200:
         data = resp.json()
         ctx.push(data["id"])
@@ -210,40 +235,70 @@ def action_get() -> None:
         _display_error(resp)
 
 
-def action_list() -> None:
-    console.rule("[success]List Tasks[/success]")
-    console.print("  Filter by status? (leave blank for all)")
-    status_filter = _prompt("Status filter", required=False)
-    params = {}
-    if status_filter:
-        if status_filter.isdigit():
-            statuses = ["todo", "in_progress", "done"]
-            idx = int(status_filter) - 1
-            if 0 <= idx < 3:
-                status_filter = statuses[idx]
-        params["status"] = status_filter
+class TaskBrowser:
+    """Lazily paged view over ``GET /api/v1/tasks`` (``limit`` + ``cursor``).
 
-    with _client() as c:
-        resp = c.get("/api/v1/tasks", params=params)
-    if resp.status_code != 200:
-        _display_error(resp)
-        return
+    Pages are only requested as the user moves forward; while one page is on
+    screen the next one is fetched on a background thread, so "next" rarely
+    waits. Pages already seen are kept, so "prev" never hits the API.
+    """
 
-    data = resp.json()
-    tasks = data.get("tasks", [])
-    if not tasks:
-        console.print("  [muted]No tasks found.[/muted]")
-        return
+    def __init__(self, params: dict[str, str], page_size: int) -> None:
+        self._params = params
+        self._page_size = page_size
+        self._pages: list[list[dict]] = []
+        self._next_cursor: str | None = None
+        self._pending: Future | None = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+        self.exhausted = False
+
+    @property
+    def loaded(self) -> int:
+        return len(self._pages)
+
+    def page(self, index: int) -> list[dict] | None:
+        """Tasks on page ``index`` (0-based), or None past the last page."""
+        while len(self._pages) <= index and not self.exhausted:
+            self._load_next()
+        return self._pages[index] if index < len(self._pages) else None
+
+    def prefetch(self) -> None:
+        if self._pending is None and not self.exhausted:
+            self._pending = self._executor.submit(self._fetch, self._next_cursor)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _load_next(self) -> None:
+        pending, self._pending = self._pending, None
+        tasks, self._next_cursor = (
+            pending.result() if pending is not None else self._fetch(self._next_cursor)
+        )
+        # A cursor can point just past the last row; its page comes back empty.
+        if tasks or not self._pages:
+            self._pages.append(tasks)
+        self.exhausted = self._next_cursor is None or not tasks
+
+    def _fetch(self, cursor: str | None) -> tuple[list[dict], str | None]:
+        params = {**self._params, "limit": str(self._page_size)}
+        if cursor:
+            params["cursor"] = cursor
+        resp = _client().get("/api/v1/tasks", params=params)
+        resp.raise_for_status()
+        data = resp.json()
+        return data.get("tasks", []), data.get("next_cursor")
 
-    # Push all IDs into context ring
-    ctx.push_many([t["id"] for t in tasks])
 
-    table = Table(title=f"Tasks ({data['count']})", show_lines=True)
+def _render_page(tasks: list[dict], index: int, browser: TaskBrowser) -> None:
+    total = f"{browser.loaded}" if browser.exhausted else f"{browser.loaded}+"
+    # One line per row (no wrapping, no separators) so a page is one screenful;
+    # only the title column gives way on narrow terminals.
+    table = Table(title=f"Tasks — page {index + 1} of {total}", expand=True)
     table.add_column("#", style="menu.key", width=3)
-    table.add_column("ID", style="id", max_width=36)
-    table.add_column("Title")
-    table.add_column("Status")
-    table.add_column("Created")
+    table.add_column("ID", style="id", width=36)
+    table.add_column("Title", ratio=1, no_wrap=True, overflow="ellipsis")
+    table.add_column("Status", width=11)
+    table.add_column("Created", width=19)
 
     status_colors = {"todo": "yellow", "in_progress": "blue", "done": "green"}
     for i, t in enumerate(tasks, 1):
@@ -257,7 +312,61 @@ def action_list() -> None:
             t.get("created_at", "")[:19],
         )
     console.print(table)
-    console.print("  [info]All listed IDs are now in context for quick reuse.[/info]")
+
+
+def action_list() -> None:
+    console.rule("[success]List Tasks[/success]")
+    console.print("  Filter by status? (leave blank for all)")
+    status_filter = _prompt("Status filter", required=False)
+    params = {}
+    if status_filter:
+        if status_filter.isdigit():
+            statuses = ["todo", "in_progress", "done"]
+            idx = int(status_filter) - 1
+            if 0 <= idx < 3:
+                status_filter = statuses[idx]
+        params["status"] = status_filter
+
+    # One screenful per page: leave room for the title, header and prompt.
+    browser = TaskBrowser(params, page_size=max(5, console.size.height - 10))
+    try:
+        _browse(browser)
+    except httpx.HTTPStatusError as exc:
+        _display_error(exc.response)
+    finally:
+        browser.close()
+
+
+def _browse(browser: TaskBrowser) -> None:
+    index = 0
+    while True:
+        tasks = browser.page(index)
+        if not tasks:
+            console.print("  [muted]No tasks found.[/muted]")
+            return
+        browser.prefetch()
+        # Only the visible page goes into the context ring.
+        ctx.push_many([t["id"] for t in tasks])
+        _render_page(tasks, index, browser)
+
+        has_next = not (browser.exhausted and index + 1 >= browser.loaded)
+        keys = ["[menu.key]n[/menu.key]ext"] if has_next else []
+        if index > 0:
+            keys.append("[menu.key]p[/menu.key]rev")
+        keys.append("[menu.key]#[/menu.key] open task, Enter to go back")
+        console.print("  " + ", ".join(keys) + ": ", end="")
+        choice = input().strip().lower()
+        if choice == "n" and has_next:
+            if browser.page(index + 1):
+                index += 1
+        elif choice == "p" and index > 0:
+            index -= 1
+        elif choice.isdigit() and 1 <= int(choice) <= len(tasks):
+            task = tasks[int(choice) - 1]
+            ctx.push(task["id"])
+            _display_task(task)
+        elif not choice:
+            return
 
 
 def action_update() -> None:
@@ -266,16 +375,14 @@ def action_update() -> None:
 
     # Fetch current status to show as default
     current_status = None
-    with _client() as c:
-        resp = c.get(f"/api/v1/tasks/{task_id}")
+    resp = _client().get(f"/api/v1/tasks/{task_id}")
     if resp.status_code == 200:
         current_status = resp.json().get("status")
         console.print(f"  [muted]Current status: {current_status}[/muted]")
 
     new_status = _prompt_status("New status", default=current_status)
 
-    with _client() as c:
-        resp = c.patch(f"/api/v1/tasks/{task_id}", json={"status": new_status})
+    resp = _client().patch(f"/api/v1/tasks/{task_id}", json={"status": new_status})
     if resp.status_code == 204:
         console.print(f"  [success]Task updated to '{new_status}'.[/success]")
         ctx.push(task_id)
@@ -291,8 +398,7 @@ def action_delete() -> None:
     if confirm != "y":
         console.print("  [muted]Cancelled.[/muted]")
         return
-    with _client() as c:
-        resp = c.delete(f"/api/v1/tasks/{task_id}")
+    resp = _client().delete(f"/api/v1/tasks/{task_id}")
     if resp.status_code == 204:
         console.print("  [success]Task deleted.[/success]")
     else:
@@ -325,13 +431,17 @@ def show_menu() -> None:
 
 
 def main() -> None:
-    # Allow overriding base URL via CLI arg
     global BASE_URL
-    for arg in sys.argv[1:]:
-        if arg.startswith("--base-url="):
-            BASE_URL = arg.split("=", 1)[1]
-        elif arg == "--base-url" and sys.argv.index(arg) + 1 < len(sys.argv):
-            BASE_URL = sys.argv[sys.argv.index(arg) + 1]
+    parser = argparse.ArgumentParser(description="Task Manager TUI")
+    parser.add_argument("--base-url", default=BASE_URL, help=f"API root (default {BASE_URL})")
+    parser.add_argument("--load", action="store_true", help="run a load test instead of the TUI")
+    loadgen.add_arguments(parser)
+    args = parser.parse_args()
+    BASE_URL = args.base_url
+
+    if args.load:
+        loadgen.run_load(loadgen.config_from_args(args, BASE_URL), console)
+        return
 
     console.print(
         Panel(
@@ -342,6 +452,13 @@ def main() -> None:
         )
     )
 
+    try:
+        _menu_loop()
+    finally:
+        _close_client()
+
+
+def _menu_loop() -> None:
     while True:
         show_menu()
         console.print("  Choose: ", end="")